@@ -0,0 +1,28 @@
+-- 001_declarative_uniqueness.sql
+-- Mengganti trigger keunikan per baris dengan constraint deklaratif:
+--   * varian_produk_unique_check_insert/update -> UNIQUE(id_produk, nama_varian)
+--   * alamat_utama_check/alamat_utama_update_check -> kolom generated id_user_utama + UNIQUE
+--
+-- Catatan perilaku: trigger lama mencoba menurunkan alamat utama sebelumnya secara
+-- otomatis, tetapi UPDATE Alamat dari trigger di tabel Alamat sendiri ditolak server
+-- (error 1442). Dengan UNIQUE, alamat utama kedua ditolak; ganti alamat utama dengan
+-- menurunkan yang lama terlebih dahulu di transaksi yang sama:
+--   UPDATE Alamat SET is_utama = FALSE WHERE id_user = ? AND is_utama = TRUE;
+--   UPDATE Alamat SET is_utama = TRUE WHERE id_alamat = ?;
+--
+-- ALTER TABLE di bawah gagal jika data lama sudah melanggar aturan. Cari pelanggarnya dengan:
+--   SELECT id_produk, nama_varian, COUNT(*) FROM VarianProduk
+--   GROUP BY id_produk, nama_varian HAVING COUNT(*) > 1;
+--   SELECT id_user, SUM(is_utama) FROM Alamat GROUP BY id_user HAVING SUM(is_utama) > 1;
+
+DROP TRIGGER IF EXISTS varian_produk_unique_check_insert;
+DROP TRIGGER IF EXISTS varian_produk_unique_check_update;
+DROP TRIGGER IF EXISTS alamat_utama_check;
+DROP TRIGGER IF EXISTS alamat_utama_update_check;
+
+ALTER TABLE VarianProduk
+    ADD UNIQUE(id_produk, nama_varian);
+
+ALTER TABLE Alamat
+    ADD COLUMN id_user_utama INT AS (IF(is_utama, id_user, NULL)) STORED AFTER is_utama,
+    ADD UNIQUE(id_user_utama);
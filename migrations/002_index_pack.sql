@@ -0,0 +1,17 @@
+-- 002_index_pack.sql
+-- Index sekunder untuk jalur baca utama (lihat seeding/workload.sql dan seeding/workload.py):
+--   * riwayat order buyer: WHERE id_user = ? ORDER BY waktu_pemesanan DESC
+--   * order per status:    WHERE status_order = ? ORDER BY waktu_pemesanan DESC / GROUP BY status_order
+--   * rating produk:       AVG(nilai) WHERE id_produk = ? (covering, tanpa baca baris Ulasan)
+--
+-- InstTag(tag) tidak butuh index baru: PRIMARY KEY (tag, id_produk) sudah melayani
+-- lookup per tag, dan filter seller memakai UNIQUE(id_seller, nama) di Produk.
+--
+-- workload.py men-drop lalu membuat ulang index di file ini untuk membandingkan
+-- latensi tanpa dan dengan index pack; nama index harus tetap unik per tabel.
+
+CREATE INDEX idx_orders_user_waktu ON Orders (id_user, waktu_pemesanan);
+
+CREATE INDEX idx_orders_status_waktu ON Orders (status_order, waktu_pemesanan);
+
+CREATE INDEX idx_ulasan_produk_nilai ON Ulasan (id_produk, nilai);
@@ -136,7 +136,9 @@ CREATE TABLE IF NOT EXISTS VarianProduk (
         ON UPDATE CASCADE,
     
     CHECK (TRIM(nama_varian) <> ''),
-    CHECK (TRIM(sku) <> '')
+    CHECK (TRIM(sku) <> ''),
+    -- nama_varian harus unik untuk setiap produk
+    UNIQUE(id_produk, nama_varian)
 );
 
 CREATE TABLE IF NOT EXISTS Keranjang (
@@ -178,6 +180,9 @@ CREATE TABLE IF NOT EXISTS Alamat (
     kota VARCHAR(255) NOT NULL,
     jalan VARCHAR(255) NOT NULL,
     is_utama BOOLEAN NOT NULL DEFAULT FALSE,
+    -- Bernilai id_user hanya untuk alamat utama (NULL untuk yang lain), sehingga
+    -- UNIQUE di bawah menjamin paling banyak satu alamat utama per user
+    id_user_utama INT AS (IF(is_utama, id_user, NULL)) STORED,
 
     FOREIGN KEY (id_user) REFERENCES Buyer(id_user)
         ON DELETE CASCADE
@@ -185,29 +190,10 @@ CREATE TABLE IF NOT EXISTS Alamat (
     
     CHECK (TRIM(jalan) <> ''),
     CHECK (TRIM(kota) <> ''),
-    CHECK (TRIM(provinsi) <> '')
+    CHECK (TRIM(provinsi) <> ''),
+    UNIQUE(id_user_utama)
 );
 
-DELIMITER //
-CREATE TRIGGER alamat_utama_check 
-    BEFORE INSERT ON Alamat
-    FOR EACH ROW
-BEGIN
-    IF NEW.is_utama = TRUE THEN
-        UPDATE Alamat SET is_utama = FALSE WHERE id_user = NEW.id_user;
-    END IF;
-END//
-
-CREATE TRIGGER alamat_utama_update_check 
-    BEFORE UPDATE ON Alamat
-    FOR EACH ROW
-BEGIN
-    IF NEW.is_utama = TRUE AND OLD.is_utama = FALSE THEN
-        UPDATE Alamat SET is_utama = FALSE WHERE id_user = NEW.id_user AND id_alamat != NEW.id_alamat;
-    END IF;
-END//
-DELIMITER ;
-
 CREATE TABLE IF NOT EXISTS Orders (
     id_order INT PRIMARY KEY NOT NULL AUTO_INCREMENT,
     id_user INT NOT NULL,
@@ -368,41 +354,146 @@ END;
 
 DELIMITER ;
 
--- Trigger untuk validasi Varian Produk: nama_varian harus unik untuk setiap produk
+-- tabel ringkasan (dijaga trigger, bangun ulang penuh: seeder.py --rebuild-summaries)
+CREATE TABLE IF NOT EXISTS RingkasanRatingProduk (
+    id_produk INT PRIMARY KEY NOT NULL,
+    jumlah_ulasan INT NOT NULL DEFAULT 0,
+    total_nilai INT NOT NULL DEFAULT 0,
+
+    FOREIGN KEY (id_produk) REFERENCES Produk(id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS RingkasanPenjualanSeller (
+    id_seller INT NOT NULL,
+    tanggal DATE NOT NULL,
+    unit_terjual INT NOT NULL DEFAULT 0,
+    omzet BIGINT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (id_seller, tanggal),
+
+    FOREIGN KEY (id_seller) REFERENCES Seller(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
 DELIMITER //
+CREATE TRIGGER ulasan_ringkasan_insert
+AFTER INSERT ON Ulasan
+FOR EACH ROW
+BEGIN
+    INSERT INTO RingkasanRatingProduk (id_produk, jumlah_ulasan, total_nilai)
+    VALUES (NEW.id_produk, 1, NEW.nilai)
+    ON DUPLICATE KEY UPDATE
+        jumlah_ulasan = jumlah_ulasan + 1,
+        total_nilai = total_nilai + NEW.nilai;
+END//
+DELIMITER ;
 
-CREATE TRIGGER varian_produk_unique_check_insert
-BEFORE INSERT ON VarianProduk
+DELIMITER //
+CREATE TRIGGER ulasan_ringkasan_update
+AFTER UPDATE ON Ulasan
 FOR EACH ROW
 BEGIN
-    IF EXISTS (
-        SELECT 1 FROM VarianProduk 
-        WHERE id_produk = NEW.id_produk 
-        AND nama_varian = NEW.nama_varian 
-        AND sku != NEW.sku
-    ) THEN
-        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Nama varian harus unik untuk setiap produk';
-    END IF;
-END;
-//
+    UPDATE RingkasanRatingProduk
+    SET jumlah_ulasan = jumlah_ulasan - 1, total_nilai = total_nilai - OLD.nilai
+    WHERE id_produk = OLD.id_produk;
+
+    INSERT INTO RingkasanRatingProduk (id_produk, jumlah_ulasan, total_nilai)
+    VALUES (NEW.id_produk, 1, NEW.nilai)
+    ON DUPLICATE KEY UPDATE
+        jumlah_ulasan = jumlah_ulasan + 1,
+        total_nilai = total_nilai + NEW.nilai;
+END//
+DELIMITER ;
 
+DELIMITER //
+CREATE TRIGGER ulasan_ringkasan_delete
+AFTER DELETE ON Ulasan
+FOR EACH ROW
+BEGIN
+    UPDATE RingkasanRatingProduk
+    SET jumlah_ulasan = jumlah_ulasan - 1, total_nilai = total_nilai - OLD.nilai
+    WHERE id_produk = OLD.id_produk;
+END//
 DELIMITER ;
 
 DELIMITER //
+CREATE TRIGGER inst_produk_ringkasan_insert
+AFTER INSERT ON InstProduk
+FOR EACH ROW
+BEGIN
+    INSERT INTO RingkasanPenjualanSeller (id_seller, tanggal, unit_terjual, omzet)
+    SELECT p.id_seller, DATE(o.waktu_pemesanan), NEW.kuantitas, NEW.kuantitas * v.harga
+    FROM Orders o
+    JOIN Produk p ON p.id_produk = NEW.id_produk
+    JOIN VarianProduk v ON v.sku = NEW.sku AND v.id_produk = NEW.id_produk
+    WHERE o.id_order = NEW.id_order AND o.status_order <> 'dibatalkan'
+    ON DUPLICATE KEY UPDATE
+        unit_terjual = unit_terjual + VALUES(unit_terjual),
+        omzet = omzet + VALUES(omzet);
+END//
+DELIMITER ;
 
-CREATE TRIGGER varian_produk_unique_check_update
-BEFORE UPDATE ON VarianProduk
+DELIMITER //
+CREATE TRIGGER inst_produk_ringkasan_update
+AFTER UPDATE ON InstProduk
 FOR EACH ROW
 BEGIN
-    IF EXISTS (
-        SELECT 1 FROM VarianProduk 
-        WHERE id_produk = NEW.id_produk 
-        AND nama_varian = NEW.nama_varian 
-        AND sku != NEW.sku
-    ) THEN
-        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Nama varian harus unik untuk setiap produk';
-    END IF;
-END;
-//
+    UPDATE RingkasanPenjualanSeller r
+    JOIN Orders o ON o.id_order = OLD.id_order
+    JOIN Produk p ON p.id_produk = OLD.id_produk
+    JOIN VarianProduk v ON v.sku = OLD.sku AND v.id_produk = OLD.id_produk
+    SET r.unit_terjual = r.unit_terjual - OLD.kuantitas, r.omzet = r.omzet - OLD.kuantitas * v.harga
+    WHERE r.id_seller = p.id_seller AND r.tanggal = DATE(o.waktu_pemesanan)
+    AND o.status_order <> 'dibatalkan';
+
+    INSERT INTO RingkasanPenjualanSeller (id_seller, tanggal, unit_terjual, omzet)
+    SELECT p.id_seller, DATE(o.waktu_pemesanan), NEW.kuantitas, NEW.kuantitas * v.harga
+    FROM Orders o
+    JOIN Produk p ON p.id_produk = NEW.id_produk
+    JOIN VarianProduk v ON v.sku = NEW.sku AND v.id_produk = NEW.id_produk
+    WHERE o.id_order = NEW.id_order AND o.status_order <> 'dibatalkan'
+    ON DUPLICATE KEY UPDATE
+        unit_terjual = unit_terjual + VALUES(unit_terjual),
+        omzet = omzet + VALUES(omzet);
+END//
+DELIMITER ;
 
+DELIMITER //
+CREATE TRIGGER inst_produk_ringkasan_delete
+AFTER DELETE ON InstProduk
+FOR EACH ROW
+BEGIN
+    UPDATE RingkasanPenjualanSeller r
+    JOIN Orders o ON o.id_order = OLD.id_order
+    JOIN Produk p ON p.id_produk = OLD.id_produk
+    JOIN VarianProduk v ON v.sku = OLD.sku AND v.id_produk = OLD.id_produk
+    SET r.unit_terjual = r.unit_terjual - OLD.kuantitas, r.omzet = r.omzet - OLD.kuantitas * v.harga
+    WHERE r.id_seller = p.id_seller AND r.tanggal = DATE(o.waktu_pemesanan)
+    AND o.status_order <> 'dibatalkan';
+END//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER orders_ringkasan_dibatalkan
+AFTER UPDATE ON Orders
+FOR EACH ROW
+BEGIN
+    -- Berjalan setelah check_status_order_transition (BEFORE UPDATE) menerima transisinya
+    IF NEW.status_order = 'dibatalkan' AND OLD.status_order <> 'dibatalkan' THEN
+        UPDATE RingkasanPenjualanSeller r
+        JOIN (
+            SELECT p.id_seller, SUM(ip.kuantitas) AS unit, SUM(ip.kuantitas * v.harga) AS omzet
+            FROM InstProduk ip
+            JOIN Produk p ON p.id_produk = ip.id_produk
+            JOIN VarianProduk v ON v.sku = ip.sku AND v.id_produk = ip.id_produk
+            WHERE ip.id_order = NEW.id_order
+            GROUP BY p.id_seller
+        ) d ON d.id_seller = r.id_seller
+        SET r.unit_terjual = r.unit_terjual - d.unit, r.omzet = r.omzet - d.omzet
+        WHERE r.tanggal = DATE(OLD.waktu_pemesanan);
+    END IF;
+END//
 DELIMITER ;
\ No newline at end of file
@@ -0,0 +1,414 @@
+-- schema_sqlite.sql
+-- Terjemahan schema.sql (termasuk migrations/001-003) untuk backend SQLite
+-- (seeding/backends.py, --backend sqlite). Dibuat otomatis saat database SQLite
+-- masih kosong. MariaDB tetap target produksi; perbedaan terjemahan:
+--   * AUTO_INCREMENT -> INTEGER PRIMARY KEY AUTOINCREMENT (sqlite_sequence dipakai reserve_ids)
+--   * ENUM -> TEXT dengan CHECK (... IN (...))
+--   * REGEXP memakai fungsi Python yang didaftarkan backend
+--   * SIGNAL SQLSTATE '45000' -> RAISE(ABORT, ...), IF di trigger -> WHEN / CASE
+--   * ON DUPLICATE KEY UPDATE -> ON CONFLICT DO UPDATE, UPDATE ... JOIN -> UPDATE ... FROM
+--   * CURRENT_TIMESTAMP di SQLite adalah UTC
+-- Partisi (partitioning.py) dan index pack (002) tidak diterjemahkan.
+
+CREATE TABLE IF NOT EXISTS `User` (
+    id_user INTEGER PRIMARY KEY AUTOINCREMENT,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    password_hash VARCHAR(255) NOT NULL,
+    nama_panjang VARCHAR(255) NOT NULL,
+    tanggal_lahir DATE NOT NULL,
+    no_telp VARCHAR(20) NOT NULL,
+    foto_profil VARCHAR(255),
+    tipe TEXT DEFAULT 'Buyer' NOT NULL CHECK (tipe IN ('Buyer', 'Seller')),
+
+    CHECK (no_telp REGEXP '^[0-9]{8,15}$'),
+    CHECK (TRIM(nama_panjang) <> ''),
+    CHECK (email REGEXP '^[^@\s]+@[^@\s]+\.com$')
+);
+
+CREATE TRIGGER IF NOT EXISTS user_age_insert_check
+BEFORE INSERT ON `User`
+WHEN NEW.tanggal_lahir > DATE('now', '-17 years')
+BEGIN
+    SELECT RAISE(ABORT, 'Usia pengguna harus minimal 17 tahun.');
+END;
+
+CREATE TRIGGER IF NOT EXISTS user_age_update_check
+BEFORE UPDATE ON `User`
+WHEN NEW.tanggal_lahir > DATE('now', '-17 years')
+BEGIN
+    SELECT RAISE(ABORT, 'Usia pengguna harus minimal 17 tahun.');
+END;
+
+CREATE TABLE IF NOT EXISTS Pertemanan (
+    id_user INT NOT NULL,
+    id_user_teman INT NOT NULL,
+
+    PRIMARY KEY (id_user, id_user_teman),
+
+    FOREIGN KEY (id_user) REFERENCES `User`(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (id_user_teman) REFERENCES `User`(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+CREATE TRIGGER IF NOT EXISTS pertemanan_self_check_insert
+BEFORE INSERT ON Pertemanan
+WHEN NEW.id_user = NEW.id_user_teman
+BEGIN
+    SELECT RAISE(ABORT, 'User tidak dapat berteman dengan dirinya sendiri');
+END;
+
+CREATE TRIGGER IF NOT EXISTS pertemanan_self_check_update
+BEFORE UPDATE ON Pertemanan
+WHEN NEW.id_user = NEW.id_user_teman
+BEGIN
+    SELECT RAISE(ABORT, 'User tidak dapat berteman dengan dirinya sendiri');
+END;
+
+CREATE TABLE IF NOT EXISTS Seller (
+    id_user INT NOT NULL PRIMARY KEY,
+    ktp VARCHAR(255) NOT NULL,
+    foto_diri VARCHAR(255) NOT NULL,
+    is_verified BOOLEAN NOT NULL DEFAULT FALSE,
+
+    FOREIGN KEY (id_user) REFERENCES `User`(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+
+    CHECK (ktp <> foto_diri)
+);
+
+CREATE TRIGGER IF NOT EXISTS check_seller_verification_transition
+BEFORE UPDATE ON Seller
+WHEN OLD.is_verified = TRUE AND NEW.is_verified = FALSE
+BEGIN
+    SELECT RAISE(ABORT, 'Status seller tidak dapat berubah dari verified menjadi tidak verified');
+END;
+
+CREATE TRIGGER IF NOT EXISTS seller_verification_check
+BEFORE UPDATE ON Seller
+WHEN NEW.is_verified = TRUE AND (NEW.ktp IS NULL OR TRIM(NEW.ktp) = ''
+    OR NEW.foto_diri IS NULL OR TRIM(NEW.foto_diri) = '')
+BEGIN
+    SELECT RAISE(ABORT, 'Tidak bisa memverifikasi seller sebelum KTP dan foto diri diunggah.');
+END;
+
+CREATE TABLE IF NOT EXISTS Buyer (
+    id_user INT NOT NULL PRIMARY KEY,
+
+    FOREIGN KEY (id_user) REFERENCES `User`(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS Produk (
+    id_produk INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_seller INT NOT NULL,
+    nama VARCHAR(255) NOT NULL,
+    deskripsi TEXT,
+
+    FOREIGN KEY (id_seller) REFERENCES Seller(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+
+    CHECK (TRIM(nama) <> ''),
+    UNIQUE(id_seller, nama)
+);
+
+CREATE TABLE IF NOT EXISTS VarianProduk (
+    sku VARCHAR(255) NOT NULL,
+    id_produk INT NOT NULL,
+    nama_varian VARCHAR(255) NOT NULL,
+    harga INT NOT NULL CHECK (harga >= 0),
+    stok INT NOT NULL DEFAULT 0 CHECK (stok >= 0),
+
+    PRIMARY KEY (sku, id_produk),
+
+    FOREIGN KEY (id_produk) REFERENCES Produk(id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+
+    CHECK (TRIM(nama_varian) <> ''),
+    CHECK (TRIM(sku) <> ''),
+    UNIQUE(id_produk, nama_varian)
+);
+
+CREATE TABLE IF NOT EXISTS Keranjang (
+    id_keranjang INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_user INT NOT NULL,
+    id_produk INT NOT NULL,
+    sku VARCHAR(255) NOT NULL,
+    kuantitas INT NOT NULL DEFAULT 1,
+
+    FOREIGN KEY (id_user) REFERENCES Buyer(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (sku, id_produk) REFERENCES VarianProduk(sku, id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+
+    CHECK (kuantitas >= 1),
+    UNIQUE(id_user, id_produk, sku)
+);
+
+CREATE TABLE IF NOT EXISTS Wishlist (
+    id_user INT NOT NULL,
+    id_produk INT NOT NULL,
+
+    PRIMARY KEY(id_user, id_produk),
+
+    FOREIGN KEY (id_user) REFERENCES Buyer(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (id_produk) REFERENCES Produk(id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS Alamat (
+    id_alamat INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_user INT NOT NULL,
+    provinsi VARCHAR(255) NOT NULL,
+    kota VARCHAR(255) NOT NULL,
+    jalan VARCHAR(255) NOT NULL,
+    is_utama BOOLEAN NOT NULL DEFAULT FALSE,
+    -- Paling banyak satu alamat utama per user (sama dengan migrations/001)
+    id_user_utama INT GENERATED ALWAYS AS (CASE WHEN is_utama THEN id_user END) STORED,
+
+    FOREIGN KEY (id_user) REFERENCES Buyer(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+
+    CHECK (TRIM(jalan) <> ''),
+    CHECK (TRIM(kota) <> ''),
+    CHECK (TRIM(provinsi) <> ''),
+    UNIQUE(id_user_utama)
+);
+
+CREATE TABLE IF NOT EXISTS Orders (
+    id_order INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_user INT NOT NULL,
+    id_alamat INT NOT NULL,
+    status_order TEXT NOT NULL DEFAULT 'belum dibayar'
+        CHECK (status_order IN ('belum dibayar', 'disiapkan', 'dikirim', 'sampai', 'dibatalkan')),
+    metode_pembayaran VARCHAR(255) NOT NULL,
+    metode_pengiriman VARCHAR(255) NOT NULL,
+    waktu_pemesanan TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    catatan VARCHAR(255),
+
+    FOREIGN KEY (id_user) REFERENCES Buyer(id_user)
+        ON UPDATE CASCADE,
+    FOREIGN KEY (id_alamat) REFERENCES Alamat(id_alamat)
+        ON UPDATE CASCADE
+);
+
+CREATE TRIGGER IF NOT EXISTS check_status_order_transition
+BEFORE UPDATE OF status_order ON Orders
+BEGIN
+    SELECT CASE
+        WHEN OLD.status_order = 'belum dibayar' AND NEW.status_order NOT IN ('disiapkan', 'dibatalkan')
+            THEN RAISE(ABORT, 'Transisi dari "belum dibayar" hanya boleh ke "disiapkan" atau "dibatalkan"')
+        WHEN OLD.status_order = 'disiapkan' AND NEW.status_order NOT IN ('dikirim', 'dibatalkan')
+            THEN RAISE(ABORT, 'Transisi dari "disiapkan" hanya boleh ke "dikirim" atau "dibatalkan"')
+        WHEN OLD.status_order = 'dikirim' AND NEW.status_order NOT IN ('sampai', 'dibatalkan')
+            THEN RAISE(ABORT, 'Transisi dari "dikirim" hanya boleh ke "sampai" atau "dibatalkan"')
+        WHEN OLD.status_order = 'sampai' AND NEW.status_order <> 'sampai'
+            THEN RAISE(ABORT, 'Order yang sudah "sampai" tidak bisa diubah')
+        WHEN OLD.status_order = 'dibatalkan' AND NEW.status_order <> 'dibatalkan'
+            THEN RAISE(ABORT, 'Order yang "dibatalkan" tidak bisa diubah')
+    END;
+END;
+
+CREATE TABLE IF NOT EXISTS InstProduk (
+    id_order INT NOT NULL,
+    id_produk INT NOT NULL,
+    sku VARCHAR(255) NOT NULL,
+    kuantitas INT NOT NULL DEFAULT 1,
+
+    PRIMARY KEY(id_order, id_produk, sku),
+
+    FOREIGN KEY (id_order) REFERENCES Orders(id_order)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (sku, id_produk) REFERENCES VarianProduk(sku, id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS InstTag (
+    id_produk INT NOT NULL,
+    tag VARCHAR(255) NOT NULL,
+
+    PRIMARY KEY (tag, id_produk),
+
+    FOREIGN KEY (id_produk) REFERENCES Produk(id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+
+    CHECK (TRIM(tag) <> '')
+);
+
+CREATE TABLE IF NOT EXISTS InstGambar (
+    id_produk INT NOT NULL,
+    gambar VARCHAR(255) NOT NULL,
+
+    PRIMARY KEY (id_produk, gambar),
+
+    FOREIGN KEY (id_produk) REFERENCES Produk(id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+
+    CHECK (TRIM(gambar) <> '')
+);
+
+CREATE TABLE IF NOT EXISTS Ulasan (
+    id_ulasan INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_order INT NOT NULL,
+    id_produk INT NOT NULL,
+    nilai INT NOT NULL CHECK (nilai BETWEEN 1 AND 5),
+    komentar TEXT,
+
+    FOREIGN KEY (id_order) REFERENCES Orders(id_order)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (id_produk) REFERENCES Produk(id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+CREATE TRIGGER IF NOT EXISTS ulasan_validation
+BEFORE INSERT ON Ulasan
+WHEN NOT EXISTS (
+    SELECT 1 FROM InstProduk
+    WHERE id_order = NEW.id_order AND id_produk = NEW.id_produk
+)
+BEGIN
+    SELECT RAISE(ABORT, 'Ulasan hanya dapat dibuat untuk produk yang ada dalam order');
+END;
+
+-- tabel ringkasan (migrations/003_summary_tables.sql)
+CREATE TABLE IF NOT EXISTS RingkasanRatingProduk (
+    id_produk INT PRIMARY KEY NOT NULL,
+    jumlah_ulasan INT NOT NULL DEFAULT 0,
+    total_nilai INT NOT NULL DEFAULT 0,
+
+    FOREIGN KEY (id_produk) REFERENCES Produk(id_produk)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS RingkasanPenjualanSeller (
+    id_seller INT NOT NULL,
+    tanggal DATE NOT NULL,
+    unit_terjual INT NOT NULL DEFAULT 0,
+    omzet BIGINT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (id_seller, tanggal),
+
+    FOREIGN KEY (id_seller) REFERENCES Seller(id_user)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+CREATE TRIGGER IF NOT EXISTS ulasan_ringkasan_insert
+AFTER INSERT ON Ulasan
+BEGIN
+    INSERT INTO RingkasanRatingProduk (id_produk, jumlah_ulasan, total_nilai)
+    VALUES (NEW.id_produk, 1, NEW.nilai)
+    ON CONFLICT (id_produk) DO UPDATE SET
+        jumlah_ulasan = jumlah_ulasan + 1,
+        total_nilai = total_nilai + excluded.total_nilai;
+END;
+
+CREATE TRIGGER IF NOT EXISTS ulasan_ringkasan_update
+AFTER UPDATE ON Ulasan
+BEGIN
+    UPDATE RingkasanRatingProduk
+    SET jumlah_ulasan = jumlah_ulasan - 1, total_nilai = total_nilai - OLD.nilai
+    WHERE id_produk = OLD.id_produk;
+
+    INSERT INTO RingkasanRatingProduk (id_produk, jumlah_ulasan, total_nilai)
+    VALUES (NEW.id_produk, 1, NEW.nilai)
+    ON CONFLICT (id_produk) DO UPDATE SET
+        jumlah_ulasan = jumlah_ulasan + 1,
+        total_nilai = total_nilai + excluded.total_nilai;
+END;
+
+CREATE TRIGGER IF NOT EXISTS ulasan_ringkasan_delete
+AFTER DELETE ON Ulasan
+BEGIN
+    UPDATE RingkasanRatingProduk
+    SET jumlah_ulasan = jumlah_ulasan - 1, total_nilai = total_nilai - OLD.nilai
+    WHERE id_produk = OLD.id_produk;
+END;
+
+CREATE TRIGGER IF NOT EXISTS inst_produk_ringkasan_insert
+AFTER INSERT ON InstProduk
+BEGIN
+    INSERT INTO RingkasanPenjualanSeller (id_seller, tanggal, unit_terjual, omzet)
+    SELECT p.id_seller, DATE(o.waktu_pemesanan), NEW.kuantitas, NEW.kuantitas * v.harga
+    FROM Orders o
+    JOIN Produk p ON p.id_produk = NEW.id_produk
+    JOIN VarianProduk v ON v.sku = NEW.sku AND v.id_produk = NEW.id_produk
+    WHERE o.id_order = NEW.id_order AND o.status_order <> 'dibatalkan'
+    ON CONFLICT (id_seller, tanggal) DO UPDATE SET
+        unit_terjual = unit_terjual + excluded.unit_terjual,
+        omzet = omzet + excluded.omzet;
+END;
+
+CREATE TRIGGER IF NOT EXISTS inst_produk_ringkasan_update
+AFTER UPDATE ON InstProduk
+BEGIN
+    UPDATE RingkasanPenjualanSeller
+    SET unit_terjual = unit_terjual - OLD.kuantitas, omzet = omzet - OLD.kuantitas * v.harga
+    FROM Orders o, Produk p, VarianProduk v
+    WHERE o.id_order = OLD.id_order AND p.id_produk = OLD.id_produk
+    AND v.sku = OLD.sku AND v.id_produk = OLD.id_produk
+    AND RingkasanPenjualanSeller.id_seller = p.id_seller
+    AND RingkasanPenjualanSeller.tanggal = DATE(o.waktu_pemesanan)
+    AND o.status_order <> 'dibatalkan';
+
+    INSERT INTO RingkasanPenjualanSeller (id_seller, tanggal, unit_terjual, omzet)
+    SELECT p.id_seller, DATE(o.waktu_pemesanan), NEW.kuantitas, NEW.kuantitas * v.harga
+    FROM Orders o
+    JOIN Produk p ON p.id_produk = NEW.id_produk
+    JOIN VarianProduk v ON v.sku = NEW.sku AND v.id_produk = NEW.id_produk
+    WHERE o.id_order = NEW.id_order AND o.status_order <> 'dibatalkan'
+    ON CONFLICT (id_seller, tanggal) DO UPDATE SET
+        unit_terjual = unit_terjual + excluded.unit_terjual,
+        omzet = omzet + excluded.omzet;
+END;
+
+CREATE TRIGGER IF NOT EXISTS inst_produk_ringkasan_delete
+AFTER DELETE ON InstProduk
+BEGIN
+    UPDATE RingkasanPenjualanSeller
+    SET unit_terjual = unit_terjual - OLD.kuantitas, omzet = omzet - OLD.kuantitas * v.harga
+    FROM Orders o, Produk p, VarianProduk v
+    WHERE o.id_order = OLD.id_order AND p.id_produk = OLD.id_produk
+    AND v.sku = OLD.sku AND v.id_produk = OLD.id_produk
+    AND RingkasanPenjualanSeller.id_seller = p.id_seller
+    AND RingkasanPenjualanSeller.tanggal = DATE(o.waktu_pemesanan)
+    AND o.status_order <> 'dibatalkan';
+END;
+
+-- Berjalan setelah check_status_order_transition (BEFORE UPDATE) menerima transisinya
+CREATE TRIGGER IF NOT EXISTS orders_ringkasan_dibatalkan
+AFTER UPDATE OF status_order ON Orders
+WHEN NEW.status_order = 'dibatalkan' AND OLD.status_order <> 'dibatalkan'
+BEGIN
+    UPDATE RingkasanPenjualanSeller
+    SET unit_terjual = unit_terjual - d.unit, omzet = omzet - d.nilai
+    FROM (
+        SELECT p.id_seller, SUM(ip.kuantitas) AS unit, SUM(ip.kuantitas * v.harga) AS nilai
+        FROM InstProduk ip
+        JOIN Produk p ON p.id_produk = ip.id_produk
+        JOIN VarianProduk v ON v.sku = ip.sku AND v.id_produk = ip.id_produk
+        WHERE ip.id_order = NEW.id_order
+        GROUP BY p.id_seller
+    ) d
+    WHERE d.id_seller = RingkasanPenjualanSeller.id_seller
+    AND RingkasanPenjualanSeller.tanggal = DATE(OLD.waktu_pemesanan);
+END;
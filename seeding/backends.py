@@ -0,0 +1,338 @@
+import os
+import re
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+import mysql.connector
+from mysql.connector import Error
+from dotenv import load_dotenv
+
+# Backend penyimpanan yang dipakai seeder.create_connection(). MariaDB adalah target
+# produksi; SQLite menyimpan database di satu file (schema_sqlite.sql, dibuat otomatis)
+# untuk benchmark generator dan percobaan lokal tanpa server. Keduanya memberi
+# koneksi dengan API mysql.connector (cursor dengan placeholder %s, commit,
+# rollback, Error dengan errno MariaDB) sehingga fungsi seed_* dan writer tidak
+# perlu tahu backend mana yang aktif. Hal yang sintaksnya berbeda (pemesanan id,
+# UPDATE ... JOIN, metadata tabel) ada sebagai method backend.
+#
+# Backend aktif disimpan di modul ini, bukan di seeder, karena `python seeder.py`
+# menjalankan seeder sebagai __main__ dan modul lain memakai salinan seeder sendiri.
+
+load_dotenv()
+
+SCHEMA_SQLITE = Path(__file__).resolve().parent.parent / "schema_sqlite.sql"
+
+
+def konfigurasi_mariadb(database=None):
+    """Konfigurasi koneksi MariaDB dari environment (.env): DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME"""
+    return {
+        "host": os.getenv("DB_HOST", "localhost"),
+        "port": int(os.getenv("DB_PORT", "3306")),
+        "user": os.getenv("DB_USER", "root"),
+        "password": os.getenv("DB_PASSWORD", ""),
+        "database": database or os.getenv("DB_NAME", "bustbuy15"),  # Sesuai CREATE DATABASE di schema.sql
+    }
+
+
+class MariaDB:
+    """Backend MariaDB lewat mysql.connector"""
+
+    nama = "mariadb"
+
+    UPDATE_STOK = """UPDATE VarianProduk v
+        JOIN delta_stok d ON d.sku = v.sku AND d.id_produk = v.id_produk
+        SET v.stok = v.stok - d.jumlah"""
+
+    def __init__(self, config):
+        self.config = config
+
+    def __str__(self):
+        return f"MariaDB {self.config['user']}@{self.config['host']}:{self.config['port']}/{self.config['database']}"
+
+    def connect(self, allow_local_infile=False):
+        return mysql.connector.connect(
+            **self.config,
+            allow_local_infile = allow_local_infile  # Dibutuhkan untuk mode --bulk-load
+        )
+
+    def reserve_ids(self, connection, table, id_column, count):
+        """Nilai awal dibaca dari AUTO_INCREMENT atau MAX(id) di bawah LOCK TABLES, lalu
+        AUTO_INCREMENT dinaikkan melewati rentang tersebut agar insert lain tidak memakainya.
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"LOCK TABLES `{table}` WRITE")
+            try:
+                cursor.execute(
+                    """SELECT AUTO_INCREMENT FROM information_schema.TABLES
+                    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s""",
+                    (table,)
+                )
+                row = cursor.fetchone()
+                auto_increment = row[0] if row and row[0] else 1
+                cursor.execute(f"SELECT COALESCE(MAX({id_column}), 0) + 1 FROM `{table}`")
+                awal = max(auto_increment, cursor.fetchone()[0])
+                cursor.execute(f"ALTER TABLE `{table}` AUTO_INCREMENT = {awal + count}")
+            finally:
+                cursor.execute("UNLOCK TABLES")
+            return awal
+        finally:
+            cursor.close()
+
+    def kolom_ada(self, connection, table, kolom):
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                """SELECT COUNT(*) FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s""",
+                (table, kolom)
+            )
+            return bool(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+
+    def kolom(self, connection, table):
+        """Kolom tabel yang bisa diisi (tanpa kolom generated), urut sesuai definisi"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                """SELECT COLUMN_NAME FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND EXTRA NOT LIKE '%%GENERATED%%'
+                ORDER BY ORDINAL_POSITION""",
+                (table,)
+            )
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def jumlah_tabel(self, connection, tables):
+        """Banyak tabel dari tables yang ada di database aktif"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f"""SELECT COUNT(*) FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({", ".join(["%s"] * len(tables))})""",
+                tuple(tables)
+            )
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+
+# Kode error SQLite (extended) -> errno MariaDB yang sepadan, agar penanganan error
+# yang sudah ada (writers.ERRNO_BARIS, retry lock wait) berlaku sama
+ERRNO_SQLITE = {
+    1811: 1644,  # SQLITE_CONSTRAINT_TRIGGER: RAISE(ABORT) seperti SIGNAL SQLSTATE '45000'
+    2067: 1062,  # SQLITE_CONSTRAINT_UNIQUE
+    1555: 1062,  # SQLITE_CONSTRAINT_PRIMARYKEY
+    787: 1452,   # SQLITE_CONSTRAINT_FOREIGNKEY
+    275: 4025,   # SQLITE_CONSTRAINT_CHECK
+    1299: 1048,  # SQLITE_CONSTRAINT_NOTNULL
+    5: 1205,     # SQLITE_BUSY: sepadan lock wait timeout
+    6: 1205,     # SQLITE_LOCKED
+}
+
+_PLACEHOLDER = re.compile(r"%\((\w+)\)s|%s|%%")
+
+sqlite3.register_adapter(datetime, lambda waktu: waktu.isoformat(" "))
+sqlite3.register_adapter(date, lambda tanggal: tanggal.isoformat())
+
+
+def _regexp(pola, teks):
+    return teks is not None and re.search(pola, teks) is not None
+
+
+def _terjemahkan(query):
+    """Placeholder mysql.connector (%s, %(nama)s) ke gaya sqlite3, DROP TEMPORARY TABLE ke DROP TABLE"""
+    query = _PLACEHOLDER.sub(lambda m: f":{m.group(1)}" if m.group(1) else "?" if m.group(0) == "%s" else "%", query)
+    return query.replace("DROP TEMPORARY TABLE", "DROP TABLE")
+
+
+def _error(e):
+    """sqlite3.Error -> mysql.connector.Error; dicari kode extended lalu kode primernya"""
+    kode = getattr(e, "sqlite_errorcode", None) or 0
+    return Error(msg=str(e), errno=ERRNO_SQLITE.get(kode, ERRNO_SQLITE.get(kode & 0xFF)))
+
+
+class KursorSQLite:
+    """Cursor sqlite3 dengan API dan error mysql.connector"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, query, params=()):
+        try:
+            self._cursor.execute(_terjemahkan(query), params or ())
+        except sqlite3.Error as e:
+            raise _error(e) from e
+
+    def executemany(self, query, seq_params):
+        try:
+            self._cursor.executemany(_terjemahkan(query), seq_params)
+        except sqlite3.Error as e:
+            raise _error(e) from e
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size=1):
+        return self._cursor.fetchmany(size)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def close(self):
+        self._cursor.close()
+
+
+class KoneksiSQLite:
+    """Koneksi sqlite3 dengan API mysql.connector yang dipakai seeder"""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self, **kwargs):
+        return KursorSQLite(self._connection.cursor())
+
+    def commit(self):
+        try:
+            self._connection.commit()
+        except sqlite3.Error as e:
+            raise _error(e) from e
+
+    def rollback(self):
+        self._connection.rollback()
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        self._connection.close()
+
+
+class SQLite:
+    """Backend SQLite tertanam (satu file, tanpa server) untuk benchmark dan percobaan lokal
+
+    Mode muat (default) memakai journal WAL dan synchronous=OFF: commit tidak
+    menunggu fsync, sehingga data terakhir bisa hilang jika mesin mati, tapi tidak
+    merusak file. Foreign key selalu diperiksa seperti di MariaDB.
+    """
+
+    nama = "sqlite"
+
+    UPDATE_STOK = """UPDATE VarianProduk
+        SET stok = stok - d.jumlah
+        FROM delta_stok d
+        WHERE d.sku = VarianProduk.sku AND d.id_produk = VarianProduk.id_produk"""
+
+    def __init__(self, path, muat=True):
+        self.path = path
+        self.muat = muat
+
+    def __str__(self):
+        return f"SQLite {self.path}"
+
+    def connect(self, allow_local_infile=False):
+        try:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.create_function("REGEXP", 2, _regexp, deterministic=True)
+            for pragma in (
+                "foreign_keys = ON",
+                "journal_mode = WAL",
+                f"synchronous = {'OFF' if self.muat else 'NORMAL'}",
+                "temp_store = MEMORY",
+                "cache_size = -262144",  # 256 MiB
+            ):
+                connection.execute(f"PRAGMA {pragma}")
+            if connection.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'User'").fetchone()[0] == 0:
+                print(f"🔧 Membuat schema {SCHEMA_SQLITE.name} di {self.path}")
+                connection.executescript(SCHEMA_SQLITE.read_text(encoding="utf-8"))
+        except sqlite3.Error as e:
+            raise _error(e) from e
+        return KoneksiSQLite(connection)
+
+    def reserve_ids(self, connection, table, id_column, count):
+        """Nilai awal dari MAX(id) atau sqlite_sequence; sqlite_sequence dinaikkan melewati
+        rentang tersebut. Hanya satu penulis yang bisa memegang file SQLite, jadi tidak
+        perlu LOCK TABLES.
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"SELECT COALESCE(MAX({id_column}), 0) + 1 FROM `{table}`")
+            awal = cursor.fetchone()[0]
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = %s", (table,))
+            row = cursor.fetchone()
+            if row:
+                awal = max(awal, row[0] + 1)
+                cursor.execute("UPDATE sqlite_sequence SET seq = %s WHERE name = %s", (awal + count - 1, table))
+            else:
+                cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (%s, %s)", (table, awal + count - 1))
+            connection.commit()
+            return awal
+        finally:
+            cursor.close()
+
+    def kolom_ada(self, connection, table, kolom):
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT COUNT(*) FROM pragma_table_info(%s) WHERE name = %s", (table, kolom))
+            return bool(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+
+    def kolom(self, connection, table):
+        """Kolom tabel yang bisa diisi (tanpa kolom generated), urut sesuai definisi"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT name FROM pragma_table_xinfo(%s) WHERE hidden = 0 ORDER BY cid", (table,))
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def jumlah_tabel(self, connection, tables):
+        """Banyak tabel dari tables yang ada di database"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f"""SELECT COUNT(*) FROM sqlite_master
+                WHERE type = 'table' AND name IN ({", ".join(["%s"] * len(tables))})""",
+                tuple(tables)
+            )
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+
+BACKEND = ("mariadb", "sqlite")
+
+_aktif = None
+
+
+def pilih(nama=None, sqlite_path=None, database=None):
+    """Mengatur backend aktif; nilai yang tidak diberikan dibaca dari DB_BACKEND, SQLITE_PATH dan DB_NAME"""
+    global _aktif
+    nama = nama or os.getenv("DB_BACKEND", "mariadb")
+    if nama == "sqlite":
+        _aktif = SQLite(sqlite_path or os.getenv("SQLITE_PATH", "bustbuy.db"))
+    elif nama == "mariadb":
+        _aktif = MariaDB(konfigurasi_mariadb(database))
+    else:
+        raise ValueError(f"Backend tidak dikenal: {nama} (pilihan: {', '.join(BACKEND)})")
+    return _aktif
+
+
+def aktif():
+    """Backend aktif; tanpa pilih() dipilih dari environment"""
+    return _aktif or pilih()
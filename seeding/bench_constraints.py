@@ -0,0 +1,237 @@
+import argparse
+import time
+
+from mysql.connector import Error
+
+from seeder import BATCH_SIZE, create_connection
+from writers import chunked, insert_query
+
+# Micro-benchmark throughput INSERT VarianProduk dan Alamat dengan aturan keunikan
+# lama (trigger, sebelum migrations/001) dan baru (UNIQUE + kolom generated).
+# Setiap varian dijalankan di tabel scratch bench_* tanpa foreign key (index yang
+# biasanya dibuat FK tetap ada) agar yang diukur hanya biaya aturan keunikannya.
+# Tabel scratch dibuat ulang setiap run dan di-drop di akhir.
+#
+# Trigger alamat lama aslinya menurunkan alamat utama sebelumnya dengan UPDATE ke
+# tabel yang sama, yang selalu ditolak server (error 1442). Biaya aturan lama
+# diukur dengan trigger pemeriksaan setara (COUNT alamat utama user lalu SIGNAL);
+# penolakan trigger asli dilaporkan terpisah sebagai catatan.
+
+VARIAN_COLUMNS = ("sku", "id_produk", "nama_varian", "harga", "stok")
+ALAMAT_COLUMNS = ("id_user", "provinsi", "kota", "jalan", "is_utama")
+
+SKEMA = {
+    "varian_sebelum": [
+        """CREATE TABLE bench_varian_sebelum (
+            sku VARCHAR(255) NOT NULL,
+            id_produk INT NOT NULL,
+            nama_varian VARCHAR(255) NOT NULL,
+            harga INT NOT NULL,
+            stok INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (sku, id_produk),
+            KEY (id_produk)
+        )""",
+        """CREATE TRIGGER bench_varian_sebelum_check
+        BEFORE INSERT ON bench_varian_sebelum
+        FOR EACH ROW
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM bench_varian_sebelum
+                WHERE id_produk = NEW.id_produk
+                AND nama_varian = NEW.nama_varian
+                AND sku != NEW.sku
+            ) THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Nama varian harus unik untuk setiap produk';
+            END IF;
+        END""",
+    ],
+    "varian_sesudah": [
+        """CREATE TABLE bench_varian_sesudah (
+            sku VARCHAR(255) NOT NULL,
+            id_produk INT NOT NULL,
+            nama_varian VARCHAR(255) NOT NULL,
+            harga INT NOT NULL,
+            stok INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (sku, id_produk),
+            KEY (id_produk),
+            UNIQUE (id_produk, nama_varian)
+        )""",
+    ],
+    "alamat_sebelum": [
+        """CREATE TABLE bench_alamat_sebelum (
+            id_alamat INT PRIMARY KEY NOT NULL AUTO_INCREMENT,
+            id_user INT NOT NULL,
+            provinsi VARCHAR(255) NOT NULL,
+            kota VARCHAR(255) NOT NULL,
+            jalan VARCHAR(255) NOT NULL,
+            is_utama BOOLEAN NOT NULL DEFAULT FALSE,
+            KEY (id_user)
+        )""",
+        """CREATE TRIGGER bench_alamat_sebelum_check
+        BEFORE INSERT ON bench_alamat_sebelum
+        FOR EACH ROW
+        BEGIN
+            IF NEW.is_utama = TRUE AND (
+                SELECT COUNT(*) FROM bench_alamat_sebelum
+                WHERE id_user = NEW.id_user AND is_utama = TRUE
+            ) > 0 THEN
+                SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'User sudah memiliki alamat utama';
+            END IF;
+        END""",
+    ],
+    "alamat_sesudah": [
+        """CREATE TABLE bench_alamat_sesudah (
+            id_alamat INT PRIMARY KEY NOT NULL AUTO_INCREMENT,
+            id_user INT NOT NULL,
+            provinsi VARCHAR(255) NOT NULL,
+            kota VARCHAR(255) NOT NULL,
+            jalan VARCHAR(255) NOT NULL,
+            is_utama BOOLEAN NOT NULL DEFAULT FALSE,
+            id_user_utama INT AS (IF(is_utama, id_user, NULL)) STORED,
+            KEY (id_user),
+            UNIQUE (id_user_utama)
+        )""",
+    ],
+    # Trigger lama apa adanya, hanya untuk catatan error 1442 (bukan hasil benchmark)
+    "alamat_asli": [
+        """CREATE TABLE bench_alamat_asli (
+            id_alamat INT PRIMARY KEY NOT NULL AUTO_INCREMENT,
+            id_user INT NOT NULL,
+            provinsi VARCHAR(255) NOT NULL,
+            kota VARCHAR(255) NOT NULL,
+            jalan VARCHAR(255) NOT NULL,
+            is_utama BOOLEAN NOT NULL DEFAULT FALSE,
+            KEY (id_user)
+        )""",
+        """CREATE TRIGGER bench_alamat_asli_check
+        BEFORE INSERT ON bench_alamat_asli
+        FOR EACH ROW
+        BEGIN
+            IF NEW.is_utama = TRUE THEN
+                UPDATE bench_alamat_asli SET is_utama = FALSE WHERE id_user = NEW.id_user;
+            END IF;
+        END""",
+    ],
+}
+
+
+def generate_varian(jumlah_produk, varian_per_produk=3):
+    """Baris VarianProduk dengan nama varian unik per produk"""
+    for id_produk in range(1, jumlah_produk + 1):
+        for j in range(varian_per_produk):
+            yield (f"PRD-{id_produk:04d}-V{j + 1}", id_produk, f"Varian {j + 1}", 10000 * (j + 1), 10)
+
+
+def generate_alamat(jumlah_user, alamat_per_user=3, utama=False):
+    """Baris Alamat: satu alamat utama per user jika utama=True, selain itu alamat non-utama"""
+    for id_user in range(1, jumlah_user + 1):
+        for j in range(1 if utama else alamat_per_user - 1):
+            yield (id_user, "Jawa Barat", "Bandung", f"Jl. Bench No. {j + 1}", utama)
+
+
+def siapkan(connection, nama):
+    """Membuat ulang tabel scratch (dan triggernya) untuk satu varian skema"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"DROP TABLE IF EXISTS bench_{nama}")
+        for statement in SKEMA[nama]:
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+def hapus(connection):
+    """Menghapus semua tabel scratch benchmark"""
+    cursor = connection.cursor()
+    try:
+        for nama in SKEMA:
+            cursor.execute(f"DROP TABLE IF EXISTS bench_{nama}")
+    finally:
+        cursor.close()
+
+
+def ukur(connection, table, columns, rows, batch_size):
+    """Insert baris per batch, mengembalikan (diterima, ditolak, detik, error pertama)"""
+    query = insert_query(table, columns)
+    cursor = connection.cursor()
+    diterima = ditolak = 0
+    error_pertama = None
+    detik = 0.0
+    try:
+        for batch in chunked(rows, batch_size):
+            mulai = time.perf_counter()
+            try:
+                cursor.executemany(query, batch)
+                connection.commit()
+                diterima += len(batch)
+            except Error as e:
+                connection.rollback()
+                ditolak += len(batch)
+                error_pertama = error_pertama or str(e)
+            detik += time.perf_counter() - mulai
+    finally:
+        cursor.close()
+    return diterima, ditolak, detik, error_pertama
+
+
+def laporan(label, hasil):
+    diterima, ditolak, detik, error_pertama = hasil
+    kecepatan = diterima / detik if detik and diterima else 0
+    print(f"📊 {label}: {diterima} baris dalam {detik:.2f}s ({kecepatan:,.0f} baris/detik)")
+    if ditolak:
+        print(f"   ❌ {ditolak} baris ditolak: {error_pertama}")
+
+
+def cek_trigger_asli(connection):
+    """Mencoba satu alamat utama pada trigger alamat lama asli dan mencetak hasilnya sebagai catatan"""
+    siapkan(connection, "alamat_asli")
+    cursor = connection.cursor()
+    try:
+        cursor.execute(insert_query("bench_alamat_asli", ALAMAT_COLUMNS),
+                       (1, "Jawa Barat", "Bandung", "Jl. Bench No. 1", True))
+        connection.commit()
+        print("📝 Catatan: trigger alamat lama asli menerima alamat utama")
+    except Error as e:
+        connection.rollback()
+        print(f"⚠ Catatan: trigger alamat lama asli ditolak server untuk setiap alamat utama ({e}); "
+              f"angka 'Alamat sebelum' di atas memakai trigger pemeriksaan setara")
+    finally:
+        cursor.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark insert trigger keunikan vs constraint deklaratif")
+    parser.add_argument("--rows", type=int, default=30000,
+                        help="Jumlah produk dan jumlah user (x3 varian / alamat)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    connection = create_connection()
+    if connection is None:
+        return
+    try:
+        for versi in ("sebelum", "sesudah"):
+            siapkan(connection, f"varian_{versi}")
+            laporan(f"VarianProduk {versi}",
+                    ukur(connection, f"bench_varian_{versi}", VARIAN_COLUMNS,
+                         generate_varian(args.rows), args.batch_size))
+
+            siapkan(connection, f"alamat_{versi}")
+            # Alamat non-utama dulu agar trigger lama diukur pada tabel yang sudah berisi
+            laporan(f"Alamat {versi} (non-utama)",
+                    ukur(connection, f"bench_alamat_{versi}", ALAMAT_COLUMNS,
+                         generate_alamat(args.rows), args.batch_size))
+            laporan(f"Alamat {versi} (utama)",
+                    ukur(connection, f"bench_alamat_{versi}", ALAMAT_COLUMNS,
+                         generate_alamat(args.rows, utama=True), args.batch_size))
+        cek_trigger_asli(connection)
+    finally:
+        hapus(connection)
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
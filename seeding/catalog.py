@@ -0,0 +1,95 @@
+from array import array
+
+
+class Katalog:
+    """Katalog produk dan varian dalam kolom array paralel, bukan dict per produk
+
+    Produk ke-i: id_produk[i], id_seller[i], varian j di range(offset_varian[i], offset_varian[i + 1]).
+    Varian ke-j: sku(j) dan stok[j]. SKU disimpan sebagai satu buffer byte ASCII dengan
+    offset, sehingga satu varian hanya memakan beberapa puluh byte. Indeks i dan j
+    adalah posisi di katalog, bukan id di database.
+    """
+
+    __slots__ = ("id_produk", "id_seller", "offset_varian", "sku_data", "offset_sku", "stok")
+
+    def __init__(self):
+        self.id_produk = array("q")
+        self.id_seller = array("q")
+        self.offset_varian = array("q", [0])
+        self.sku_data = bytearray()
+        self.offset_sku = array("q", [0])
+        self.stok = array("i")
+
+    def __len__(self):
+        return len(self.id_produk)
+
+    def tambah_produk(self, id_produk, id_seller):
+        """Menambah produk; varian berikutnya (tambah_varian) menjadi milik produk ini"""
+        self.id_produk.append(id_produk)
+        self.id_seller.append(id_seller)
+        self.offset_varian.append(self.offset_varian[-1])
+
+    def tambah_varian(self, sku, stok):
+        """Menambah varian untuk produk yang terakhir ditambahkan"""
+        self.sku_data += sku.encode("ascii")
+        self.offset_sku.append(len(self.sku_data))
+        self.stok.append(stok)
+        self.offset_varian[-1] += 1
+
+    def jumlah_varian(self):
+        return len(self.stok)
+
+    def rentang_varian(self, i):
+        """Indeks varian milik produk ke-i"""
+        return range(self.offset_varian[i], self.offset_varian[i + 1])
+
+    def sku(self, j):
+        return self.sku_data[self.offset_sku[j]:self.offset_sku[j + 1]].decode("ascii")
+
+    def tersedia(self, i):
+        """True jika produk ke-i punya minimal satu varian dengan stok"""
+        return any(self.stok[j] > 0 for j in self.rentang_varian(i))
+
+    def bagi_stok(self, bagian):
+        """Membagi stok setiap varian menjadi beberapa array yang jumlahnya sama dengan stok asli
+
+        Dipakai agar potongan paralel tidak menjual unit stok yang sama.
+        """
+        hasil = [array("i", bytes(4 * len(self.stok))) for _ in range(bagian)]
+        for j, stok in enumerate(self.stok):
+            dasar, sisa = divmod(stok, bagian)
+            for k in range(bagian):
+                hasil[k][j] = dasar + (1 if k < sisa else 0)
+        return hasil
+
+    @classmethod
+    def gabung(cls, daftar):
+        """Menggabungkan beberapa katalog (misalnya dari potongan paralel) sesuai urutan"""
+        hasil = cls()
+        for katalog in daftar:
+            geser_varian = hasil.offset_varian[-1]
+            geser_sku = len(hasil.sku_data)
+            hasil.id_produk.extend(katalog.id_produk)
+            hasil.id_seller.extend(katalog.id_seller)
+            hasil.offset_varian.extend(o + geser_varian for o in katalog.offset_varian[1:])
+            hasil.sku_data += katalog.sku_data
+            hasil.offset_sku.extend(o + geser_sku for o in katalog.offset_sku[1:])
+            hasil.stok.extend(katalog.stok)
+        return hasil
+
+
+class AlamatUtama:
+    """Pasangan (id_user buyer, id_alamat utama) dalam dua array paralel, urut id_user"""
+
+    __slots__ = ("id_user", "id_alamat")
+
+    def __init__(self):
+        self.id_user = array("q")
+        self.id_alamat = array("q")
+
+    def __len__(self):
+        return len(self.id_user)
+
+    def tambah(self, id_user, id_alamat):
+        self.id_user.append(id_user)
+        self.id_alamat.append(id_alamat)
@@ -0,0 +1,179 @@
+import random
+import string
+from datetime import date
+
+import numpy as np
+from faker.providers.address.id_ID import Provider as AlamatProvider
+
+import identity
+
+# Generator kolom: setiap fungsi blok_* menghasilkan satu blok per tabel berupa
+# dict nama kolom -> numpy array, sehingga satu blok dibuat dengan beberapa operasi
+# NumPy alih-alih satu panggilan Faker per baris. Writer mengonsumsi blok ini
+# lewat write_columns().
+
+# Ukuran blok default; cukup besar untuk efisien, cukup kecil untuk memori datar
+UKURAN_BLOK = 65536
+
+# Kosakata Indonesia dimuat sekali dari data provider Faker id_ID
+NAMA_DEPAN = np.array(identity.NAMA_DEPAN)
+NAMA_BELAKANG = np.array(identity.NAMA_BELAKANG)
+NAMA_JALAN = np.array([
+    f"{prefix} {street}"
+    for prefix in AlamatProvider.street_prefixes_short + AlamatProvider.street_prefixes_long
+    for street in AlamatProvider.streets
+])
+
+DIGIT = np.frombuffer(string.digits.encode(), dtype=np.uint8)
+# Sama dengan karakter default fake.password()
+KARAKTER_PASSWORD = np.frombuffer(
+    (string.ascii_letters + string.digits + "!@#$%^&*()_+").encode(), dtype=np.uint8
+)
+
+
+def buat_rng():
+    """Membuat numpy Generator yang diturunkan dari modul random (mengikuti --seed)"""
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def string_acak(rng, jumlah, panjang_min, panjang_max, karakter):
+    """Membuat jumlah string acak dengan panjang panjang_min..panjang_max dari karakter"""
+    kode = karakter[rng.integers(0, len(karakter), size=(jumlah, panjang_max))]
+    panjang = rng.integers(panjang_min, panjang_max + 1, size=jumlah)
+    # Byte 0 di akhir dibuang oleh dtype 'S', sehingga panjang tiap string bisa berbeda
+    kode[np.arange(panjang_max) >= panjang[:, None]] = 0
+    return kode.view(f"S{panjang_max}").ravel().astype(str)
+
+
+def kurangi_tahun(tanggal, tahun):
+    """Mundur sejumlah tahun dari tanggal (29 Februari menjadi 28 Februari)"""
+    try:
+        return tanggal.replace(year=tanggal.year - tahun)
+    except ValueError:
+        return tanggal.replace(year=tanggal.year - tahun, day=28)
+
+
+def tanggal_lahir_acak(rng, jumlah, usia_min=18, usia_max=60, hari_ini=None):
+    """Tanggal lahir acak untuk usia usia_min..usia_max, sama dengan fake.date_of_birth"""
+    hari_ini = hari_ini or date.today()
+    paling_muda = np.datetime64(kurangi_tahun(hari_ini, usia_min), "D")
+    paling_tua = np.datetime64(kurangi_tahun(hari_ini, usia_max + 1), "D") + 1
+    rentang = (paling_muda - paling_tua).astype(int)
+    return paling_tua + rng.integers(0, rentang + 1, size=jumlah)
+
+
+def gabung(*bagian):
+    """Menggabungkan beberapa array/string secara elemen per elemen"""
+    hasil = bagian[0]
+    for b in bagian[1:]:
+        hasil = np.char.add(hasil, b)
+    return hasil
+
+
+def nama_unik(id_user):
+    """Versi vektor identity.nama_unik: mengembalikan (nama depan, nama panjang) untuk array id_user"""
+    siklus, sisa = np.divmod(id_user, identity.KAPASITAS)
+    acak = (sisa * identity.PENGALI + identity.GESER) % identity.KAPASITAS
+    indeks_belakang, indeks_depan = np.divmod(acak, len(NAMA_DEPAN))
+    nama_depan = NAMA_DEPAN[indeks_depan]
+
+    # Nama tengah hanya ada untuk id_user >= KAPASITAS; sisipkan digit demi digit
+    tengah = np.full(len(id_user), "", dtype=NAMA_DEPAN.dtype)
+    while (siklus > 0).any():
+        ada = siklus > 0
+        siklus = np.where(ada, siklus - 1, 0)
+        siklus, digit = np.divmod(siklus, len(NAMA_DEPAN))
+        tengah = np.where(ada, gabung(" ", NAMA_DEPAN[digit], tengah), tengah)
+    return nama_depan, gabung(nama_depan, tengah, " ", NAMA_BELAKANG[indeks_belakang])
+
+
+def kolom_users(rng, mulai, jumlah, awal_id, seller):
+    """Satu blok kolom User untuk user ke-mulai sampai mulai+jumlah dengan id_user = awal_id + indeks
+
+    seller adalah array boolean per user yang menentukan kolom tipe.
+    """
+    nomor = np.arange(mulai + 1, mulai + jumlah + 1)
+    id_user = nomor - 1 + awal_id
+    nama_depan, nama_panjang = nama_unik(id_user)
+
+    kolom = {"id_user": id_user}
+    # Email mengikuti pola CHECK ^[^@\s]+@[^@\s]+\.com$ dan unik karena memuat id_user
+    kolom["email"] = gabung(np.char.lower(nama_depan), ".", id_user.astype(str), "@bustbuy.com")
+    kolom["password_hash"] = string_acak(rng, jumlah, 10, 10, KARAKTER_PASSWORD)
+    kolom["nama_panjang"] = nama_panjang
+    kolom["tanggal_lahir"] = tanggal_lahir_acak(rng, jumlah)
+    # Nomor telepon mengikuti regex ^[0-9]{8,15}$
+    kolom["no_telp"] = string_acak(rng, jumlah, 8, 15, DIGIT)
+    kolom["foto_profil"] = gabung("profile_user_", nomor.astype(str), ".jpg")
+    kolom["tipe"] = np.where(seller, "Seller", "Buyer")
+    return kolom
+
+
+def blok_users(mulai, jumlah, awal_id, jumlah_seller=0, ukuran_blok=UKURAN_BLOK):
+    """Generator blok kolom User secara streaming, jumlah_seller user acak bertipe Seller"""
+    rng = buat_rng()
+    seller = np.zeros(jumlah, dtype=bool)
+    seller[rng.choice(jumlah, min(jumlah_seller, jumlah), replace=False)] = True
+    for awal_blok in range(mulai, mulai + jumlah, ukuran_blok):
+        n = min(ukuran_blok, mulai + jumlah - awal_blok)
+        yield kolom_users(rng, awal_blok, n, awal_id, seller[awal_blok - mulai:awal_blok - mulai + n])
+
+
+def kolom_alamat(rng, buyer_ids, provinsi_kota, max_addresses=3):
+    """Satu blok kolom Alamat: 1..max_addresses alamat per buyer dengan tepat 1 alamat utama"""
+    buyer_ids = np.asarray(buyer_ids)
+    banyak = rng.integers(1, max_addresses + 1, size=len(buyer_ids))
+    total = int(banyak.sum())
+    awal_grup = np.repeat(np.cumsum(banyak) - banyak, banyak)
+    posisi = np.arange(total) - awal_grup
+    utama = np.repeat(rng.integers(0, banyak), banyak)
+
+    # Kota dipilih di dalam provinsinya lewat offset ke daftar kota yang diratakan
+    nama_provinsi = np.array(list(provinsi_kota.keys()))
+    nama_kota = np.array([kota for daftar in provinsi_kota.values() for kota in daftar])
+    banyak_kota = np.array([len(daftar) for daftar in provinsi_kota.values()])
+    offset_kota = np.cumsum(banyak_kota) - banyak_kota
+    indeks_provinsi = rng.integers(0, len(nama_provinsi), size=total)
+    indeks_kota = offset_kota[indeks_provinsi] + (rng.random(total) * banyak_kota[indeks_provinsi]).astype(int)
+
+    jalan = NAMA_JALAN[rng.integers(0, len(NAMA_JALAN), size=total)]
+    return {
+        "id_user": np.repeat(buyer_ids, banyak),
+        "provinsi": nama_provinsi[indeks_provinsi],
+        "kota": nama_kota[indeks_kota],
+        "jalan": gabung(jalan, " No. ", rng.integers(1, 1000, size=total).astype(str)),
+        "is_utama": posisi == utama,
+    }
+
+
+def blok_alamat(buyer_ids, provinsi_kota, max_addresses=3, awal_id=None, ukuran_blok=UKURAN_BLOK):
+    """Generator blok kolom Alamat secara streaming, id_alamat berurutan dari awal_id jika diberikan"""
+    rng = buat_rng()
+    berikut_id = awal_id
+    for awal_blok in range(0, len(buyer_ids), ukuran_blok):
+        kolom = kolom_alamat(rng, buyer_ids[awal_blok:awal_blok + ukuran_blok], provinsi_kota, max_addresses)
+        if berikut_id is not None:
+            n = len(kolom["id_user"])
+            kolom = {"id_alamat": np.arange(berikut_id, berikut_id + n), **kolom}
+            berikut_id += n
+        yield kolom
+
+
+def kolom_tsv(array):
+    """Format satu kolom numpy untuk LOAD DATA (sama dengan writers.format_tsv)"""
+    if array.dtype == np.bool_:
+        return np.where(array, "1", "0")
+    if array.dtype.kind == "U":
+        for asli, escape in (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r")):
+            array = np.char.replace(array, asli, escape)
+        return array
+    return array.astype(str)
+
+
+def baris_tsv(kolom):
+    """Mengubah satu blok kolom menjadi list baris TSV"""
+    teks = None
+    for array in kolom.values():
+        nilai = kolom_tsv(array)
+        teks = nilai if teks is None else gabung(teks, "\t", nilai)
+    return teks.tolist()
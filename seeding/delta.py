@@ -0,0 +1,215 @@
+import random
+from array import array
+
+from mysql.connector import Error
+
+import seeder
+from catalog import AlamatUtama, Katalog
+
+# Mode delta (seeder.py --delta): menambah data ke database yang sudah terisi tanpa
+# membaca ulang seluruh tabel. Id baru dimulai dari watermark MAX(id)/AUTO_INCREMENT
+# (reserve_ids), baris yang butuh data lama (pertemanan ke user lama, produk untuk
+# keranjang dan order, buyer yang memesan) memakai sampel berukuran tetap yang
+# diambil dengan aritmetika rentang id: id acak di [MIN, MAX] dicari dengan
+# WHERE id IN (...) per batch. Waktu proses sebanding dengan ukuran delta dan
+# sampel, bukan dengan ukuran database.
+
+# Banyak produk lama yang dimuat ke katalog untuk keranjang, wishlist dan order
+SAMPEL_PRODUK = 20000
+# Banyak buyer lama (dengan alamat utama) yang bisa mendapat order baru
+SAMPEL_BUYER = 50000
+# Banyak user lama yang bisa menjadi teman user baru
+SAMPEL_USER = 50000
+# Teman lama per user baru (0..TEMAN_LAMA_MAKS)
+TEMAN_LAMA_MAKS = 2
+# Putaran pengambilan id acak; id yang tidak ada (celah, atau bukan buyer) diganti di putaran berikutnya
+PUTARAN_SAMPEL = 6
+
+
+def watermark(connection, table, kolom):
+    """(MIN, MAX) kolom id tabel; (None, None) jika kosong"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SELECT MIN({kolom}), MAX({kolom}) FROM `{table}`")
+        return cursor.fetchone()
+    finally:
+        cursor.close()
+
+
+def sampel_rentang(connection, rentang, jumlah, query, batch_size):
+    """Menjalankan query (diakhiri 'IN ({})') untuk id acak di rentang sampai mendapat jumlah baris
+
+    Mengembalikan paling banyak jumlah baris yang dipilih acak dari semua baris yang
+    ditemukan (agar tersebar merata di rentang), urut berdasarkan kolom pertama. Jika
+    rentangnya lebih kecil dari jumlah, semua id di rentang dicoba.
+    """
+    bawah, atas = rentang
+    if bawah is None or jumlah <= 0:
+        return []
+    ruang = range(bawah, atas + 1)
+    hasil = []
+    dicoba = set()
+    cursor = connection.cursor()
+    try:
+        for _ in range(PUTARAN_SAMPEL):
+            kurang = jumlah - len(hasil)
+            if kurang <= 0 or len(dicoba) >= len(ruang):
+                break
+            # Ambil lebih banyak dari kekurangan karena sebagian id tidak ditemukan
+            kandidat = random.sample(ruang, min(kurang * 2, len(ruang)))
+            kandidat = [i for i in kandidat if i not in dicoba]
+            dicoba.update(kandidat)
+            for batch in seeder.chunked(sorted(kandidat), batch_size):
+                cursor.execute(query.format(", ".join(["%s"] * len(batch))), batch)
+                hasil.extend(cursor.fetchall())
+    finally:
+        cursor.close()
+    hasil = random.sample(hasil, min(jumlah, len(hasil)))
+    hasil.sort()
+    return hasil
+
+
+def muat_katalog(connection, id_produk, batch_size):
+    """Memuat produk dan variannya (stok saat ini) untuk id_produk ke Katalog"""
+    katalog = Katalog()
+    cursor = connection.cursor()
+    try:
+        for batch in seeder.chunked(id_produk, batch_size):
+            cursor.execute(
+                f"""SELECT p.id_produk, p.id_seller, v.sku, v.stok
+                FROM Produk p JOIN VarianProduk v ON v.id_produk = p.id_produk
+                WHERE p.id_produk IN ({", ".join(["%s"] * len(batch))})
+                ORDER BY p.id_produk, v.sku""",
+                batch
+            )
+            terakhir = None
+            for produk, seller, sku, stok in cursor:
+                if produk != terakhir:
+                    katalog.tambah_produk(produk, seller)
+                    terakhir = produk
+                katalog.tambah_varian(sku, stok)
+    finally:
+        cursor.close()
+    return katalog
+
+
+def generate_pertemanan_lama(user_baru, user_lama):
+    """Edge (min, max) dari setiap user baru ke 0..TEMAN_LAMA_MAKS user lama berbeda"""
+    if not user_lama:
+        return
+    for user_id in user_baru:
+        for friend_id in random.sample(user_lama, min(random.randint(0, TEMAN_LAMA_MAKS), len(user_lama))):
+            yield (min(user_id, friend_id), max(user_id, friend_id))
+
+
+def seed_delta(connection, writer, ukuran, waktu_acuan, args, metrik):
+    """Menambah ukuran['user'] user, ukuran['produk'] produk dan ukuran['order'] order ke database yang ada
+
+    User baru mendapat Buyer/Seller, pertemanan (dengan sesama user baru dan sampel
+    user lama), alamat, keranjang dan wishlist. Produk baru hanya untuk seller
+    terverifikasi yang baru, karena nama produk hanya dijamin unik per seller di
+    dalam satu pemanggilan. Order dipesan buyer baru dan sampel buyer lama.
+    """
+    if args.seed is not None:
+        # Dijalankan dari seeder.py, modul seeder di sini salinan terpisah dengan Faker sendiri
+        seeder.fake.seed_instance(args.seed)
+    batas_user = watermark(connection, "User", "id_user")
+    batas_produk = watermark(connection, "Produk", "id_produk")
+    print(f"🔁 Mode delta dari watermark id_user {batas_user[1] or 0}, id_produk {batas_produk[1] or 0}")
+
+    user_baru = range(0)
+    buyer_baru = array('q')
+    with metrik.tahap("users"):
+        try:
+            if ukuran["user"]:
+                awal_user = seeder.reserve_ids(connection, "User", "id_user", ukuran["user"])
+                seeder.tulis_users(writer, 0, ukuran["user"], awal_user, ukuran["seller"], args.vectorized)
+                user_baru = range(awal_user, awal_user + ukuran["user"])
+                jumlah_buyer, jumlah_seller = seeder.tulis_buyers_and_sellers(
+                    writer, seeder.ambil_user_types(connection, awal_user, batch_size=writer.batch_size)
+                )
+                buyer_baru = seeder.ambil_id(
+                    connection, "SELECT id_user FROM Buyer WHERE id_user >= %s ORDER BY id_user", (awal_user,)
+                )
+                print(f"✅ Berhasil menambahkan {len(user_baru)} users ({jumlah_buyer} buyers, {jumlah_seller} sellers)")
+        except Error as e:
+            connection.rollback()
+            print(f"❌ Error seeding users: {e}")
+
+    with metrik.tahap("pertemanan"):
+        try:
+            user_lama = array('q', (row[0] for row in sampel_rentang(
+                connection, batas_user, SAMPEL_USER, "SELECT id_user FROM User WHERE id_user IN ({})", writer.batch_size
+            )))
+            jumlah = writer.write("Pertemanan", ("id_user", "id_user_teman"), seeder.generate_pertemanan(user_baru))
+            jumlah += writer.write("Pertemanan", ("id_user", "id_user_teman"),
+                                   generate_pertemanan_lama(user_baru, user_lama))
+            writer.flush()
+            if jumlah:
+                print(f"✅ Berhasil menambahkan {jumlah} relasi pertemanan")
+        except Error as e:
+            connection.rollback()
+            print(f"❌ Error seeding pertemanan: {e}")
+
+    with metrik.tahap("alamat"):
+        try:
+            if buyer_baru:
+                awal_alamat = seeder.reserve_ids(connection, "Alamat", "id_alamat", len(buyer_baru) * 3)
+                jumlah = seeder.tulis_alamat(writer, buyer_baru, 3, awal_alamat, args.vectorized)
+                print(f"✅ Berhasil menambahkan {jumlah} alamat")
+        except Error as e:
+            connection.rollback()
+            print(f"❌ Error seeding alamat: {e}")
+
+    katalog_baru = Katalog()
+    with metrik.tahap("produk"):
+        try:
+            seller_baru = seeder.ambil_id(
+                connection, "SELECT id_user FROM Seller WHERE is_verified = TRUE AND id_user > %s ORDER BY id_user",
+                (batas_user[1] or 0,)
+            )
+            if ukuran["produk"] and not seller_baru:
+                print("⚠ Tidak ada verified seller baru untuk produk baru (tambah user dengan --users). Lewati produk.")
+            elif ukuran["produk"]:
+                awal_produk = seeder.reserve_ids(connection, "Produk", "id_produk", ukuran["produk"])
+                katalog_baru, n_varian, n_tag, n_gambar = seeder.tulis_produk_dan_varian(
+                    writer, seller_baru, awal_produk, ukuran["produk"]
+                )
+                print(f"✅ Berhasil menambahkan {len(katalog_baru)} produk, {n_varian} varian, {n_tag} tag, dan {n_gambar} gambar")
+        except Error as e:
+            connection.rollback()
+            print(f"❌ Error seeding produk: {e}")
+
+    id_produk_lama = [row[0] for row in sampel_rentang(
+        connection, batas_produk, SAMPEL_PRODUK, "SELECT id_produk FROM Produk WHERE id_produk IN ({})", writer.batch_size
+    )]
+    katalog = Katalog.gabung([muat_katalog(connection, id_produk_lama, writer.batch_size), katalog_baru])
+    bobot_produk = seeder.bobot_zipf(len(katalog), args.zipf) if args.zipf else None
+
+    with metrik.tahap("keranjang_wishlist"):
+        try:
+            if buyer_baru and katalog:
+                jumlah_keranjang, jumlah_wishlist = seeder.tulis_keranjang_dan_wishlist(
+                    writer, buyer_baru, katalog, ukuran["keranjang_min"], ukuran["wishlist_min"], bobot_produk=bobot_produk
+                )
+                print(f"✅ Berhasil menambahkan {jumlah_keranjang} item keranjang dan {jumlah_wishlist} item wishlist")
+        except Error as e:
+            connection.rollback()
+            print(f"❌ Error seeding keranjang dan wishlist: {e}")
+
+    with metrik.tahap("orders"):
+        # Buyer lama dan baru dengan alamat utama; hanya buyer baru yang dibaca lengkap
+        alamat_utama = AlamatUtama()
+        lama = sampel_rentang(
+            connection, batas_user, SAMPEL_BUYER,
+            "SELECT id_user, id_alamat FROM Alamat WHERE is_utama = TRUE AND id_user IN ({})", writer.batch_size
+        )
+        if buyer_baru:
+            lama += sampel_rentang(
+                connection, (buyer_baru[0], buyer_baru[-1]), len(buyer_baru),
+                "SELECT id_user, id_alamat FROM Alamat WHERE is_utama = TRUE AND id_user IN ({})", writer.batch_size
+            )
+        for id_user, id_alamat in lama:
+            alamat_utama.tambah(id_user, id_alamat)
+        seeder.seed_orders(connection, writer, katalog, alamat_utama, ukuran["order"], waktu_acuan, bobot_produk,
+                           args.inventory, args.history_years)
@@ -0,0 +1,98 @@
+from array import array
+
+import seeder
+from backends import MariaDB
+from catalog import AlamatUtama
+from writers import DumpWriter
+
+# Mode dump (seeder.py --dump FILE): dataset dibuat tanpa koneksi database dan
+# langsung ditulis sebagai file .sql/.sql.gz berisi INSERT multi-row, lalu bisa
+# diputar ulang di banyak lingkungan dengan `mysql bustbuy15 < FILE`. Data yang pada
+# mode database dibaca ulang (tipe user, seller terverifikasi, alamat utama) ditangkap
+# dari baris yang ditulis, dan id dimulai dari 1 seperti pada database kosong, sehingga
+# untuk seed dan scale yang sama isinya sama dengan seeding serial ke database kosong.
+
+
+def kurangi_stok(writer, katalog, terjual):
+    """Statement pengurangan stok (--inventory) sama seperti terapkan_pengurangan_stok"""
+    writer.statement(
+        """CREATE TEMPORARY TABLE delta_stok (
+            sku VARCHAR(255) NOT NULL,
+            id_produk INT NOT NULL,
+            jumlah INT NOT NULL,
+            PRIMARY KEY (sku, id_produk)
+        )"""
+    )
+    jumlah = writer.write("delta_stok", ("sku", "id_produk", "jumlah"), (
+        (katalog.sku(j), katalog.id_produk[i], terjual[j])
+        for i in range(len(katalog)) for j in katalog.rentang_varian(i) if terjual[j]
+    ))
+    writer.statement(MariaDB.UPDATE_STOK)
+    writer.statement("DROP TEMPORARY TABLE delta_stok")
+    return jumlah
+
+
+def seed_dump(args, ukuran, waktu_acuan):
+    """Membuat seluruh dataset ke args.dump dengan urutan tahap yang sama seperti main()"""
+    if args.seed is not None:
+        # Dijalankan dari seeder.py, modul seeder di sini salinan terpisah dengan Faker sendiri
+        seeder.fake.seed_instance(args.seed)
+    writer = DumpWriter(
+        args.dump, args.batch_size, args.max_packet,
+        f"Dataset bustbuy dari seeder.py (scale {args.scale}, seed {args.seed}); muat ke database kosong"
+    )
+    try:
+        print(f"🚀 Membuat dump {args.dump} (scale {args.scale})...")
+        user_types = writer.tangkap("User", ("id_user", "tipe"))
+        jumlah = seeder.tulis_users(writer, 0, ukuran["user"], 1, ukuran["seller"], args.vectorized)
+        print(f"✅ {jumlah} users dengan {ukuran['seller']} Sellers")
+        seller = writer.tangkap("Seller", ("id_user", "is_verified"))
+        jumlah_buyer, jumlah_seller = seeder.tulis_buyers_and_sellers(writer, user_types)
+        print(f"✅ {jumlah_buyer} buyers dan {jumlah_seller} sellers")
+        user_ids = array('q', (id_user for id_user, _ in user_types))
+        jumlah = writer.write("Pertemanan", ("id_user", "id_user_teman"), seeder.generate_pertemanan(user_ids))
+        print(f"✅ {jumlah} relasi pertemanan")
+
+        buyer_ids = array('q', (id_user for id_user, tipe in user_types if tipe == "Buyer"))
+        del user_types[:]
+        alamat = writer.tangkap("Alamat", ("id_alamat", "id_user", "is_utama"))
+        jumlah = seeder.tulis_alamat(writer, buyer_ids, 3, 1, args.vectorized)
+        alamat_utama = AlamatUtama()
+        for id_alamat, id_user, is_utama in alamat:
+            if is_utama:
+                alamat_utama.tambah(id_user, id_alamat)
+        del alamat[:]
+        print(f"✅ {jumlah} alamat")
+
+        seller_ids = array('q', (id_user for id_user, is_verified in seller if is_verified))
+        del seller[:]
+        if not seller_ids:
+            print("⚠ Tidak ada verified seller. Lewati produk.")
+            katalog = seeder.Katalog()
+        else:
+            katalog, n_varian, n_tag, n_gambar = seeder.tulis_produk_dan_varian(
+                writer, seller_ids, 1, ukuran["produk"]
+            )
+            print(f"✅ {len(katalog)} produk, {n_varian} varian, {n_tag} tag, dan {n_gambar} gambar")
+        bobot_produk = seeder.bobot_zipf(len(katalog), args.zipf) if args.zipf else None
+
+        if buyer_ids and katalog:
+            jumlah_keranjang, jumlah_wishlist = seeder.tulis_keranjang_dan_wishlist(
+                writer, buyer_ids, katalog, ukuran["keranjang_min"], ukuran["wishlist_min"], bobot_produk=bobot_produk
+            )
+            print(f"✅ {jumlah_keranjang} item keranjang dan {jumlah_wishlist} item wishlist")
+
+        if alamat_utama and katalog:
+            jumlah_order = min(ukuran["order"], len(alamat_utama) * len(katalog))
+            jumlah_order, jumlah_inst_produk, jumlah_ulasan, terjual = seeder.tulis_orders(
+                writer, katalog, alamat_utama, 1, jumlah_order, waktu_acuan, bobot_produk=bobot_produk,
+                stok=array('i', katalog.stok) if args.inventory else None, tahun_histori=args.history_years
+            )
+            print(f"✅ {jumlah_order} orders, {jumlah_inst_produk} product instances, dan {jumlah_ulasan} ulasan")
+            if terjual is not None:
+                print(f"✅ Stok {kurangi_stok(writer, katalog, terjual)} varian dikurangi sebanyak {sum(terjual)} unit")
+    finally:
+        writer.tutup()
+    writer.laporan()
+    putar = f"zcat {args.dump} | mysql <database>" if args.dump.endswith(".gz") else f"mysql <database> < {args.dump}"
+    print(f"📝 Dump disimpan di {args.dump} (putar ulang: {putar})")
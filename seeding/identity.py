@@ -0,0 +1,52 @@
+from math import gcd
+
+from faker.providers.person.id_ID import Provider as PersonProvider
+
+# Identitas user diturunkan langsung dari id_user sehingga unik tanpa retry:
+# - email memuat id_user di local part, jadi unik selama id_user unik (PK);
+# - nama adalah pemetaan bijektif id_user -> (nama tengah..., nama depan, nama belakang).
+# Semua fungsi O(1) per baris (nama tengah baru muncul setelah NAMA_DEPAN x NAMA_BELAKANG id).
+
+NAMA_DEPAN = tuple(sorted(set(PersonProvider.first_names)))
+NAMA_BELAKANG = tuple(sorted(set(PersonProvider.last_names)))
+
+# Banyaknya pasangan (nama depan, nama belakang) yang berbeda
+KAPASITAS = len(NAMA_DEPAN) * len(NAMA_BELAKANG)
+
+# Pengali untuk mengacak urutan pasangan agar id berurutan tidak mendapat nama
+# yang berurutan; harus koprima dengan KAPASITAS supaya pemetaannya tetap bijektif
+PENGALI = next(p for p in range(7919, KAPASITAS + 7919) if gcd(p, KAPASITAS) == 1)
+GESER = 104729 % KAPASITAS
+
+
+def indeks_nama(id_user):
+    """Memetakan id_user ke (indeks nama depan, indeks nama belakang, siklus)"""
+    siklus, sisa = divmod(id_user, KAPASITAS)
+    acak = (sisa * PENGALI + GESER) % KAPASITAS
+    indeks_belakang, indeks_depan = divmod(acak, len(NAMA_DEPAN))
+    return indeks_depan, indeks_belakang, siklus
+
+
+def nama_tengah(siklus):
+    """Nama tengah untuk siklus ke-n (penomoran bijektif basis len(NAMA_DEPAN), siklus 0 = tanpa nama tengah)"""
+    bagian = []
+    while siklus > 0:
+        siklus -= 1
+        siklus, digit = divmod(siklus, len(NAMA_DEPAN))
+        bagian.append(NAMA_DEPAN[digit])
+    return " ".join(reversed(bagian))
+
+
+def nama_unik(id_user):
+    """Nama panjang yang unik untuk setiap id_user"""
+    indeks_depan, indeks_belakang, siklus = indeks_nama(id_user)
+    tengah = nama_tengah(siklus)
+    depan = NAMA_DEPAN[indeks_depan]
+    if tengah:
+        depan = f"{depan} {tengah}"
+    return f"{depan} {NAMA_BELAKANG[indeks_belakang]}"
+
+
+def email_unik(id_user, nama_panjang):
+    """Email unik yang memenuhi CHECK ^[^@\\s]+@[^@\\s]+\\.com$"""
+    return f"{nama_panjang.split()[0].lower()}.{id_user}@bustbuy.com"
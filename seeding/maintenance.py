@@ -0,0 +1,173 @@
+import os
+import tempfile
+
+# Jendela pemeliharaan untuk bulk load: selama seeding, FOREIGN_KEY_CHECKS dimatikan
+# dan semua trigger database di-drop (lalu dibuat ulang dari definisi aslinya),
+# sehingga tidak ada kerja trigger per baris. Setelah itu invariant yang biasanya
+# dijaga trigger dan foreign key dibuktikan ulang dengan beberapa query agregat.
+
+# (nama invariant, query yang mengembalikan baris pelanggar)
+INVARIANT = [
+    (
+        "Tepat satu alamat utama per buyer yang memiliki alamat",
+        """SELECT id_user, SUM(is_utama) AS jumlah_utama FROM Alamat
+        GROUP BY id_user HAVING SUM(is_utama) <> 1""",
+    ),
+    (
+        "Ulasan hanya untuk produk yang ada dalam order",
+        """SELECT u.id_ulasan, u.id_order, u.id_produk FROM Ulasan u
+        WHERE NOT EXISTS (
+            SELECT 1 FROM InstProduk ip
+            WHERE ip.id_order = u.id_order AND ip.id_produk = u.id_produk
+        )""",
+    ),
+    (
+        "Nama varian unik untuk setiap produk",
+        """SELECT id_produk, nama_varian, COUNT(*) AS jumlah FROM VarianProduk
+        GROUP BY id_produk, nama_varian HAVING COUNT(*) > 1""",
+    ),
+    (
+        "User tidak berteman dengan dirinya sendiri",
+        "SELECT id_user, id_user_teman FROM Pertemanan WHERE id_user = id_user_teman",
+    ),
+    (
+        "Usia pengguna minimal 17 tahun",
+        """SELECT id_user, tanggal_lahir FROM User
+        WHERE tanggal_lahir > DATE_SUB(CURDATE(), INTERVAL 17 YEAR)""",
+    ),
+]
+
+# Banyak baris pelanggar yang ditampilkan per invariant
+CONTOH_PELANGGARAN = 10
+
+
+def ambil_trigger(connection):
+    """Mengembalikan [(nama trigger, statement CREATE TRIGGER)] untuk database aktif"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            """SELECT TRIGGER_NAME FROM information_schema.TRIGGERS
+            WHERE TRIGGER_SCHEMA = DATABASE() ORDER BY EVENT_OBJECT_TABLE, ACTION_ORDER"""
+        )
+        nama_trigger = [row[0] for row in cursor.fetchall()]
+        hasil = []
+        for nama in nama_trigger:
+            cursor.execute(f"SHOW CREATE TRIGGER `{nama}`")
+            # Kolom ketiga adalah 'SQL Original Statement'
+            hasil.append((nama, cursor.fetchone()[2]))
+        return hasil
+    finally:
+        cursor.close()
+
+
+def matikan_foreign_key(connection, mati=True):
+    """Mengatur FOREIGN_KEY_CHECKS untuk session koneksi ini"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SET FOREIGN_KEY_CHECKS = {0 if mati else 1}")
+    finally:
+        cursor.close()
+
+
+class JendelaPemeliharaan:
+    """Context manager: drop semua trigger dan matikan FK checks, lalu pulihkan saat keluar
+
+    Trigger di-drop untuk seluruh database (bukan hanya session ini), jadi hanya
+    gunakan saat tidak ada aplikasi lain yang menulis. Definisi trigger juga
+    disimpan ke file cadangan agar bisa dipulihkan manual jika proses terhenti.
+    Koneksi lain (misalnya worker paralel) harus memanggil matikan_foreign_key sendiri.
+    """
+
+    def __init__(self, connection, directory=None):
+        self.connection = connection
+        self.directory = directory
+        self.trigger = []
+        self.cadangan = None
+
+    def __enter__(self):
+        self.trigger = ambil_trigger(self.connection)
+        directory = self.directory or tempfile.mkdtemp(prefix="bustbuy_trigger_")
+        os.makedirs(directory, exist_ok=True)
+        self.cadangan = os.path.join(directory, "trigger_cadangan.sql")
+        with open(self.cadangan, "w", encoding="utf-8") as f:
+            f.write("DELIMITER //\n")
+            for _, statement in self.trigger:
+                f.write(f"{statement}//\n\n")
+            f.write("DELIMITER ;\n")
+
+        cursor = self.connection.cursor()
+        try:
+            for nama, _ in self.trigger:
+                cursor.execute(f"DROP TRIGGER IF EXISTS `{nama}`")
+        finally:
+            cursor.close()
+        matikan_foreign_key(self.connection)
+        print(f"🔧 Jendela pemeliharaan: {len(self.trigger)} trigger di-drop (cadangan: {self.cadangan}), FK checks mati")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.connection.rollback()
+        matikan_foreign_key(self.connection, mati=False)
+        cursor = self.connection.cursor()
+        try:
+            for _, statement in self.trigger:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+        print(f"🔧 Jendela pemeliharaan selesai: {len(self.trigger)} trigger dibuat ulang, FK checks aktif")
+        return False
+
+
+def invariant_foreign_key(connection):
+    """Membuat satu query pelanggaran (baris anak tanpa induk) untuk setiap foreign key"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            """SELECT CONSTRAINT_NAME, TABLE_NAME, REFERENCED_TABLE_NAME,
+                GROUP_CONCAT(COLUMN_NAME ORDER BY ORDINAL_POSITION),
+                GROUP_CONCAT(REFERENCED_COLUMN_NAME ORDER BY ORDINAL_POSITION)
+            FROM information_schema.KEY_COLUMN_USAGE
+            WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL
+            GROUP BY CONSTRAINT_NAME, TABLE_NAME, REFERENCED_TABLE_NAME
+            ORDER BY TABLE_NAME, CONSTRAINT_NAME"""
+        )
+        hasil = []
+        for constraint, table, ref_table, kolom, ref_kolom in cursor.fetchall():
+            kolom = kolom.split(",")
+            ref_kolom = ref_kolom.split(",")
+            kondisi = " AND ".join(f"p.`{r}` = c.`{k}`" for k, r in zip(kolom, ref_kolom))
+            daftar_kolom = ", ".join(f"c.`{k}`" for k in kolom)
+            hasil.append((
+                f"Foreign key {table}.{constraint} -> {ref_table}",
+                f"""SELECT {daftar_kolom} FROM `{table}` c
+                WHERE NOT EXISTS (SELECT 1 FROM `{ref_table}` p WHERE {kondisi})""",
+            ))
+        return hasil
+    finally:
+        cursor.close()
+
+
+def validasi(connection):
+    """Membuktikan ulang invariant trigger dan foreign key, mengembalikan jumlah pelanggaran"""
+    total = 0
+    cursor = connection.cursor()
+    try:
+        for nama, query in INVARIANT + invariant_foreign_key(connection):
+            cursor.execute(query)
+            # Baris dihitung secara streaming, hanya beberapa contoh yang disimpan
+            jumlah = 0
+            contoh = []
+            for row in cursor:
+                if jumlah < CONTOH_PELANGGARAN:
+                    contoh.append(row)
+                jumlah += 1
+            total += jumlah
+            if not jumlah:
+                print(f"✅ {nama}")
+                continue
+            print(f"❌ {nama}: {jumlah} baris melanggar")
+            for row in contoh:
+                print(f"   {row}")
+    finally:
+        cursor.close()
+    return total
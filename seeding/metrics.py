@@ -0,0 +1,240 @@
+import contextlib
+import cProfile
+import json
+import re
+import threading
+import time
+
+# Instrumentasi seeder: koneksi dibungkus (Metrik.bungkus) sehingga setiap execute,
+# executemany dan commit dicatat latensinya per operasi dan tabel, lalu setiap tahap
+# seeding (Metrik.tahap) mencatat waktu total, waktu di database dan baris yang
+# ditulis. Waktu tahap dikurangi waktu database adalah waktu generate (Faker,
+# sampler) di sisi Python. Opsional: selisih SHOW GLOBAL STATUS per tahap.
+
+# Counter server yang dicatat selisihnya per tahap (--server-status)
+STATUS_SERVER = (
+    "Handler_write", "Handler_update", "Handler_delete", "Handler_read_key",
+    "Innodb_rows_inserted", "Innodb_rows_updated",
+    "Innodb_row_lock_waits", "Innodb_row_lock_time",
+    "Innodb_data_fsyncs", "Innodb_log_waits",
+)
+
+# Statement yang rowcount-nya dihitung sebagai baris yang ditulis
+DML = ("INSERT", "UPDATE", "DELETE", "LOAD")
+
+
+def persentil(nilai, p):
+    """Persentil p (0-100) dari list nilai yang sudah terurut, interpolasi linear"""
+    if not nilai:
+        return None
+    posisi = (len(nilai) - 1) * p / 100
+    bawah = int(posisi)
+    atas = min(bawah + 1, len(nilai) - 1)
+    return nilai[bawah] + (nilai[atas] - nilai[bawah]) * (posisi - bawah)
+
+
+def nama_tabel(query):
+    """Tabel target statement (INSERT INTO/UPDATE/DELETE FROM/LOAD DATA ... INTO TABLE), atau '-'"""
+    cocok = re.search(r"(?:INTO\s+TABLE|INSERT\s+INTO|UPDATE|DELETE\s+FROM|FROM)\s+`?([\w.]+)`?", query, re.IGNORECASE)
+    return cocok.group(1) if cocok else "-"
+
+
+class KursorTerukur:
+    """Cursor yang mencatat durasi execute/executemany ke Metrik"""
+
+    def __init__(self, cursor, metrik):
+        self._cursor = cursor
+        self._metrik = metrik
+
+    def __getattr__(self, nama):
+        return getattr(self._cursor, nama)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, query, *args, **kwargs):
+        mulai = time.perf_counter()
+        try:
+            hasil = self._cursor.execute(query, *args, **kwargs)
+        except Exception:
+            self._metrik.catat("execute", nama_tabel(query), 0, time.perf_counter() - mulai, error=True)
+            raise
+        baris = 0
+        if query.lstrip().upper().startswith(DML):
+            baris = max(self._cursor.rowcount or 0, 0)
+        self._metrik.catat("execute", nama_tabel(query), baris, time.perf_counter() - mulai)
+        return hasil
+
+    def executemany(self, query, params, *args, **kwargs):
+        mulai = time.perf_counter()
+        try:
+            hasil = self._cursor.executemany(query, params, *args, **kwargs)
+        except Exception:
+            # Batch yang gagal (dan dibelah ulang oleh penulis) tidak dihitung sebagai baris
+            self._metrik.catat("executemany", nama_tabel(query), 0, time.perf_counter() - mulai, error=True)
+            raise
+        baris = len(params) if hasattr(params, "__len__") else 0
+        self._metrik.catat("executemany", nama_tabel(query), baris, time.perf_counter() - mulai)
+        return hasil
+
+
+class KoneksiTerukur:
+    """Koneksi yang cursor() dan commit()-nya dicatat ke Metrik; atribut lain diteruskan"""
+
+    def __init__(self, connection, metrik):
+        self.asli = connection
+        self._metrik = metrik
+
+    def __getattr__(self, nama):
+        return getattr(self.asli, nama)
+
+    def cursor(self, *args, **kwargs):
+        return KursorTerukur(self.asli.cursor(*args, **kwargs), self._metrik)
+
+    def commit(self):
+        mulai = time.perf_counter()
+        try:
+            return self.asli.commit()
+        finally:
+            self._metrik.catat("commit", "-", 0, time.perf_counter() - mulai)
+
+
+class Metrik:
+    """Pengumpul latensi operasi database dan ringkasan per tahap seeding"""
+
+    def __init__(self, status_server=False):
+        self.status_server = status_server
+        self.kunci = threading.Lock()  # Writer pipeline mencatat dari beberapa thread
+        self.operasi = {}  # "operasi tabel" -> [detik per panggilan]
+        self.baris = {}  # tabel -> baris yang ditulis
+        self.gagal = {}  # "operasi tabel" -> jumlah panggilan yang melempar error
+        self.total_detik = 0.0
+        self.total_baris = 0
+        self.tahap_selesai = []
+        self.koneksi_status = None
+
+    def bungkus(self, connection):
+        """Membungkus koneksi agar operasinya dicatat; koneksi pertama juga dipakai untuk SHOW GLOBAL STATUS"""
+        if connection is None:
+            return None
+        if self.koneksi_status is None:
+            self.koneksi_status = connection
+        return KoneksiTerukur(connection, self)
+
+    def catat(self, operasi, table, baris, detik, error=False):
+        """Mencatat satu panggilan; panggilan dengan error hanya dihitung di gagal, tanpa latensi dan baris"""
+        with self.kunci:
+            self.total_detik += detik
+            if error:
+                kunci = f"{operasi} {table}"
+                self.gagal[kunci] = self.gagal.get(kunci, 0) + 1
+                return
+            self.operasi.setdefault(f"{operasi} {table}", []).append(detik)
+            if baris:
+                self.baris[table] = self.baris.get(table, 0) + baris
+                self.total_baris += baris
+
+    def data(self):
+        """Data mentah yang bisa di-pickle untuk digabung di proses utama (mode paralel)"""
+        return {"operasi": self.operasi, "baris": self.baris, "gagal": self.gagal}
+
+    def gabung(self, data):
+        with self.kunci:
+            for kunci, latensi in data["operasi"].items():
+                self.operasi.setdefault(kunci, []).extend(latensi)
+                self.total_detik += sum(latensi)
+            for table, baris in data["baris"].items():
+                self.baris[table] = self.baris.get(table, 0) + baris
+                self.total_baris += baris
+            for kunci, jumlah in data.get("gagal", {}).items():
+                self.gagal[kunci] = self.gagal.get(kunci, 0) + jumlah
+
+    def _status(self):
+        if not self.status_server or self.koneksi_status is None:
+            return {}
+        cursor = self.koneksi_status.cursor()
+        try:
+            daftar = ", ".join(f"'{nama}'" for nama in STATUS_SERVER)
+            cursor.execute(f"SHOW GLOBAL STATUS WHERE Variable_name IN ({daftar})")
+            return {nama: int(nilai) for nama, nilai in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    @contextlib.contextmanager
+    def tahap(self, nama):
+        """Mencatat waktu total, waktu database dan baris yang ditulis selama blok with"""
+        status_awal = self._status()
+        detik_awal, baris_awal = self.total_detik, self.total_baris
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            detik = time.perf_counter() - mulai
+            status_akhir = self._status()
+            hasil = {
+                "tahap": nama,
+                "detik": detik,
+                "detik_database": self.total_detik - detik_awal,
+                "baris": self.total_baris - baris_awal,
+            }
+            hasil["baris_per_detik"] = hasil["baris"] / detik if detik else None
+            if status_akhir:
+                hasil["status_server"] = {k: status_akhir[k] - status_awal.get(k, 0) for k in status_akhir}
+            self.tahap_selesai.append(hasil)
+            print(f"⏱ {nama}: {detik:.2f}s (database {hasil['detik_database']:.2f}s), "
+                  f"{hasil['baris']} baris, {hasil['baris_per_detik'] or 0:,.0f} baris/detik")
+
+    def ringkasan_operasi(self):
+        """Per operasi dan tabel: jumlah panggilan sukses dan gagal, total detik dan persentil latensi (ms)"""
+        hasil = {}
+        for kunci in sorted(set(self.operasi) | set(self.gagal)):
+            urut = sorted(self.operasi.get(kunci, []))
+            hasil[kunci] = {
+                "jumlah": len(urut),
+                "gagal": self.gagal.get(kunci, 0),
+                "total_detik": sum(urut),
+                "p50_ms": persentil(urut, 50) * 1000 if urut else None,
+                "p95_ms": persentil(urut, 95) * 1000 if urut else None,
+                "p99_ms": persentil(urut, 99) * 1000 if urut else None,
+                "max_ms": urut[-1] * 1000 if urut else None,
+            }
+        return hasil
+
+    def laporan(self):
+        """Mencetak latensi batch per operasi yang paling banyak memakan waktu"""
+        ringkasan = self.ringkasan_operasi()
+        print("\n📈 Latensi operasi database (10 teratas berdasarkan total waktu):")
+        for kunci, r in sorted(ringkasan.items(), key=lambda item: -item[1]["total_detik"])[:10]:
+            if not r["jumlah"]:
+                print(f"   {kunci}: 0x, {r['gagal']} gagal")
+                continue
+            gagal = f", {r['gagal']} gagal" if r["gagal"] else ""
+            print(f"   {kunci}: {r['jumlah']}x{gagal}, total {r['total_detik']:.2f}s, p50 {r['p50_ms']:.1f}ms, "
+                  f"p95 {r['p95_ms']:.1f}ms, p99 {r['p99_ms']:.1f}ms")
+
+    def simpan(self, path, argumen=None):
+        """Menyimpan laporan JSON: argumen, tahap, operasi dan baris per tabel"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "argumen": argumen or {},
+                "tahap": self.tahap_selesai,
+                "operasi": self.ringkasan_operasi(),
+                "baris_per_tabel": self.baris,
+            }, f, indent=2, default=str)
+        print(f"📝 Laporan metrik disimpan di {path}")
+
+
+@contextlib.contextmanager
+def profil(path):
+    """cProfile untuk thread pemanggil selama blok with, disimpan ke path (None = tidak aktif)"""
+    if not path:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"📝 Profil cProfile disimpan di {path} (baca dengan: python -m pstats {path})")
@@ -0,0 +1,266 @@
+import multiprocessing
+import os
+import random
+import tempfile
+from array import array
+
+from mysql.connector import Error, pooling
+
+import backends
+import seeder
+from maintenance import matikan_foreign_key
+from delta import watermark
+from metrics import Metrik
+from writers import InsertWriter, LoadDataWriter
+
+# Setiap proses worker menjalankan satu tugas pada satu waktu, jadi satu koneksi
+# per pool sudah cukup; pool menjaga koneksi tetap terbuka (dan di-reset) antar tugas
+POOL_SIZE = 1
+
+# Fungsi yang boleh dijalankan worker, dipanggil berdasarkan nama agar mudah di-pickle
+TULIS = {
+    "users": seeder.tulis_users,
+    "buyers_sellers": seeder.tulis_buyers_and_sellers_rentang,
+    "alamat": seeder.tulis_alamat,
+    "produk": seeder.tulis_produk_dan_varian,
+    "keranjang_wishlist": seeder.tulis_keranjang_dan_wishlist,
+    "orders": seeder.tulis_orders,
+}
+
+_pool = None
+_batch_size = None
+_bulk_dir = None
+_tanpa_fk = False
+_tolak = None
+
+
+def bagi_rentang(total, bagian):
+    """Membagi total menjadi potongan (mulai, jumlah) yang berurutan dan hampir sama besar"""
+    hasil = []
+    mulai = 0
+    for i in range(bagian):
+        jumlah = total // bagian + (1 if i < total % bagian else 0)
+        hasil.append((mulai, jumlah))
+        mulai += jumlah
+    return hasil
+
+
+def _init_worker(config, batch_size, bulk_dir, tanpa_fk=False, tolak=None):
+    """Initializer proses worker: membuat connection pool milik proses ini"""
+    global _pool, _batch_size, _bulk_dir, _tanpa_fk, _tolak
+    _batch_size = batch_size
+    _bulk_dir = bulk_dir
+    _tanpa_fk = tanpa_fk
+    _tolak = tolak
+    _pool = pooling.MySQLConnectionPool(
+        pool_name=f"seeder_{os.getpid()}",
+        pool_size=POOL_SIZE,
+        allow_local_infile=bulk_dir is not None,
+        **config
+    )
+
+
+def _jalankan(tugas):
+    """Menjalankan satu potongan tahap di worker
+
+    Mengembalikan (hasil, statistik writer, baris ditolak per tabel, data metrik).
+    """
+    nama, indeks, seed, args = tugas
+    # RNG diturunkan dari (seed, tahap, potongan) sehingga hasilnya tidak bergantung
+    # pada proses mana yang kebetulan mengerjakan potongan ini
+    benih = f"{seed}:{nama}:{indeks}"
+    random.seed(benih)
+    seeder.fake.seed_instance(benih)
+
+    metrik = Metrik()
+    connection = metrik.bungkus(_pool.get_connection())
+    try:
+        if _tanpa_fk:
+            # Session di-reset saat koneksi diambil dari pool, jadi diatur ulang per tugas
+            matikan_foreign_key(connection)
+        if _bulk_dir is not None:
+            writer = LoadDataWriter(connection, os.path.join(_bulk_dir, f"{nama}_{indeks}"), _batch_size)
+        else:
+            writer = InsertWriter(connection, _batch_size, _tolak)
+        hasil = TULIS[nama](writer, *args)
+        writer.flush()
+        return hasil, writer.statistik, writer.ditolak, metrik.data()
+    finally:
+        connection.close()  # Kembali ke pool
+
+
+class Tahap:
+    """Menjalankan tugas-tugas satu tahap di process pool dan mencatat waktunya ke Metrik"""
+
+    def __init__(self, pool, seed, writer, metrik):
+        self.pool = pool
+        self.seed = seed
+        self.writer = writer  # Statistik dan baris ditolak worker digabung ke writer proses utama
+        self.metrik = metrik
+
+    def jalankan(self, nama, daftar_args):
+        tugas = [(nama, i, self.seed, args) for i, args in enumerate(daftar_args)]
+        hasil = []
+        with self.metrik.tahap(nama):
+            for nilai, statistik, ditolak, data_metrik in self.pool.map(_jalankan, tugas):
+                hasil.append(nilai)
+                for table, (rows, detik) in statistik.items():
+                    self.writer._catat(table, rows, detik)
+                for table, jumlah in ditolak.items():
+                    self.writer.ditolak[table] = self.writer.ditolak.get(table, 0) + jumlah
+                self.metrik.gabung(data_metrik)
+        return hasil
+
+
+def seed_parallel(args, ukuran, waktu_acuan):
+    """Menjalankan seeding dengan args.workers proses, tetap mengikuti urutan foreign key
+
+    Setiap tahap dipecah menjadi args.workers potongan dengan rentang id/key yang
+    disjoint. Untuk seed dan jumlah worker yang sama, data yang dihasilkan sama.
+    Pertemanan dan pembagian tipe user tetap dijalankan serial di proses utama.
+    """
+    metrik = Metrik(args.server_status)
+    connection = metrik.bungkus(seeder.create_connection(allow_local_infile=args.bulk_load is not None))
+    if connection is None:
+        return
+
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    random.seed(f"{seed}:main")
+    seeder.fake.seed_instance(f"{seed}:main")
+
+    bulk_dir = None
+    if args.bulk_load is not None:
+        bulk_dir = args.bulk_load or tempfile.mkdtemp(prefix="bustbuy_")
+        writer = LoadDataWriter(connection, os.path.join(bulk_dir, "main"), args.batch_size)
+    else:
+        writer = InsertWriter(connection, args.batch_size, args.reject_file)
+
+    bagian = args.workers
+    try:
+        print(f"🚀 Memulai proses seeding database (scale {args.scale}, {bagian} workers, seed {seed})...")
+        with multiprocessing.Pool(bagian, initializer=_init_worker,
+                                  initargs=(backends.aktif().config, args.batch_size, bulk_dir, args.maintenance_window, args.reject_file)) as pool, \
+                seeder.jendela_pemeliharaan(connection, args):
+            tahap = Tahap(pool, seed, writer, metrik)
+
+            try:
+                total_users = ukuran["user"]
+                awal_id = seeder.reserve_ids(connection, "User", "id_user", total_users)
+                # Jumlah seller dibagi proporsional; tiap potongan memilih sellernya sendiri
+                jumlah = tahap.jalankan("users", [
+                    (mulai, n, awal_id, n_seller, args.vectorized)
+                    for (mulai, n), (_, n_seller) in zip(bagi_rentang(total_users, bagian),
+                                                         bagi_rentang(ukuran["seller"], bagian))
+                ])
+                print(f"✅ Berhasil menambahkan {sum(jumlah)} users dengan {ukuran['seller']} Sellers secara acak")
+            except Error as e:
+                connection.rollback()
+                print(f"❌ Error seeding users: {e}")
+
+            try:
+                # Worker membaca tipe user di potongan rentang id-nya sendiri secara streaming
+                bawah, atas = watermark(connection, "User", "id_user")
+                rentang = bagi_rentang(atas - bawah + 1, bagian) if bawah is not None else []
+                hasil = tahap.jalankan("buyers_sellers", [
+                    (bawah + mulai, bawah + mulai + n) for mulai, n in rentang
+                ])
+                print(f"✅ Berhasil menambahkan {sum(h[0] for h in hasil)} buyers dan {sum(h[1] for h in hasil)} sellers")
+            except Error as e:
+                print(f"❌ Error seeding buyers dan sellers: {e}")
+
+            with metrik.tahap("pertemanan"):
+                seeder.seed_pertemanan(connection, writer)
+
+            alamat_utama = seeder.AlamatUtama()
+            try:
+                max_addresses = 3
+                buyer_ids = seeder.ambil_buyer_ids(connection)
+                # Setiap potongan mendapat blok id sebesar jumlah buyer * max_addresses
+                awal_id = seeder.reserve_ids(connection, "Alamat", "id_alamat", len(buyer_ids) * max_addresses)
+                jumlah = tahap.jalankan("alamat", [
+                    (buyer_ids[mulai:mulai + n], max_addresses, awal_id + mulai * max_addresses, args.vectorized)
+                    for mulai, n in bagi_rentang(len(buyer_ids), bagian)
+                ])
+                alamat_utama = seeder.ambil_alamat_utama(connection)
+                print(f"✅ Berhasil menambahkan {sum(jumlah)} alamat")
+            except Error as e:
+                print(f"❌ Error seeding alamat: {e}")
+
+            katalog = seeder.Katalog()
+            try:
+                seller_ids = seeder.ambil_verified_seller_ids(connection)
+                if not seller_ids:
+                    print("⚠ Tidak ada verified seller. Lewati seeding produk.")
+                else:
+                    # Seller dibagi antar potongan agar nama produk per seller tetap unik
+                    potongan_seller = [p for p in bagi_rentang(len(seller_ids), bagian) if p[1]]
+                    count = ukuran["produk"]
+                    awal_id = seeder.reserve_ids(connection, "Produk", "id_produk", count)
+                    daftar_args = []
+                    for (mulai, n), (mulai_produk, n_produk) in zip(potongan_seller, bagi_rentang(count, len(potongan_seller))):
+                        daftar_args.append((seller_ids[mulai:mulai + n], awal_id + mulai_produk, n_produk))
+                    hasil = tahap.jalankan("produk", daftar_args)
+                    katalog = seeder.Katalog.gabung(h[0] for h in hasil)
+                    print(f"✅ Berhasil menambahkan {len(katalog)} produk, {sum(h[1] for h in hasil)} varian, "
+                          f"{sum(h[2] for h in hasil)} tag, dan {sum(h[3] for h in hasil)} gambar")
+            except Error as e:
+                print(f"❌ Error seeding produk: {e}")
+
+            # Bobot popularitas dihitung sekali agar semua potongan memakai urutan yang sama
+            bobot_produk = seeder.bobot_zipf(len(katalog), args.zipf) if args.zipf else None
+
+            try:
+                buyer_ids = seeder.ambil_buyer_ids(connection)
+                if not buyer_ids or not katalog:
+                    print("⚠ Tidak ada data buyer atau produk. Lewati seeding keranjang dan wishlist.")
+                else:
+                    potongan = bagi_rentang(len(buyer_ids), bagian)
+                    min_keranjang = bagi_rentang(ukuran["keranjang_min"], bagian)
+                    min_wishlist = bagi_rentang(ukuran["wishlist_min"], bagian)
+                    # Blok id_keranjang per potongan: paling banyak 5 item per buyer + minimal tambahan
+                    blok = [n * 5 + k[1] for (_, n), k in zip(potongan, min_keranjang)]
+                    awal_id = seeder.reserve_ids(connection, "Keranjang", "id_keranjang", sum(blok))
+                    hasil = tahap.jalankan("keranjang_wishlist", [
+                        (buyer_ids[mulai:mulai + n], katalog, k[1], w[1], awal_id + sum(blok[:i]), bobot_produk)
+                        for i, ((mulai, n), k, w) in enumerate(zip(potongan, min_keranjang, min_wishlist))
+                    ])
+                    print(f"✅ Berhasil menambahkan {sum(h[0] for h in hasil)} item keranjang dan {sum(h[1] for h in hasil)} item wishlist")
+            except Error as e:
+                print(f"❌ Error seeding keranjang dan wishlist: {e}")
+
+            try:
+                if not alamat_utama or not katalog:
+                    print("⚠ Tidak cukup data untuk seeding orders. Diperlukan buyer dengan alamat dan produk.")
+                else:
+                    jumlah_order = min(ukuran["order"], len(alamat_utama) * len(katalog))
+                    awal_id = seeder.reserve_ids(connection, "Orders", "id_order", jumlah_order)
+                    # Blok id_ulasan per potongan: paling banyak 3 ulasan per order
+                    awal_id_ulasan = seeder.reserve_ids(connection, "Ulasan", "id_ulasan", jumlah_order * 3)
+                    # Dengan --inventory setiap potongan mendapat bagian stok sendiri
+                    stok = katalog.bagi_stok(bagian) if args.inventory else [None] * bagian
+                    kolom_waktu = seeder.layout_berpartisi(connection)
+                    hasil = tahap.jalankan("orders", [
+                        (katalog, alamat_utama, awal_id + mulai, n, waktu_acuan, awal_id_ulasan + mulai * 3,
+                         bobot_produk, stok[i], args.history_years, kolom_waktu)
+                        for i, (mulai, n) in enumerate(bagi_rentang(jumlah_order, bagian))
+                    ])
+                    print(f"✅ Berhasil menambahkan {sum(h[0] for h in hasil)} orders, {sum(h[1] for h in hasil)} product instances, "
+                          f"dan {sum(h[2] for h in hasil)} ulasan")
+                    if args.inventory:
+                        terjual = array("i", map(sum, zip(*(h[3] for h in hasil))))
+                        jumlah_varian = seeder.terapkan_pengurangan_stok(connection, katalog, terjual, args.batch_size)
+                        print(f"✅ Stok {jumlah_varian} varian dikurangi sebanyak {sum(terjual)} unit terjual")
+            except Error as e:
+                print(f"❌ Error seeding orders: {e}")
+
+        writer.laporan()
+        seeder.pulihkan_ringkasan(connection, args)
+        seeder.validasi_pemeliharaan(connection, args)
+        if args.metrics:
+            metrik.laporan()
+            metrik.simpan(args.metrics, vars(args))
+        print("\n🎉 Database seeding berhasil diselesaikan!")
+    finally:
+        if connection and connection.is_connected():
+            connection.close()
+            print("🔌 Koneksi database ditutup")
@@ -0,0 +1,286 @@
+import argparse
+import json
+import random
+from datetime import date, datetime
+
+from mysql.connector import Error
+
+import seeder
+from maintenance import ambil_trigger, matikan_foreign_key
+from workload import explain, jalankan_query
+
+# Layout berpartisi untuk histori order (seeder.py --history-years): Orders,
+# InstProduk dan Ulasan dipartisi RANGE per bulan pemesanan. Karena itu
+# InstProduk dan Ulasan ikut menyimpan waktu_pemesanan order-nya, dan kolom
+# partisi masuk ke setiap PRIMARY KEY.
+#
+# waktu_pemesanan di InstProduk dan Ulasan adalah salinan waktu order, jadi DEFAULT
+# ditulis eksplisit tanpa ON UPDATE: tanpa itu MariaDB < 10.10 (atau
+# explicit_defaults_for_timestamp=OFF) menjadikan kolom TIMESTAMP pertama
+# DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP dan setiap UPDATE ke baris
+# menggeser waktunya. Semua penulis tetap harus mengisi kolom ini.
+#
+# Batasan InnoDB: tabel berpartisi tidak bisa punya FOREIGN KEY (baik sebagai
+# anak maupun induk), jadi FK Orders/InstProduk/Ulasan hilang di layout ini dan
+# hanya index-nya yang dipertahankan. Integritasnya dicek ulang dengan
+# maintenance.validasi. Trigger tetap didukung dan dibuat ulang oleh `apply`.
+#
+# Perintah:
+#   schema  mencetak DDL layout berpartisi untuk rentang bulan tertentu
+#   apply   mengubah tabel yang sudah terisi ke layout berpartisi
+#   bench   membandingkan query laporan bulanan di tabel biasa vs salinan berpartisi
+
+TABEL_BERPARTISI = ("Orders", "InstProduk", "Ulasan")
+
+# Banyak partisi bulanan kosong yang disiapkan setelah bulan berjalan (`apply`)
+BULAN_KE_DEPAN = 12
+
+DDL = {
+    "Orders": """CREATE TABLE `Orders{akhiran}` (
+    id_order INT NOT NULL AUTO_INCREMENT,
+    id_user INT NOT NULL,
+    id_alamat INT NOT NULL,
+    status_order ENUM('belum dibayar', 'disiapkan', 'dikirim', 'sampai', 'dibatalkan')
+        NOT NULL DEFAULT 'belum dibayar',
+    metode_pembayaran VARCHAR(255) NOT NULL,
+    metode_pengiriman VARCHAR(255) NOT NULL,
+    waktu_pemesanan TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    catatan VARCHAR(255),
+
+    PRIMARY KEY (id_order, waktu_pemesanan),
+    KEY (id_user),
+    KEY (id_alamat)
+)""",
+    "InstProduk": """CREATE TABLE `InstProduk{akhiran}` (
+    id_order INT NOT NULL,
+    id_produk INT NOT NULL,
+    sku VARCHAR(255) NOT NULL,
+    kuantitas INT NOT NULL DEFAULT 1,
+    waktu_pemesanan TIMESTAMP NOT NULL DEFAULT '1970-01-01 00:00:01',
+
+    PRIMARY KEY (id_order, id_produk, sku, waktu_pemesanan),
+    KEY (sku, id_produk)
+)""",
+    "Ulasan": """CREATE TABLE `Ulasan{akhiran}` (
+    id_ulasan INT NOT NULL AUTO_INCREMENT,
+    id_order INT NOT NULL,
+    id_produk INT NOT NULL,
+    nilai INT NOT NULL CHECK (nilai BETWEEN 1 AND 5),
+    komentar TEXT,
+    waktu_pemesanan TIMESTAMP NOT NULL DEFAULT '1970-01-01 00:00:01',
+
+    PRIMARY KEY (id_ulasan, waktu_pemesanan),
+    KEY (id_order),
+    KEY (id_produk)
+)""",
+}
+
+# Salin data dari layout biasa; InstProduk dan Ulasan mengambil waktu dari Orders
+SALIN = {
+    "Orders": """INSERT INTO `Orders{akhiran}`
+    SELECT id_order, id_user, id_alamat, status_order, metode_pembayaran,
+           metode_pengiriman, waktu_pemesanan, catatan
+    FROM Orders""",
+    "InstProduk": """INSERT INTO `InstProduk{akhiran}`
+    SELECT ip.id_order, ip.id_produk, ip.sku, ip.kuantitas, o.waktu_pemesanan
+    FROM InstProduk ip JOIN Orders o ON o.id_order = ip.id_order""",
+    "Ulasan": """INSERT INTO `Ulasan{akhiran}`
+    SELECT u.id_ulasan, u.id_order, u.id_produk, u.nilai, u.komentar, o.waktu_pemesanan
+    FROM Ulasan u JOIN Orders o ON o.id_order = u.id_order""",
+}
+
+# Query laporan bulanan: (layout biasa, layout berpartisi). Di layout biasa
+# InstProduk dan Ulasan harus di-join ke Orders untuk memfilter bulan.
+QUERY_BULANAN = {
+    "order_per_status": (
+        """SELECT status_order, COUNT(*) FROM Orders
+        WHERE waktu_pemesanan >= %(bulan)s AND waktu_pemesanan < %(bulan)s + INTERVAL 1 MONTH
+        GROUP BY status_order""",
+        """SELECT status_order, COUNT(*) FROM Orders_partisi
+        WHERE waktu_pemesanan >= %(bulan)s AND waktu_pemesanan < %(bulan)s + INTERVAL 1 MONTH
+        GROUP BY status_order""",
+    ),
+    "penjualan_per_produk": (
+        """SELECT ip.id_produk, SUM(ip.kuantitas) FROM InstProduk ip
+        JOIN Orders o ON o.id_order = ip.id_order
+        WHERE o.waktu_pemesanan >= %(bulan)s AND o.waktu_pemesanan < %(bulan)s + INTERVAL 1 MONTH
+        GROUP BY ip.id_produk""",
+        """SELECT id_produk, SUM(kuantitas) FROM InstProduk_partisi
+        WHERE waktu_pemesanan >= %(bulan)s AND waktu_pemesanan < %(bulan)s + INTERVAL 1 MONTH
+        GROUP BY id_produk""",
+    ),
+    "rating_per_produk": (
+        """SELECT u.id_produk, AVG(u.nilai), COUNT(*) FROM Ulasan u
+        JOIN Orders o ON o.id_order = u.id_order
+        WHERE o.waktu_pemesanan >= %(bulan)s AND o.waktu_pemesanan < %(bulan)s + INTERVAL 1 MONTH
+        GROUP BY u.id_produk""",
+        """SELECT id_produk, AVG(nilai), COUNT(*) FROM Ulasan_partisi
+        WHERE waktu_pemesanan >= %(bulan)s AND waktu_pemesanan < %(bulan)s + INTERVAL 1 MONTH
+        GROUP BY id_produk""",
+    ),
+}
+
+
+def daftar_bulan(awal, akhir):
+    """Tanggal 1 setiap bulan dari bulan awal sampai bulan akhir (inklusif)"""
+    tahun, bulan = awal.year, awal.month
+    hasil = []
+    while (tahun, bulan) <= (akhir.year, akhir.month):
+        hasil.append(date(tahun, bulan, 1))
+        tahun, bulan = (tahun + 1, 1) if bulan == 12 else (tahun, bulan + 1)
+    return hasil
+
+
+def klausa_partisi(bulan):
+    """PARTITION BY RANGE satu partisi per bulan, ditutup partisi pmax untuk sisa waktu"""
+    partisi = []
+    for awal, berikut in zip(bulan, bulan[1:] + [None]):
+        if berikut is None:
+            berikut = date(awal.year + awal.month // 12, awal.month % 12 + 1, 1)
+        partisi.append(f"    PARTITION p{awal:%Y%m} VALUES LESS THAN (UNIX_TIMESTAMP('{berikut:%Y-%m-%d}'))")
+    partisi.append("    PARTITION pmax VALUES LESS THAN MAXVALUE")
+    # Kolom TIMESTAMP hanya bisa dipartisi RANGE lewat UNIX_TIMESTAMP()
+    return "PARTITION BY RANGE (UNIX_TIMESTAMP(waktu_pemesanan)) (\n" + ",\n".join(partisi) + "\n)"
+
+
+def ddl_berpartisi(bulan, akhiran=""):
+    """Statement CREATE TABLE layout berpartisi untuk Orders, InstProduk dan Ulasan"""
+    partisi = klausa_partisi(bulan)
+    return [DDL[table].format(akhiran=akhiran) + "\n" + partisi for table in TABEL_BERPARTISI]
+
+
+def rentang_bulan_data(connection, ke_depan=0):
+    """Bulan dari order tertua sampai ke_depan bulan setelah bulan ini"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT MIN(waktu_pemesanan) FROM Orders")
+        tertua = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    sekarang = datetime.now()
+    akhir_bulan = sekarang.year * 12 + sekarang.month - 1 + ke_depan
+    return daftar_bulan(tertua or sekarang, date(akhir_bulan // 12, akhir_bulan % 12 + 1, 1))
+
+
+def buat_salinan(connection, bulan, akhiran):
+    """Membuat tabel berpartisi dengan akhiran lalu menyalin data dari layout biasa"""
+    cursor = connection.cursor()
+    try:
+        for table in reversed(TABEL_BERPARTISI):
+            cursor.execute(f"DROP TABLE IF EXISTS `{table}{akhiran}`")
+        for statement in ddl_berpartisi(bulan, akhiran):
+            cursor.execute(statement)
+        for table in TABEL_BERPARTISI:
+            cursor.execute(SALIN[table].format(akhiran=akhiran))
+        connection.commit()
+    finally:
+        cursor.close()
+
+
+def hapus_salinan(connection, akhiran):
+    cursor = connection.cursor()
+    try:
+        for table in reversed(TABEL_BERPARTISI):
+            cursor.execute(f"DROP TABLE IF EXISTS `{table}{akhiran}`")
+    finally:
+        cursor.close()
+
+
+def terapkan(connection):
+    """Mengubah Orders, InstProduk dan Ulasan yang sudah terisi ke layout berpartisi
+
+    Data disalin ke tabel baru, tabel lama di-drop lalu tabel baru di-rename, dan
+    trigger di ketiga tabel dibuat ulang. DDL tidak transaksional: jalankan saat
+    tidak ada penulisan lain.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            """SELECT TRIGGER_NAME FROM information_schema.TRIGGERS
+            WHERE TRIGGER_SCHEMA = DATABASE() AND EVENT_OBJECT_TABLE IN ('Orders', 'InstProduk', 'Ulasan')"""
+        )
+        nama_trigger = {row[0] for row in cursor.fetchall()}
+        trigger = [(nama, statement) for nama, statement in ambil_trigger(connection) if nama in nama_trigger]
+
+        bulan = rentang_bulan_data(connection, BULAN_KE_DEPAN)
+        buat_salinan(connection, bulan, "_baru")
+        matikan_foreign_key(connection)
+        for table in reversed(TABEL_BERPARTISI):
+            cursor.execute(f"DROP TABLE `{table}`")
+        cursor.execute("RENAME TABLE " + ", ".join(f"`{t}_baru` TO `{t}`" for t in TABEL_BERPARTISI))
+        matikan_foreign_key(connection, False)
+        for _, statement in trigger:
+            cursor.execute(statement)
+        return len(bulan)
+    finally:
+        cursor.close()
+
+
+def bench(connection, ulang):
+    """Menjalankan QUERY_BULANAN di layout biasa dan salinan berpartisi, mengembalikan laporan"""
+    if seeder.layout_berpartisi(connection):
+        print("⚠ Tabel sudah memakai layout berpartisi, tidak ada layout biasa untuk dibandingkan")
+        return {}
+
+    bulan = rentang_bulan_data(connection)
+    print(f"📦 Membuat salinan berpartisi ({len(bulan)} partisi bulanan)...")
+    buat_salinan(connection, bulan, "_partisi")
+    try:
+        kandidat = {"bulan": [b.isoformat() for b in bulan]}
+        laporan = {}
+        for nama, (query_biasa, query_partisi) in QUERY_BULANAN.items():
+            biasa = jalankan_query(connection, query_biasa, kandidat, ulang)
+            partisi = jalankan_query(connection, query_partisi, kandidat, ulang)
+            # EXPLAIN PARTITIONS (MariaDB) menampilkan partisi yang tersisa setelah pruning
+            plan = explain(connection, "PARTITIONS " + query_partisi, {"bulan": random.choice(kandidat["bulan"])})
+            partisi["partisi_dibaca"] = [r.get("partitions") for r in plan]
+            laporan[nama] = {"biasa": biasa, "berpartisi": partisi}
+            print(f"   {nama}: biasa p50 {biasa['p50_ms']:.2f}ms p95 {biasa['p95_ms']:.2f}ms | "
+                  f"berpartisi p50 {partisi['p50_ms']:.2f}ms p95 {partisi['p95_ms']:.2f}ms "
+                  f"[{', '.join(str(p) for p in partisi['partisi_dibaca'])}]")
+        return laporan
+    finally:
+        hapus_salinan(connection, "_partisi")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Layout Orders/InstProduk/Ulasan berpartisi per bulan")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+    schema = sub.add_parser("schema", help="Cetak DDL layout berpartisi")
+    schema.add_argument("--from", dest="dari", required=True, metavar="YYYY-MM", help="Bulan partisi pertama")
+    schema.add_argument("--to", dest="sampai", required=True, metavar="YYYY-MM", help="Bulan partisi terakhir")
+    sub.add_parser("apply", help="Ubah tabel yang sudah terisi ke layout berpartisi")
+    benchmark = sub.add_parser("bench", help="Bandingkan query bulanan di tabel biasa vs berpartisi")
+    benchmark.add_argument("--repeat", type=int, default=50, help="Jumlah eksekusi per query per layout")
+    benchmark.add_argument("--output", default="partition_report.json", help="File laporan JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.perintah == "schema":
+        bulan = daftar_bulan(datetime.strptime(args.dari, "%Y-%m"), datetime.strptime(args.sampai, "%Y-%m"))
+        print(";\n\n".join(ddl_berpartisi(bulan)) + ";")
+        return
+
+    connection = seeder.create_connection()
+    if connection is None:
+        return
+    try:
+        if args.perintah == "apply":
+            jumlah = terapkan(connection)
+            print(f"✅ Orders, InstProduk dan Ulasan dipartisi menjadi {jumlah} partisi bulanan + pmax")
+        else:
+            laporan = bench(connection, args.repeat)
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(laporan, f, indent=2, default=str)
+            print(f"\n📝 Laporan disimpan di {args.output}")
+    except Error as e:
+        connection.rollback()
+        print(f"❌ Error: {e}")
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
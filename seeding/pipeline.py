@@ -0,0 +1,300 @@
+import queue
+import threading
+import time
+
+from mysql.connector import Error
+
+import backends
+from maintenance import matikan_foreign_key
+from writers import InsertWriter, chunked, insert_query
+
+# Writer pipeline: fungsi tulis_* (produsen, thread pemanggil) terus membuat batch
+# sementara beberapa thread penulis, masing-masing dengan koneksi sendiri, menjalankan
+# executemany + commit dari antrian terbatas. Antrian penuh membuat produsen menunggu
+# (backpressure) sehingga memori tetap datar.
+#
+# Urutan foreign key dijaga per batch, bukan per tabel: batch tabel anak menunggu
+# batch tabel induk yang dikirim sebelumnya dan belum selesai (misalnya batch
+# VarianProduk menunggu batch Produk pemilik variannya), sementara batch lain tetap
+# berjalan paralel. Batch satu tabel ditulis berurutan (menunggu batch sebelumnya di
+# tabel yang sama), sehingga id AUTO_INCREMENT sama dengan InsertWriter biasa dan
+# insert ke tabel yang sama tidak saling berebut lock.
+#
+# `python pipeline.py --database bustbuy_cek` menjalankan seeder serial lalu --pipeline ke
+# database kosong dan memastikan isi setiap tabel keduanya sama (jumlah baris dan
+# checksum SUM(CRC32) per baris yang tidak bergantung urutan).
+
+# Tabel induk per tabel (FOREIGN KEY, plus InstProduk untuk trigger ulasan_validation)
+INDUK = {
+    "User": (),
+    "Pertemanan": ("User",),
+    "Seller": ("User",),
+    "Buyer": ("User",),
+    "Alamat": ("Buyer",),
+    "Produk": ("Seller",),
+    "VarianProduk": ("Produk",),
+    "InstTag": ("Produk",),
+    "InstGambar": ("Produk",),
+    "Keranjang": ("Buyer", "VarianProduk"),
+    "Wishlist": ("Buyer", "Produk"),
+    "Orders": ("Buyer", "Alamat"),
+    "InstProduk": ("Orders", "VarianProduk"),
+    "Ulasan": ("Orders", "Produk", "InstProduk"),
+}
+
+# Batch yang boleh mengantre per thread penulis sebelum produsen ditahan
+KEDALAMAN_PER_THREAD = 2
+
+# Deadlock (1213) dan lock wait timeout (1205) antar thread penulis diulang
+ERRNO_ULANG = (1205, 1213)
+BATAS_ULANG = 3
+
+
+class PipelineWriter(InsertWriter):
+    """InsertWriter yang menjalankan batch di thread penulis sementara pemanggil terus membuat data
+
+    buat_koneksi dipanggil sekali per thread penulis. write() hanya mengantrekan
+    batch; flush() menunggu semua batch selesai, dan error dari thread penulis
+    dilempar ulang di thread pemanggil pada write()/flush() berikutnya.
+    """
+
+    def __init__(self, connection, buat_koneksi, threads=2, batch_size=1000, tanpa_fk=False, tolak=None):
+        super().__init__(connection, batch_size, tolak)
+        self.antrian = queue.Queue(maxsize=threads * KEDALAMAN_PER_THREAD)
+        self.tertunda = {}  # tabel -> [threading.Event batch yang belum selesai]
+        self.kunci = threading.Lock()
+        self.error = None
+        # Pengukuran overlap
+        self.mulai = time.perf_counter()
+        self.tunggu_produsen = 0.0
+        self.aktif = 0
+        self.mulai_sibuk = 0.0
+        self.sibuk_database = 0.0
+        self.threads = []
+        self.koneksi = []
+        for i in range(threads):
+            koneksi = buat_koneksi()
+            if koneksi is None:
+                raise Error("Tidak bisa membuat koneksi untuk thread penulis")
+            if tanpa_fk:
+                matikan_foreign_key(koneksi)
+            self.koneksi.append(koneksi)
+            thread = threading.Thread(target=self._penulis, args=(koneksi,), name=f"penulis-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _penulis(self, connection):
+        cursor = connection.cursor()
+        try:
+            while True:
+                item = self.antrian.get()
+                if item is None:
+                    self.antrian.task_done()
+                    return
+                selesai, dependensi, table, query, batch = item
+                try:
+                    for event in dependensi:
+                        event.wait()
+                    if self.error is None:
+                        self._eksekusi(connection, cursor, table, query, batch)
+                except Error as e:
+                    connection.rollback()
+                    if self.error is None:
+                        self.error = e
+                finally:
+                    selesai.set()
+                    self.antrian.task_done()
+        finally:
+            cursor.close()
+
+    def _eksekusi(self, connection, cursor, table, query, batch):
+        with self.kunci:
+            if self.aktif == 0:
+                self.mulai_sibuk = time.perf_counter()
+            self.aktif += 1
+        mulai = time.perf_counter()
+        try:
+            for percobaan in range(BATAS_ULANG):
+                try:
+                    jumlah = self._tulis_batch(connection, cursor, table, query, batch)
+                    break
+                except Error as e:
+                    if e.errno not in ERRNO_ULANG or percobaan == BATAS_ULANG - 1:
+                        raise
+            with self.kunci:
+                self._catat(table, jumlah, time.perf_counter() - mulai)
+        finally:
+            with self.kunci:
+                self.aktif -= 1
+                if self.aktif == 0:
+                    self.sibuk_database += time.perf_counter() - self.mulai_sibuk
+
+    def _periksa(self):
+        """Melempar error thread penulis (setelah antrian kosong) di thread pemanggil"""
+        if self.error is not None:
+            self._tunggu(self.antrian.join)
+            error, self.error = self.error, None
+            raise error
+
+    def _tunggu(self, fungsi, *args):
+        mulai = time.perf_counter()
+        try:
+            return fungsi(*args)
+        finally:
+            self.tunggu_produsen += time.perf_counter() - mulai
+
+    def write(self, table, columns, rows):
+        query = insert_query(table, columns)
+        tertunda = self.tertunda.setdefault(table, [])
+        total = 0
+        for batch in chunked(rows, self.batch_size):
+            self._periksa()
+            dependensi = []
+            for induk in INDUK.get(table, ()):
+                daftar = self.tertunda.get(induk, [])
+                daftar[:] = [event for event in daftar if not event.is_set()]
+                dependensi.extend(daftar)
+            tertunda[:] = [event for event in tertunda if not event.is_set()]
+            if tertunda:
+                dependensi.append(tertunda[-1])
+            selesai = threading.Event()
+            tertunda.append(selesai)
+            self._tunggu(self.antrian.put, (selesai, dependensi, table, query, batch))
+            total += len(batch)
+        return total
+
+    def flush(self):
+        """Menunggu semua batch yang sudah diantrekan selesai ditulis
+
+        Koneksi utama ikut di-commit agar read view REPEATABLE READ-nya berakhir dan
+        query tahap berikutnya (ambil_buyer_ids, dst.) melihat baris dari thread penulis.
+        """
+        self._tunggu(self.antrian.join)
+        self._periksa()
+        self.connection.commit()
+
+    def tutup(self):
+        for _ in self.threads:
+            self.antrian.put(None)
+        for thread in self.threads:
+            thread.join()
+        for koneksi in self.koneksi:
+            koneksi.close()
+
+    def laporan(self):
+        super().laporan()
+        total = time.perf_counter() - self.mulai
+        generator = total - self.tunggu_produsen
+        database = self.sibuk_database
+        # Bagian dari tahap yang lebih pendek yang tertutup tahap lain
+        overlap = (generator + database - total) / min(generator, database) if min(generator, database) > 0 else 0.0
+        print(f"🔀 Pipeline {len(self.threads)} thread penulis: total {total:.2f}s, generator {generator:.2f}s, "
+              f"database {database:.2f}s, overlap {max(0.0, overlap) * 100:.0f}% "
+              f"(produsen menunggu {self.tunggu_produsen:.2f}s)")
+
+
+def hitung_baris(connection, tables):
+    """Jumlah baris per tabel"""
+    cursor = connection.cursor()
+    try:
+        hasil = {}
+        for table in tables:
+            cursor.execute(f"SELECT COUNT(*) FROM `{table}`")
+            hasil[table] = cursor.fetchone()[0]
+        connection.commit()
+        return hasil
+    finally:
+        cursor.close()
+
+
+def checksum_tabel(connection, tables):
+    """(jumlah baris, SUM(CRC32) semua kolom per baris) per tabel; tidak bergantung urutan baris"""
+    backend = backends.aktif()
+    cursor = connection.cursor()
+    try:
+        hasil = {}
+        for table in tables:
+            # CONCAT_WS melewatkan argumen NULL, jadi NULL diganti penanda agar posisinya tetap terhitung
+            kolom = ", ".join(f"IFNULL(`{k}`, '<null>')" for k in backend.kolom(connection, table))
+            cursor.execute(f"SELECT COUNT(*), COALESCE(SUM(CRC32(CONCAT_WS('#', {kolom}))), 0) FROM `{table}`")
+            jumlah, checksum = cursor.fetchone()
+            hasil[table] = (jumlah, int(checksum))
+        connection.commit()
+        return hasil
+    finally:
+        cursor.close()
+
+
+def kosongkan(connection, tables):
+    """Mengosongkan tables dengan TRUNCATE, sehingga AUTO_INCREMENT putaran berikutnya mulai dari awal lagi"""
+    matikan_foreign_key(connection)
+    cursor = connection.cursor()
+    try:
+        for table in tables:
+            cursor.execute(f"TRUNCATE TABLE `{table}`")
+        connection.commit()
+    finally:
+        cursor.close()
+        matikan_foreign_key(connection, False)
+
+
+def cek(argv=None):
+    """Membandingkan isi setiap tabel hasil mode serial dan --pipeline untuk seed dan scale yang sama
+
+    seeder.main dijalankan dua kali ke database yang harus kosong (gunakan database
+    khusus lewat --database) dan tabel dikosongkan lagi setelah setiap putaran.
+    Per tabel (termasuk tabel ringkasan jika ada) dibandingkan jumlah baris dan
+    checksum_tabel, jadi baris yang tertukar atau berubah isinya ikut terdeteksi.
+    Mengembalikan True jika semua tabel sama.
+    """
+    import argparse
+    import seeder
+    import summary
+
+    parser = argparse.ArgumentParser(description="Cek mode --pipeline menghasilkan data yang sama dengan mode serial")
+    parser.add_argument("--database", default=None, metavar="NAME",
+                        help="Database MariaDB kosong untuk pengecekan (default DB_NAME di .env)")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    backends.pilih("mariadb", database=args.database)
+    connection = seeder.create_connection()
+    if connection is None:
+        return False
+    try:
+        if hitung_baris(connection, ("User",))["User"]:
+            print("❌ Database tidak kosong; cek mengosongkan tabel, gunakan database khusus (--database)")
+            return False
+        tables = seeder.TABLES + (summary.TABEL_RINGKASAN if summary.ringkasan_tersedia(connection) else ())
+        hasil = {}
+        for mode, tambahan in (("serial", []), ("pipeline", ["--pipeline", str(args.threads)])):
+            print(f"\n🔍 Seeding mode {mode}...")
+            argumen = ["--backend", "mariadb", "--scale", str(args.scale), "--seed", str(args.seed)]
+            if args.database:
+                argumen += ["--database", args.database]
+            seeder.main(argumen + tambahan)
+            hasil[mode] = checksum_tabel(connection, tables)
+            kosongkan(connection, tables)
+    finally:
+        connection.close()
+
+    sama = True
+    print()
+    for table in tables:
+        (baris_serial, serial), (baris_pipeline, pipeline) = hasil["serial"][table], hasil["pipeline"][table]
+        if (baris_serial, serial) != (baris_pipeline, pipeline):
+            sama = False
+            print(f"❌ {table}: serial {baris_serial} baris (checksum {serial}), "
+                  f"pipeline {baris_pipeline} baris (checksum {pipeline})")
+    if sama:
+        total = sum(baris for baris, _ in hasil["serial"].values())
+        print(f"✅ Mode pipeline dan serial sama: {total} baris di {len(tables)} tabel (jumlah baris dan checksum)")
+    return sama
+
+
+if __name__ == "__main__":
+    # python pipeline.py [--database NAME] [--scale S] [--seed N] [--threads T]
+    if not cek():
+        raise SystemExit(1)
@@ -0,0 +1,92 @@
+import random
+from array import array
+
+# Sampler indeks 0..n-1 yang dibangun sekali lalu dipakai berulang kali dengan
+# biaya O(1) per sampel. Semua sampler memakai modul random sehingga mengikuti
+# --seed dan seed per potongan di mode paralel.
+
+# Batas percobaan rejection per item sebelum beralih ke pemilihan dari sisa kandidat
+BATAS_PERCOBAAN = 64
+
+
+class UniformSampler:
+    """Sampler indeks 0..n-1 dengan peluang sama"""
+
+    __slots__ = ("n",)
+
+    def __init__(self, n):
+        self.n = n
+
+    def ambil(self):
+        return int(random.random() * self.n)
+
+
+class AliasSampler:
+    """Sampler indeks 0..n-1 sebanding bobot dengan metode alias (Vose): O(n) build, O(1) per sampel"""
+
+    __slots__ = ("n", "prob", "alias")
+
+    def __init__(self, bobot):
+        self.n = n = len(bobot)
+        total = float(sum(bobot))
+        skala = [b * n / total for b in bobot]
+        self.prob = array("d", bytes(8 * n))
+        self.alias = array("q", bytes(8 * n))
+        kecil = [i for i, p in enumerate(skala) if p < 1.0]
+        besar = [i for i, p in enumerate(skala) if p >= 1.0]
+        while kecil and besar:
+            k = kecil.pop()
+            b = besar[-1]
+            self.prob[k] = skala[k]
+            self.alias[k] = b
+            skala[b] -= 1.0 - skala[k]
+            if skala[b] < 1.0:
+                kecil.append(besar.pop())
+        # Sisa (karena pembulatan floating point) selalu memilih dirinya sendiri
+        for i in kecil + besar:
+            self.prob[i] = 1.0
+            self.alias[i] = i
+
+    def ambil(self):
+        u = random.random() * self.n
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+
+def buat_sampler(n, bobot=None):
+    """Sampler untuk n indeks; uniform jika bobot None, selain itu metode alias"""
+    if bobot is None:
+        return UniformSampler(n)
+    return AliasSampler(bobot)
+
+
+def bobot_zipf(n, s=1.0):
+    """Bobot popularitas gaya Zipf (peringkat^-s) dengan peringkat diacak antar indeks"""
+    peringkat = list(range(1, n + 1))
+    random.shuffle(peringkat)
+    return array("d", (r ** -s for r in peringkat))
+
+
+def ambil_berbeda(sampler, k, kecuali=()):
+    """Mengambil sampai k indeks berbeda yang tidak ada di kecuali dengan rejection
+
+    Biaya O(k) selama k jauh lebih kecil dari n. Jika rejection terlalu sering
+    gagal (k mendekati jumlah kandidat, atau bobot sangat timpang), sisa item
+    dipilih dari kandidat yang tersisa agar tetap selesai.
+    """
+    terpilih = []
+    sudah = set()
+    tersedia = sampler.n - sum(1 for i in kecuali if 0 <= i < sampler.n)
+    k = min(k, tersedia)
+    percobaan = 0
+    while len(terpilih) < k and percobaan < BATAS_PERCOBAAN * k:
+        i = sampler.ambil()
+        percobaan += 1
+        if i in sudah or i in kecuali:
+            continue
+        sudah.add(i)
+        terpilih.append(i)
+    if len(terpilih) < k:
+        sisa = [i for i in range(sampler.n) if i not in sudah and i not in kecuali]
+        terpilih.extend(random.sample(sisa, k - len(terpilih)))
+    return terpilih
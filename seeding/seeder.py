@@ -1,31 +1,60 @@
-import mysql.connector
 from mysql.connector import Error
 from faker import Faker
 from datetime import datetime, timedelta
+from array import array
+import argparse
+import contextlib
 import random
+import tempfile
 import os
-from dotenv import load_dotenv
+from writers import MAX_PACKET, InsertWriter, LoadDataWriter, chunked, insert_query
+from identity import nama_unik, email_unik
+from catalog import AlamatUtama, Katalog
+from samplers import ambil_berbeda, bobot_zipf, buat_sampler
+from timeseries import WaktuOrderSampler
+from metrics import Metrik, profil
+import backends
 
 # Inisialisasi Faker untuk bahasa Indonesia
 fake = Faker('id_ID')
 
-load_dotenv()
+# Ukuran setiap tabel pada scale factor 1 (ukuran seeder awal)
+UKURAN_DASAR = {
+    "user": 100,
+    "seller": 50,
+    "produk": 100,
+    "order": 200,
+    "keranjang_min": 150,
+    "wishlist_min": 100,
+}
 
-def create_connection():
-    """Membuat koneksi ke database MariaDB"""
+# Jumlah baris per batch yang di-commit
+BATCH_SIZE = 1000
+
+def hitung_ukuran(scale):
+    """Menghitung ukuran setiap tabel secara proporsional terhadap scale factor"""
+    return {nama: max(1, int(round(jumlah * scale))) for nama, jumlah in UKURAN_DASAR.items()}
+
+
+def create_connection(allow_local_infile=False):
+    """Membuat koneksi ke backend aktif (MariaDB, atau SQLite dengan --backend sqlite)"""
+    backend = backends.aktif()
     try:
-        connection = mysql.connector.connect(
-            host = 'localhost',
-            user = 'root',
-            password = 'hakuryuutoranosuke97',
-            database = 'bustbuy12'  # Updated to match schema
-        )
-        return connection
+        return backend.connect(allow_local_infile)
     except Error as e:
-        print(f"Error connecting to MariaDB: {e}")
+        print(f"Error connecting to {backend}: {e}")
         return None
 
 
+def reserve_ids(connection, table, id_column, count):
+    """Memesan rentang id [awal, awal + count) pada tabel AUTO_INCREMENT dan mengembalikan awal
+
+    Caranya bergantung backend (backends.py): LOCK TABLES dan AUTO_INCREMENT di
+    MariaDB, sqlite_sequence di SQLite.
+    """
+    return backends.aktif().reserve_ids(connection, table, id_column, count)
+
+
 def generate_meaningful_sku(id_produk, nama_varian):
     """Generate SKU untuk varian produk berdasarkan nama varian"""
     # Split nama varian menjadi kata-kata
@@ -35,161 +64,328 @@ def generate_meaningful_sku(id_produk, nama_varian):
     # Format SKU
     return f"PRD-{id_produk:04d}-{initials}"
 
-def seed_users(connection):
-    """Mengisi data User sebanyak 100 user: 50 Seller dan 50 Buyer"""
-    cursor = connection.cursor()
-    
-    users = []
-    total_users = 100
-    total_seller = 50
-    total_buyer = 50
-    
-    # Buat 100 user terlebih dahulu
-    for i in range(total_users):
-        nama_panjang = fake.unique.name()
+PROVINSI_KOTA = {
+    'Jakarta': ['Jakarta Pusat', 'Jakarta Selatan', 'Jakarta Barat', 'Jakarta Timur', 'Jakarta Utara'],
+    'Jawa Barat': ['Bandung', 'Bogor', 'Bekasi', 'Depok', 'Cimahi'],
+    'Jawa Tengah': ['Semarang', 'Surakarta', 'Yogyakarta', 'Magelang', 'Pekalongan'],
+    'Jawa Timur': ['Surabaya', 'Malang', 'Sidoarjo', 'Madiun', 'Kediri'],
+    'Banten': ['Tangerang', 'Serang', 'Cilegon', 'South Tangerang']
+}
+
+KATEGORI_PRODUK = {
+    'Elektronik': ['Smartphone', 'Laptop', 'Kamera', 'Headphone', 'Smartwatch'],
+    'Fashion': ['Kaos', 'Celana', 'Jaket', 'Sepatu', 'Tas'],
+    'Rumah Tangga': ['Furniture', 'Dekorasi', 'Perlengkapan Dapur', 'Alat Kebersihan'],
+    'Hobi': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
+    'Makanan': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
+    'Kosmetik': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
+    'Stationery': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
+    'Keburuhan Sehari-Hari': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
+}
+
+WARNA = ['Merah', 'Biru', 'Hijau', 'Kuning', 'Hitam', 'Putih', 'Abu-abu', 'Coklat', 'Ungu', 'Orange']
+UKURAN = ['Kecil', 'Sedang', 'Besar', 'XS', 'S', 'M', 'L', 'XL', 'XXL']
+MATERIAL = ['Kayu', 'Plastik', 'Logam', 'Kain', 'Kulit', 'Katun', 'Wool', 'Nilon']
+
+# Updated to match schema ENUM values
+STATUS_OPTIONS = [
+    'belum dibayar',
+    'disiapkan', 
+    'dikirim', 
+    'sampai', 
+    'dibatalkan'
+]
+PAYMENT_METHODS = ['Transfer Bank', 'Kartu Kredit', 'OVO', 'Gopay', 'Dana', 'COD']
+SHIPPING_METHODS = ['JNE', 'J&T', 'SiCepat', 'Ninja Express', 'AnterAja']
+
+# Dengan --history-years, order yang lebih tua dari ini sudah selesai atau dibatalkan
+UMUR_ORDER_AKTIF = timedelta(days=14)
+
+# Semua tabel dalam urutan foreign key (induk sebelum anak)
+TABLES = (
+    "User", "Pertemanan", "Seller", "Buyer", "Alamat", "Produk", "VarianProduk",
+    "InstTag", "InstGambar", "Keranjang", "Wishlist", "Orders", "InstProduk", "Ulasan",
+)
+
+USER_COLUMNS = ("email", "password_hash", "nama_panjang", "tanggal_lahir", "no_telp", "foto_profil", "tipe")
+ALAMAT_COLUMNS = ("id_user", "provinsi", "kota", "jalan", "is_utama")
+
+# Fungsi tulis_* di bawah menghasilkan dan menulis satu potongan data (rentang id/key
+# yang disjoint). Mode serial memanggilnya sekali untuk seluruh rentang, mode
+# paralel (parallel.py) memanggilnya dari beberapa proses untuk potongan berbeda.
+
+def pilih_seller(jumlah, jumlah_seller):
+    """Menandai jumlah_seller dari jumlah user secara acak sebagai Seller (1 byte per user)"""
+    peran = bytearray(jumlah)
+    for k in random.sample(range(jumlah), min(jumlah_seller, jumlah)):
+        peran[k] = 1
+    return peran
+
+
+def generate_users(total_users, mulai, awal_id, jumlah_seller=0):
+    """Generator baris User untuk user ke-mulai sampai mulai+total_users dengan id_user = awal_id + indeks
+
+    Nama dan email diturunkan dari id_user (identity.py) sehingga unik tanpa fake.unique.
+    Tipe ditentukan saat generate: jumlah_seller user acak menjadi Seller, sisanya Buyer.
+    """
+    peran = pilih_seller(total_users, jumlah_seller)
+    for k, i in enumerate(range(mulai, mulai + total_users)):
+        id_user = awal_id + i
+        nama_panjang = nama_unik(id_user)
         # Ensure email follows the CHECK constraint pattern
-        email = f"{nama_panjang.split()[0].lower()}{random.randint(1,999)}@bustbuy.com"
+        email = email_unik(id_user, nama_panjang)
         password_hash = fake.password()
         tanggal_lahir = fake.date_of_birth(minimum_age=18, maximum_age=60)
         # Ensure phone number follows regex pattern ^[0-9]{8,15}$
         no_telp = ''.join(random.choices('0123456789', k=random.randint(8, 15)))
         foto_profil = f"profile_user_{i+1}.jpg"
+        tipe = "Seller" if peran[k] else "Buyer"
         
-        users.append((email, password_hash, nama_panjang, tanggal_lahir, no_telp, foto_profil))
+        yield (id_user, email, password_hash, nama_panjang, tanggal_lahir, no_telp, foto_profil, tipe)
+
+
+def tulis_users(writer, mulai, jumlah, awal_id, jumlah_seller=0, vectorized=False):
+    """Menulis user ke-mulai sampai mulai+jumlah dengan id_user = awal_id + indeks
+
+    id_user harus sudah dipesan (reserve_ids) karena nama dan email diturunkan darinya.
+    jumlah_seller user di potongan ini langsung ditulis dengan tipe Seller.
+    Dengan vectorized=True kolom dibuat per blok dengan NumPy (columnar.py).
+    """
+    if vectorized:
+        from columnar import blok_users
+        total = sum(
+            writer.write_columns("User", kolom)
+            for kolom in blok_users(mulai, jumlah, awal_id, jumlah_seller)
+        )
+        writer.flush()
+        return total
     
+    jumlah = writer.write("User", ("id_user",) + USER_COLUMNS, generate_users(jumlah, mulai, awal_id, jumlah_seller))
+    writer.flush()
+    return jumlah
+
+
+def atur_ulang_peran(connection, total_seller, seed=None):
+    """Mengatur ulang tipe semua user yang sudah ada: total_seller user acak menjadi Seller, sisanya Buyer
+
+    Seller dipilih ke tabel sementara lalu semua user diperbarui dengan satu
+    UPDATE ... JOIN, bukan satu UPDATE per user. Hanya mengubah User.tipe;
+    baris Buyer/Seller yang sudah ada tidak ikut disesuaikan.
+    """
+    if seed is None:
+        seed = random.getrandbits(31)
+    cursor = connection.cursor()
     try:
-        cursor.executemany(
-            """INSERT INTO User 
-            (email, password_hash, nama_panjang, tanggal_lahir, no_telp, foto_profil) 
-            VALUES (%s, %s, %s, %s, %s, %s)""",
-            users
+        cursor.execute("DROP TEMPORARY TABLE IF EXISTS peran_seller")
+        cursor.execute(
+            """CREATE TEMPORARY TABLE peran_seller (PRIMARY KEY (id_user))
+            SELECT id_user FROM User ORDER BY RAND(%s) LIMIT %s""",
+            (seed, total_seller)
         )
+        cursor.execute(
+            """UPDATE User u
+            LEFT JOIN peran_seller s ON s.id_user = u.id_user
+            SET u.tipe = IF(s.id_user IS NULL, 'Buyer', 'Seller')"""
+        )
+        jumlah = cursor.rowcount
+        cursor.execute("DROP TEMPORARY TABLE peran_seller")
         connection.commit()
-        
-        # Randomly assign 50 users as Sellers and 50 as Buyers
-        cursor.execute("SELECT id_user FROM User ORDER BY id_user")
-        all_user_ids = [row[0] for row in cursor.fetchall()]
-        
-        # Randomly choose 50 users to be sellers
-        seller_user_ids = random.sample(all_user_ids, total_seller)
-        buyer_user_ids = [uid for uid in all_user_ids if uid not in seller_user_ids]
-        
-        # Update type for selected users
-        for id_user in seller_user_ids:
-            cursor.execute("UPDATE User SET tipe = 'Seller' WHERE id_user = %s", (id_user,))
-        for id_user in buyer_user_ids:
-            cursor.execute("UPDATE User SET tipe = 'Buyer' WHERE id_user = %s", (id_user,))
-        
-        connection.commit()
-        print(f"✅ Berhasil menambahkan {len(users)} users dan mengassign {total_seller} Sellers dan {total_buyer} Buyers secara acak")
+        return jumlah
+    finally:
+        cursor.close()
+
+
+def seed_users(connection, writer, total_users=100, total_seller=50, vectorized=False):
+    """Mengisi data User (default 100 user: 50 Seller dan 50 Buyer)"""
+    total_buyer = total_users - total_seller
+    
+    try:
+        # Pesan id user sekaligus; identitas setiap user diturunkan dari id_user
+        awal_id = reserve_ids(connection, "User", "id_user", total_users)
+        # Sellers dan buyers dipilih secara acak saat generate, langsung di INSERT
+        jumlah_user = tulis_users(writer, 0, total_users, awal_id, total_seller, vectorized)
+        print(f"✅ Berhasil menambahkan {jumlah_user} users dengan {total_seller} Sellers dan {total_buyer} Buyers secara acak")
         return True
     except Error as e:
         connection.rollback()
         print(f"❌ Error seeding users: {e}")
         return False
-    finally:
-        cursor.close()
 
 
-def seed_buyers_and_sellers(connection):
-    """Mengisi data Buyer dan Seller berdasarkan User yang ada"""
+def ambil_id(connection, query, params=()):
+    """Membaca kolom id pertama hasil query secara streaming ke array('q'), bukan list tuple"""
     cursor = connection.cursor()
-    
     try:
-        # Ambil semua user dan tipe mereka
-        cursor.execute("SELECT id_user, tipe FROM User")
-        user_types = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        buyers = []
-        sellers = []
-        
-        for id_user, tipe in user_types.items():
+        cursor.execute(query, params)
+        return array('q', (row[0] for row in cursor))
+    finally:
+        cursor.close()
+
+
+def ambil_user_types(connection, dari_id=None, sampai_id=None, batch_size=BATCH_SIZE):
+    """Generator (id_user, tipe) user dengan id di [dari_id, sampai_id) (default semua), urut berdasarkan id_user
+
+    Dibaca per halaman batch_size baris (keyset pada id_user), sehingga memori tetap
+    datar dan koneksi yang sama bisa dipakai menulis di antara halaman.
+    """
+    terakhir = -1 if dari_id is None else dari_id - 1
+    batas = "" if sampai_id is None else " AND id_user < %s"
+    while True:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT id_user, tipe FROM User WHERE id_user > %s{batas} ORDER BY id_user LIMIT %s",
+                (terakhir,) + (() if sampai_id is None else (sampai_id,)) + (batch_size,)
+            )
+            halaman = cursor.fetchall()
+        finally:
+            cursor.close()
+        if not halaman:
+            return
+        yield from halaman
+        terakhir = halaman[-1][0]
+
+
+def tulis_buyers_and_sellers(writer, user_types):
+    """Menulis Buyer dan Seller untuk (id_user, tipe) dalam satu lintasan, mengembalikan (jumlah buyer, jumlah seller)
+
+    user_types boleh berupa generator (ambil_user_types); diproses per batch writer.
+    """
+    def generate_sellers(batch):
+        for id_user, tipe in batch:
             if tipe == "Buyer":
-                buyers.append((id_user,))
-            else:  # Seller
-                ktp = f"ktp_{id_user}.jpg"
-                foto_diri = f"selfie_{id_user}.jpg"
-                # Ensure ktp != foto_diri per CHECK constraint
-                while ktp == foto_diri:
-                    foto_diri = f"selfie_alt_{id_user}.jpg"
-                is_verified = random.choice([True, False])  # 50% verified
-                sellers.append((id_user, ktp, foto_diri, is_verified))
-        
+                continue
+            ktp = f"ktp_{id_user}.jpg"
+            foto_diri = f"selfie_{id_user}.jpg"
+            # Ensure ktp != foto_diri per CHECK constraint
+            while ktp == foto_diri:
+                foto_diri = f"selfie_alt_{id_user}.jpg"
+            is_verified = random.choice([True, False])  # 50% verified
+            yield (id_user, ktp, foto_diri, is_verified)
+    
+    jumlah_buyer = jumlah_seller = 0
+    for batch in chunked(user_types, writer.batch_size):
         # Insert buyers
-        if buyers:
-            cursor.executemany(
-                "INSERT INTO Buyer (id_user) VALUES (%s)",
-                buyers
-            )
+        jumlah_buyer += writer.write(
+            "Buyer",
+            ("id_user",),
+            ((id_user,) for id_user, tipe in batch if tipe == "Buyer")
+        )
         
         # Insert sellers
-        if sellers:
-            cursor.executemany(
-                """INSERT INTO Seller 
-                (id_user, ktp, foto_diri, is_verified) 
-                VALUES (%s, %s, %s, %s)""",
-                sellers
-            )
-        
-        connection.commit()
-        print(f"✅ Berhasil menambahkan {len(buyers)} buyers dan {len(sellers)} sellers")
+        jumlah_seller += writer.write(
+            "Seller",
+            ("id_user", "ktp", "foto_diri", "is_verified"),
+            generate_sellers(batch)
+        )
+    writer.flush()
+    return jumlah_buyer, jumlah_seller
+
+
+def tulis_buyers_and_sellers_rentang(writer, dari_id, sampai_id):
+    """tulis_buyers_and_sellers untuk user dengan id di [dari_id, sampai_id), dibaca lewat koneksi writer"""
+    return tulis_buyers_and_sellers(writer, ambil_user_types(writer.connection, dari_id, sampai_id, writer.batch_size))
+
+
+def seed_buyers_and_sellers(connection, writer):
+    """Mengisi data Buyer dan Seller berdasarkan User yang ada"""
+    try:
+        # Ambil semua user dan tipe mereka
+        jumlah_buyer, jumlah_seller = tulis_buyers_and_sellers(writer, ambil_user_types(connection))
+        print(f"✅ Berhasil menambahkan {jumlah_buyer} buyers dan {jumlah_seller} sellers")
     except Error as e:
         connection.rollback()
         print(f"❌ Error seeding buyers dan sellers: {e}")
+
+# Peluang teman baru dipilih uniform, bukan sebanding jumlah teman (preferential
+# attachment); menjaga user yang belum populer tetap bisa mendapat teman
+PELUANG_TEMAN_UNIFORM = 0.2
+
+def generate_pertemanan(user_ids, max_friends=8):
+    """Generator edge Pertemanan (min, max) dengan preferential attachment, O(jumlah edge)
+
+    User diproses dalam urutan acak; setiap user menambahkan 1..max_friends teman di
+    antara user sebelumnya, dipilih sebanding jumlah teman mereka (dengan sebagian
+    uniform). Edge hanya dibuat oleh ujung yang datang belakangan dan teman per user
+    berbeda, sehingga setiap pasangan muncul tepat sekali tanpa set global. Distribusi
+    derajat menjadi berekor panjang: sebagian kecil user punya banyak teman.
+    """
+    # Urutan acak disimpan sebagai indeks ke user_ids (4 byte per user), bukan salinan
+    # list id; user_ids cukup berupa sequence seperti range
+    urutan = array('i', range(len(user_ids)))
+    random.shuffle(urutan)
+    # Kedua ujung setiap edge (posisi di urutan); memilih elemen acak dari sini
+    # sama dengan memilih user sebanding jumlah temannya
+    ujung = array('i')
+    for posisi in range(1, len(urutan)):
+        jumlah_teman = min(random.randint(1, max_friends), posisi)
+        teman = []
+        while len(teman) < jumlah_teman:
+            if ujung and random.random() >= PELUANG_TEMAN_UNIFORM:
+                kandidat = ujung[int(random.random() * len(ujung))]
+            else:
+                kandidat = int(random.random() * posisi)
+            if kandidat not in teman:
+                teman.append(kandidat)
+        user_id = user_ids[urutan[posisi]]
+        for kandidat in teman:
+            friend_id = user_ids[urutan[kandidat]]
+            ujung.append(posisi)
+            ujung.append(kandidat)
+            # Bentuk kanonik (min, max); user_id != friend_id per CHECK constraint
+            yield (min(user_id, friend_id), max(user_id, friend_id))
+
+
+def rentang_id_user(connection):
+    """Semua id_user terurut: range(MIN, MAX + 1) jika id tanpa celah (hasil reserve_ids), selain itu array('q')"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT MIN(id_user), MAX(id_user), COUNT(*) FROM User")
+        bawah, atas, jumlah = cursor.fetchone()
     finally:
         cursor.close()
+    if not jumlah:
+        return range(0)
+    if atas - bawah + 1 == jumlah:
+        return range(bawah, atas + 1)
+    return ambil_id(connection, "SELECT id_user FROM User ORDER BY id_user")
 
-def seed_pertemanan(connection, max_friends=8):
-    """Mengisi data pertemanan antara user"""
-    cursor = connection.cursor()
-    
+
+def seed_pertemanan(connection, writer, max_friends=8):
+    """Mengisi data pertemanan antara user, ditulis per batch secara streaming"""
     try:
-        cursor.execute("SELECT id_user FROM User")
-        user_ids = [row[0] for row in cursor.fetchall()]
-        
-        pertemanan = set()  # Gunakan set untuk menghindari duplikat
-        
-        for user_id in user_ids:
-            num_friends = random.randint(1, min(max_friends, len(user_ids)-1))
-            potential_friends = [uid for uid in user_ids if uid != user_id]
-            friends = random.sample(potential_friends, min(num_friends, len(potential_friends)))
-            
-            for friend_id in friends:
-                # Pastikan tidak ada duplikat dengan urutan terbalik
-                # dan pastikan id_user != id_user_teman per CHECK constraint
-                if (friend_id, user_id) not in pertemanan and user_id != friend_id:
-                    pertemanan.add((user_id, friend_id))
+        user_ids = rentang_id_user(connection)
         
-        if pertemanan:
-            cursor.executemany(
-                "INSERT INTO Pertemanan (id_user, id_user_teman) VALUES (%s, %s)",
-                list(pertemanan)
-            )
-            connection.commit()
-            print(f"✅ Berhasil menambahkan {len(pertemanan)} relasi pertemanan")
+        jumlah = writer.write("Pertemanan", ("id_user", "id_user_teman"), generate_pertemanan(user_ids, max_friends))
+        writer.flush()
+        if jumlah:
+            print(f"✅ Berhasil menambahkan {jumlah} relasi pertemanan")
     except Error as e:
         connection.rollback()
         print(f"❌ Error seeding pertemanan: {e}")
-    finally:
-        cursor.close()
 
-def seed_alamat(connection, max_addresses=3):
-    """Mengisi data alamat untuk buyer, memastikan setiap buyer memiliki tepat 1 alamat utama"""
-    cursor = connection.cursor()
+def ambil_buyer_ids(connection):
+    """Mengambil id semua buyer, urut berdasarkan id_user"""
+    return ambil_id(connection, "SELECT id_user FROM Buyer ORDER BY id_user")
+
+
+def tulis_alamat(writer, buyer_ids, max_addresses=3, awal_id=None, vectorized=False):
+    """Menulis 1 sampai max_addresses alamat per buyer dengan tepat 1 alamat utama
+
+    Jika awal_id diberikan, id_alamat diambil berurutan dari awal_id
+    (rentang yang dibutuhkan paling banyak len(buyer_ids) * max_addresses).
+    Dengan vectorized=True kolom dibuat per blok dengan NumPy (columnar.py).
+    """
+    if vectorized:
+        from columnar import blok_alamat
+        total = sum(
+            writer.write_columns("Alamat", kolom)
+            for kolom in blok_alamat(buyer_ids, PROVINSI_KOTA, max_addresses, awal_id)
+        )
+        writer.flush()
+        return total
     
-    try:
-        cursor.execute("SELECT id_user FROM Buyer")
-        buyer_ids = [row[0] for row in cursor.fetchall()]
-        
-        alamat = []
-        provinsi_kota = {
-            'Jakarta': ['Jakarta Pusat', 'Jakarta Selatan', 'Jakarta Barat', 'Jakarta Timur', 'Jakarta Utara'],
-            'Jawa Barat': ['Bandung', 'Bogor', 'Bekasi', 'Depok', 'Cimahi'],
-            'Jawa Tengah': ['Semarang', 'Surakarta', 'Yogyakarta', 'Magelang', 'Pekalongan'],
-            'Jawa Timur': ['Surabaya', 'Malang', 'Sidoarjo', 'Madiun', 'Kediri'],
-            'Banten': ['Tangerang', 'Serang', 'Cilegon', 'South Tangerang']
-        }
-        
+    def generate_alamat():
         for user_id in buyer_ids:
             # Pastikan setiap buyer memiliki minimal 1 alamat dan maksimal max_addresses
             num_addresses = random.randint(1, max_addresses)
@@ -198,36 +394,55 @@ def seed_alamat(connection, max_addresses=3):
             utama_index = random.randint(0, num_addresses - 1)
             
             for i in range(num_addresses):
-                provinsi = random.choice(list(provinsi_kota.keys()))
-                kota = random.choice(provinsi_kota[provinsi])
+                provinsi = random.choice(list(PROVINSI_KOTA.keys()))
+                kota = random.choice(PROVINSI_KOTA[provinsi])
                 jalan = fake.street_address()
                 
                 # Ensure strings are not empty per CHECK constraints
                 while not jalan.strip():
                     jalan = fake.street_address()
                 while not kota.strip():
-                    kota = random.choice(provinsi_kota[provinsi])
+                    kota = random.choice(PROVINSI_KOTA[provinsi])
                 while not provinsi.strip():
-                    provinsi = random.choice(list(provinsi_kota.keys()))
+                    provinsi = random.choice(list(PROVINSI_KOTA.keys()))
                 
                 # Tetapkan alamat utama sesuai dengan indeks yang dipilih
                 is_utama = (i == utama_index)
                 
-                alamat.append((user_id, provinsi, kota, jalan, is_utama))
-        
-        if alamat:
-            cursor.executemany(
-                """INSERT INTO Alamat 
-                (id_user, provinsi, kota, jalan, is_utama) 
-                VALUES (%s, %s, %s, %s, %s)""",
-                alamat
-            )
-            connection.commit()
-            print(f"✅ Berhasil menambahkan {len(alamat)} alamat")
+                yield (user_id, provinsi, kota, jalan, is_utama)
+    
+    columns = ALAMAT_COLUMNS
+    rows = generate_alamat()
+    if awal_id is not None:
+        columns = ("id_alamat",) + columns
+        rows = ((awal_id + k, *row) for k, row in enumerate(rows))
+    jumlah = writer.write("Alamat", columns, rows)
+    writer.flush()
+    return jumlah
+
+
+def ambil_alamat_utama(connection):
+    """Mengembalikan AlamatUtama (id_user buyer, id_alamat utama) semua buyer yang memiliki alamat"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT id_alamat, id_user FROM Alamat WHERE is_utama = TRUE ORDER BY id_user")
+        alamat_utama = AlamatUtama()
+        for id_alamat, id_user in cursor:
+            alamat_utama.tambah(id_user, id_alamat)
+        return alamat_utama
+    finally:
+        cursor.close()
+
+
+def seed_alamat(connection, writer, max_addresses=3, vectorized=False):
+    """Mengisi data alamat untuk buyer, memastikan setiap buyer memiliki tepat 1 alamat utama"""
+    try:
+        jumlah = tulis_alamat(writer, ambil_buyer_ids(connection), max_addresses, vectorized=vectorized)
+        if jumlah:
+            print(f"✅ Berhasil menambahkan {jumlah} alamat")
         
-        # Return alamat utama dictionary for use in orders
-        cursor.execute("SELECT id_alamat, id_user FROM Alamat WHERE is_utama = TRUE")
-        utama_dict = {row[1]: row[0] for row in cursor.fetchall()}
+        # Return alamat utama for use in orders
+        utama_dict = ambil_alamat_utama(connection)
         
         print("✅ Verifikasi: Semua buyer memiliki tepat satu alamat utama")
         return utama_dict
@@ -235,372 +450,712 @@ def seed_alamat(connection, max_addresses=3):
     except Error as e:
         connection.rollback()
         print(f"❌ Error seeding alamat: {e}")
-        return {}
-    finally:
-        cursor.close()
+        return AlamatUtama()
 
-def seed_produk_dan_varian(connection, count=100):
-    """Mengisi data produk dan varian produk"""
-    cursor = connection.cursor()
+def ambil_verified_seller_ids(connection):
+    """Mengambil id seller yang is_verified = TRUE, urut berdasarkan id_user"""
+    return ambil_id(connection, "SELECT id_user FROM Seller WHERE is_verified = TRUE ORDER BY id_user")
+
+
+def tulis_produk_dan_varian(writer, seller_ids, awal_id, count):
+    """Menulis count produk dengan id mulai awal_id untuk seller_ids beserta varian, tag dan gambarnya
+
+    Mengembalikan (Katalog produk dan variannya, jumlah varian, jumlah tag, jumlah gambar).
+    Nama produk hanya dijamin unik per seller di dalam satu pemanggilan, jadi
+    pemanggilan paralel harus mendapat himpunan seller yang berbeda.
+    """
+    katalog = Katalog()  # Untuk menyimpan produk dan varian yang dibuat
+    produk = []
+    varian_produk = []
+    inst_tag = []
+    inst_gambar = []
+    jumlah_varian = jumlah_tag = jumlah_gambar = 0
     
-    try:
-        # Hanya ambil seller yang is_verified = TRUE
-        cursor.execute("SELECT id_user FROM Seller WHERE is_verified = TRUE")
-        verified_seller_ids = [row[0] for row in cursor.fetchall()]
+    def flush_children():
+        """Menulis batch produk lalu baris anaknya"""
+        writer.write("Produk", ("id_produk", "nama", "deskripsi", "id_seller"), produk)
+        writer.write("VarianProduk", ("sku", "id_produk", "nama_varian", "harga", "stok"), varian_produk)
+        writer.write("InstTag", ("id_produk", "tag"), inst_tag)
+        writer.write("InstGambar", ("id_produk", "gambar"), inst_gambar)
+        varian_produk.clear()
+        inst_tag.clear()
+        produk.clear()
+        inst_gambar.clear()
+    
+    # Track nama produk per seller untuk UNIQUE constraint
+    seller_product_names = {}
+    
+    for i in range(count):
+        id_seller = random.choice(seller_ids)
+        kategori = random.choice(list(KATEGORI_PRODUK.keys()))
+        subkategori = random.choice(KATEGORI_PRODUK[kategori])
         
-        if not verified_seller_ids:
-            print("⚠ Tidak ada verified seller. Lewati seeding produk.")
-            return {}
+        # Ensure unique product name per seller
+        if id_seller not in seller_product_names:
+            seller_product_names[id_seller] = set()
         
-        produk_ids = {}  # Untuk menyimpan id_produk yang dibuat
-        varian_produk = []
-        inst_tag = []
-        inst_gambar = []
+        nama = f"{subkategori} {fake.word().capitalize()}"
+        # Ensure name is unique for this seller
+        counter = 1
+        original_nama = nama
+        while nama in seller_product_names[id_seller]:
+            nama = f"{original_nama} {counter}"
+            counter += 1
         
-        kategori_produk = {
-            'Elektronik': ['Smartphone', 'Laptop', 'Kamera', 'Headphone', 'Smartwatch'],
-            'Fashion': ['Kaos', 'Celana', 'Jaket', 'Sepatu', 'Tas'],
-            'Rumah Tangga': ['Furniture', 'Dekorasi', 'Perlengkapan Dapur', 'Alat Kebersihan'],
-            'Hobi': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
-            'Makanan': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
-            'Kosmetik': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
-            'Stationery': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
-            'Keburuhan Sehari-Hari': ['Alat Musik', 'Buku', 'Alat Lukis', 'Peralatan Olahraga'],
-        }
+        # Ensure nama is not empty per CHECK constraint
+        while not nama.strip():
+            nama = f"{subkategori} {fake.word().capitalize()}"
         
-        warna = ['Merah', 'Biru', 'Hijau', 'Kuning', 'Hitam', 'Putih', 'Abu-abu', 'Coklat', 'Ungu', 'Orange']
-        ukuran = ['Kecil', 'Sedang', 'Besar', 'XS', 'S', 'M', 'L', 'XL', 'XXL']
-        material = ['Kayu', 'Plastik', 'Logam', 'Kain', 'Kulit', 'Katun', 'Wool', 'Nilon']
+        seller_product_names[id_seller].add(nama)
         
-        # Track nama produk per seller untuk UNIQUE constraint
-        seller_product_names = {}
+        deskripsi = fake.sentence(nb_words=10)
         
-        for i in range(count):
-            id_seller = random.choice(verified_seller_ids)
-            kategori = random.choice(list(kategori_produk.keys()))
-            subkategori = random.choice(kategori_produk[kategori])
-            
-            # Ensure unique product name per seller
-            if id_seller not in seller_product_names:
-                seller_product_names[id_seller] = set()
-            
-            nama = f"{subkategori} {fake.word().capitalize()}"
-            # Ensure name is unique for this seller
-            counter = 1
-            original_nama = nama
-            while nama in seller_product_names[id_seller]:
-                nama = f"{original_nama} {counter}"
-                counter += 1
-            
-            # Ensure nama is not empty per CHECK constraint
-            while not nama.strip():
-                nama = f"{subkategori} {fake.word().capitalize()}"
+        product_id = awal_id + i
+        produk.append((product_id, nama, deskripsi, id_seller))
+        katalog.tambah_produk(product_id, id_seller)
+        
+        # Buat varian produk (1-3 varian per produk)
+        num_variants = random.randint(1, 3)
+        for j in range(num_variants):
+            # Buat nama varian yang lebih bermakna
+            attr1 = random.choice([random.choice(WARNA), random.choice(UKURAN)])
+            attr2 = random.choice([random.choice(MATERIAL), "Standard", "Premium", "Basic"])
+            nama_varian = f"Varian {j+1} - {attr1} {attr2}"
             
-            seller_product_names[id_seller].add(nama)
+            # Ensure nama_varian is not empty per CHECK constraint
+            while not nama_varian.strip():
+                nama_varian = f"Varian {j+1} - Default"
             
-            deskripsi = fake.sentence(nb_words=10)
+            # Generate SKU berdasarkan nama varian
+            sku = generate_meaningful_sku(product_id, nama_varian)
             
-            # Insert produk dan dapatkan ID
-            cursor.execute(
-                """INSERT INTO Produk 
-                (nama, deskripsi, id_seller) 
-                VALUES (%s, %s, %s)""",
-                (nama, deskripsi, id_seller)
-            )
+            # Ensure SKU is not empty per CHECK constraint
+            while not sku.strip():
+                sku = f"SKU-{product_id}-{j+1}"
             
-            product_id = cursor.lastrowid
-            produk_ids[product_id] = {"seller_id": id_seller}
-            
-            # Buat varian produk (1-3 varian per produk)
-            num_variants = random.randint(1, 3)
-            for j in range(num_variants):
-                # Buat nama varian yang lebih bermakna
-                attr1 = random.choice([random.choice(warna), random.choice(ukuran)])
-                attr2 = random.choice([random.choice(material), "Standard", "Premium", "Basic"])
-                nama_varian = f"Varian {j+1} - {attr1} {attr2}"
-                
-                # Ensure nama_varian is not empty per CHECK constraint
-                while not nama_varian.strip():
-                    nama_varian = f"Varian {j+1} - Default"
-                
-                # Generate SKU berdasarkan nama varian
-                sku = generate_meaningful_sku(product_id, nama_varian)
-                
-                # Ensure SKU is not empty per CHECK constraint
-                while not sku.strip():
-                    sku = f"SKU-{product_id}-{j+1}"
-                
-                harga = random.randint(10000, 5000000)
-                stok = random.randint(0, 100)
-                
-                varian_produk.append((sku, product_id, nama_varian, harga, stok))
-                produk_ids[product_id].setdefault("varians", []).append({"sku": sku, "stok": stok})
+            harga = random.randint(10000, 5000000)
+            stok = random.randint(0, 100)
             
-            # Tambahkan 1-3 tag
-            tags = random.sample(list(kategori_produk.keys()), min(random.randint(1, 3), len(kategori_produk)))
-            for tag in tags:
-                # Ensure tag is not empty per CHECK constraint
-                if tag.strip():
-                    inst_tag.append((product_id, tag))
-            
-            # Tambahkan 1-3 gambar
-            num_images = random.randint(1, 3)
-            for k in range(num_images):
-                gambar = f"produk_{product_id}_img_{k+1}.jpg"
-                # Ensure gambar is not empty per CHECK constraint
-                if gambar.strip():
-                    inst_gambar.append((product_id, gambar))
+            varian_produk.append((sku, product_id, nama_varian, harga, stok))
+            katalog.tambah_varian(sku, stok)
         
-        # Insert varian produk
-        if varian_produk:
-            cursor.executemany(
-                """INSERT INTO VarianProduk 
-                (sku, id_produk, nama_varian, harga, stok) 
-                VALUES (%s, %s, %s, %s, %s)""",
-                varian_produk
-            )
+        # Tambahkan 1-3 tag
+        tags = random.sample(list(KATEGORI_PRODUK.keys()), min(random.randint(1, 3), len(KATEGORI_PRODUK)))
+        for tag in tags:
+            # Ensure tag is not empty per CHECK constraint
+            if tag.strip():
+                inst_tag.append((product_id, tag))
         
-        # Insert tag
-        if inst_tag:
-            cursor.executemany(
-                "INSERT INTO InstTag (id_produk, tag) VALUES (%s, %s)",
-                inst_tag
-            )
+        # Tambahkan 1-3 gambar
+        num_images = random.randint(1, 3)
+        for k in range(num_images):
+            gambar = f"produk_{product_id}_img_{k+1}.jpg"
+            # Ensure gambar is not empty per CHECK constraint
+            if gambar.strip():
+                inst_gambar.append((product_id, gambar))
         
-        # Insert gambar
-        if inst_gambar:
-            cursor.executemany(
-                "INSERT INTO InstGambar (id_produk, gambar) VALUES (%s, %s)",
-                inst_gambar
-            )
+        # Flush per batch agar memori tetap datar dan transaksi tidak membesar
+        if len(varian_produk) >= writer.batch_size:
+            jumlah_varian += len(varian_produk)
+            jumlah_tag += len(inst_tag)
+            jumlah_gambar += len(inst_gambar)
+            flush_children()
+    
+    jumlah_varian += len(varian_produk)
+    jumlah_tag += len(inst_tag)
+    jumlah_gambar += len(inst_gambar)
+    flush_children()
+    writer.flush()
+    return katalog, jumlah_varian, jumlah_tag, jumlah_gambar
+
+
+def seed_produk_dan_varian(connection, writer, count=100):
+    """Mengisi data produk dan varian produk"""
+    try:
+        # Hanya ambil seller yang is_verified = TRUE
+        verified_seller_ids = ambil_verified_seller_ids(connection)
         
-        connection.commit()
-        print(f"✅ Berhasil menambahkan {len(produk_ids)} produk, {len(varian_produk)} varian, {len(inst_tag)} tag, dan {len(inst_gambar)} gambar")
-        return produk_ids
+        if not verified_seller_ids:
+            print("⚠ Tidak ada verified seller. Lewati seeding produk.")
+            return Katalog()
+        
+        # Pesan id produk sekaligus agar tidak perlu round trip per produk untuk lastrowid
+        awal_id = reserve_ids(connection, "Produk", "id_produk", count)
+        
+        katalog, jumlah_varian, jumlah_tag, jumlah_gambar = tulis_produk_dan_varian(
+            writer, verified_seller_ids, awal_id, count
+        )
+        
+        print(f"✅ Berhasil menambahkan {len(katalog)} produk, {jumlah_varian} varian, {jumlah_tag} tag, dan {jumlah_gambar} gambar")
+        return katalog
     except Error as e:
         connection.rollback()
         print(f"❌ Error seeding produk: {e}")
-        return {}
-    finally:
-        cursor.close()
+        return Katalog()
 
-def seed_keranjang_dan_wishlist(connection, produk_ids):
-    """Mengisi data keranjang dan wishlist dengan minimal 150 & 100 item"""
-    cursor = connection.cursor()
+def tambah_kuota(kuota, minimum, batas):
+    """Menambah kuota item per buyer secara acak sampai totalnya mencapai minimum"""
+    # Jangan melebihi kapasitas (setiap buyer maksimal batas item)
+    kekurangan = min(minimum, len(kuota) * batas) - sum(kuota)
+    while kekurangan > 0:
+        i = random.randrange(len(kuota))
+        if kuota[i] < batas:
+            kuota[i] += 1
+            kekurangan -= 1
+
+def tulis_keranjang_dan_wishlist(writer, buyer_ids, katalog, min_keranjang=150, min_wishlist=100, awal_id=None,
+                                 bobot_produk=None):
+    """Menulis keranjang dan wishlist untuk buyer_ids, mengembalikan (jumlah keranjang, jumlah wishlist)
+
+    Jika awal_id diberikan, id_keranjang diambil berurutan dari awal_id
+    (rentang yang dibutuhkan paling banyak len(buyer_ids) * 5 + min_keranjang).
+    bobot_produk (sejajar dengan urutan produk di katalog, misalnya dari bobot_zipf)
+    membuat produk populer lebih sering dipilih; None berarti uniform.
+    """
+    # Indeks produk yang punya minimal satu varian dengan stok
+    produk_tersedia = array('q', (i for i in range(len(katalog)) if katalog.tersedia(i)))
+    # Sampler dibangun sekali; setiap pengambilan O(1) tanpa membangun ulang list
+    sampler_keranjang = buat_sampler(
+        len(produk_tersedia), None if bobot_produk is None else [bobot_produk[i] for i in produk_tersedia]
+    )
+    sampler_wishlist = buat_sampler(len(katalog), bobot_produk)
+
+    # Kuota item per buyer ditentukan di awal sehingga jumlah minimal tercapai
+    # tanpa perlu menyimpan semua item untuk pengecekan duplikat
+    batas_keranjang = min(len(produk_tersedia), 255)
+    batas_wishlist = min(len(katalog), 255)
+    kuota_keranjang = array('B', (min(random.randint(0, 5), batas_keranjang) for _ in buyer_ids))
+    kuota_wishlist = array('B', (min(random.randint(0, 5), batas_wishlist) for _ in buyer_ids))
+    if batas_keranjang:
+        tambah_kuota(kuota_keranjang, min_keranjang, batas_keranjang)
+    tambah_kuota(kuota_wishlist, min_wishlist, batas_wishlist)
+
+    keranjang = []
+    wishlist = []
+    jumlah_keranjang = jumlah_wishlist = 0
+    keranjang_columns = ("id_user", "id_produk", "sku", "kuantitas")
+    if awal_id is not None:
+        keranjang_columns = ("id_keranjang",) + keranjang_columns
 
+    def flush():
+        writer.write("Keranjang", keranjang_columns, keranjang)
+        writer.write("Wishlist", ("id_user", "id_produk"), wishlist)
+        keranjang.clear()
+        wishlist.clear()
+
+    for buyer_id, num_cart_items, num_wishlist_items in zip(buyer_ids, kuota_keranjang, kuota_wishlist):
+        cart_product_ids = set()  # Indeks produk di katalog
+
+        # ambil_berbeda menjamin produk berbeda sehingga (buyer, produk, sku) unik
+        if num_cart_items > 0:
+            for j in ambil_berbeda(sampler_keranjang, num_cart_items):
+                indeks = produk_tersedia[j]
+                product_id = katalog.id_produk[indeks]
+                varian = random.choice([j for j in katalog.rentang_varian(indeks) if katalog.stok[j] > 0])
+                kuantitas = random.randint(1, min(5, katalog.stok[varian]))
+                # Ensure kuantitas >= 1 per CHECK constraint
+                kuantitas = max(1, kuantitas)
+                sku = katalog.sku(varian)
+                if awal_id is None:
+                    keranjang.append((buyer_id, product_id, sku, kuantitas))
+                else:
+                    keranjang.append((awal_id + jumlah_keranjang + len(keranjang), buyer_id, product_id, sku, kuantitas))
+                cart_product_ids.add(indeks)
+
+        # Wishlist (tidak duplikat dengan keranjang, ditolak lewat rejection)
+        if num_wishlist_items > 0:
+            for indeks in ambil_berbeda(sampler_wishlist, num_wishlist_items, cart_product_ids):
+                wishlist.append((buyer_id, katalog.id_produk[indeks]))
+
+        if len(keranjang) + len(wishlist) >= writer.batch_size:
+            jumlah_keranjang += len(keranjang)
+            jumlah_wishlist += len(wishlist)
+            flush()
+
+    jumlah_keranjang += len(keranjang)
+    jumlah_wishlist += len(wishlist)
+    flush()
+    writer.flush()
+    return jumlah_keranjang, jumlah_wishlist
+
+
+def seed_keranjang_dan_wishlist(connection, writer, katalog, min_keranjang=150, min_wishlist=100, bobot_produk=None):
+    """Mengisi data keranjang dan wishlist dengan minimal min_keranjang & min_wishlist item"""
     try:
-        cursor.execute("SELECT id_user FROM Buyer")
-        buyer_ids = [row[0] for row in cursor.fetchall()]
+        buyer_ids = ambil_buyer_ids(connection)
 
-        if not buyer_ids or not produk_ids:
+        if not buyer_ids or not katalog:
             print("⚠ Tidak ada data buyer atau produk. Lewati seeding keranjang dan wishlist.")
             return
 
-        keranjang = []
-        wishlist = []
-        keranjang_set = set()
-        wishlist_set = set()
-
-        # Seed awal seperti biasa
-        for buyer_id in buyer_ids:
-            num_cart_items = random.randint(0, 5)
-            cart_product_ids = set()
-
-            if num_cart_items > 0:
-                product_choices = random.sample(list(produk_ids.keys()), min(num_cart_items, len(produk_ids)))
-                for product_id in product_choices:
-                    if "varians" in produk_ids[product_id] and produk_ids[product_id]["varians"]:
-                        varian = random.choice(produk_ids[product_id]["varians"])
-                        if varian["stok"] > 0:
-                            kuantitas = random.randint(1, min(5, varian["stok"]))
-                            # Ensure kuantitas >= 1 per CHECK constraint
-                            kuantitas = max(1, kuantitas)
-                            key = (buyer_id, product_id, varian["sku"])
-                            if key not in keranjang_set:
-                                keranjang.append((buyer_id, product_id, varian["sku"], kuantitas))
-                                keranjang_set.add(key)
-                                cart_product_ids.add(product_id)
-
-            # Wishlist (tidak duplikat dengan keranjang)
-            num_wishlist_items = random.randint(0, 5)
-            available_products = [pid for pid in produk_ids.keys() if pid not in cart_product_ids]
-            if num_wishlist_items > 0 and available_products:
-                wishlist_products = random.sample(available_products, min(num_wishlist_items, len(available_products)))
-                for product_id in wishlist_products:
-                    key = (buyer_id, product_id)
-                    if key not in wishlist_set:
-                        wishlist.append((buyer_id, product_id))
-                        wishlist_set.add(key)
-
-        # Jika belum mencapai jumlah minimal, tambah data ekstra secara acak
-        while len(keranjang) < 150:
-            buyer_id = random.choice(buyer_ids)
-            product_id = random.choice(list(produk_ids.keys()))
-            if "varians" in produk_ids[product_id] and produk_ids[product_id]["varians"]:
-                varian = random.choice(produk_ids[product_id]["varians"])
-                if varian["stok"] > 0:
-                    key = (buyer_id, product_id, varian["sku"])
-                    if key not in keranjang_set:
-                        kuantitas = max(1, random.randint(1, min(5, varian["stok"])))
-                        keranjang.append((buyer_id, product_id, varian["sku"], kuantitas))
-                        keranjang_set.add(key)
-
-        while len(wishlist) < 100:
-            buyer_id = random.choice(buyer_ids)
-            product_id = random.choice(list(produk_ids.keys()))
-            key = (buyer_id, product_id)
-            if key not in wishlist_set:
-                wishlist.append((buyer_id, product_id))
-                wishlist_set.add(key)
-
-        # Insert keranjang
-        if keranjang:
-            cursor.executemany(
-                """INSERT INTO Keranjang 
-                (id_user, id_produk, sku, kuantitas) 
-                VALUES (%s, %s, %s, %s)""",
-                keranjang
-            )
-
-        # Insert wishlist
-        if wishlist:
-            cursor.executemany(
-                "INSERT INTO Wishlist (id_user, id_produk) VALUES (%s, %s)",
-                wishlist
-            )
-
-        connection.commit()
-        print(f"✅ Berhasil menambahkan {len(keranjang)} item keranjang dan {len(wishlist)} item wishlist")
+        jumlah_keranjang, jumlah_wishlist = tulis_keranjang_dan_wishlist(
+            writer, buyer_ids, katalog, min_keranjang, min_wishlist, bobot_produk=bobot_produk
+        )
+        print(f"✅ Berhasil menambahkan {jumlah_keranjang} item keranjang dan {jumlah_wishlist} item wishlist")
 
     except Error as e:
         connection.rollback()
         print(f"❌ Error seeding keranjang dan wishlist: {e}")
 
+
+def tulis_orders(writer, katalog, alamat_utama, awal_id, jumlah_order, waktu_acuan, awal_id_ulasan=None,
+                 bobot_produk=None, stok=None, tahun_histori=None, kolom_waktu=False):
+    """Menulis sampai jumlah_order order dengan id mulai awal_id beserta instproduk dan ulasannya
+
+    Jika awal_id_ulasan diberikan, id_ulasan diambil berurutan dari awal_id_ulasan
+    (rentang yang dibutuhkan paling banyak jumlah_order * 3).
+    bobot_produk seperti pada tulis_keranjang_dan_wishlist.
+
+    Jika stok diberikan (array sisa stok per varian katalog), order memperhatikan
+    inventori: kuantitas dipangkas ke sisa stok, baris dengan stok habis ditolak,
+    dan order tanpa baris tidak ditulis (id-nya dilewati). Order 'dibatalkan'
+    tidak mengurangi stok. stok dikurangi di tempat.
+
+    Jika tahun_histori diberikan, waktu pemesanan tersebar dalam tahun_histori tahun
+    terakhir mengikuti pola musiman (timeseries.WaktuOrderSampler) dan order yang
+    lebih tua dari UMUR_ORDER_AKTIF sudah berstatus akhir ('sampai'/'dibatalkan').
+    kolom_waktu=True menulis waktu_pemesanan juga ke InstProduk dan Ulasan untuk
+    layout berpartisi (partitioning.py).
+
+    Mengembalikan (jumlah order, jumlah instproduk, jumlah ulasan, terjual) dengan
+    terjual array kuantitas terjual per varian (None tanpa stok).
+    """
+    orders = []
+    inst_produk = []
+    ulasan = []
+    jumlah_orders = jumlah_inst_produk = jumlah_ulasan = 0
+    terjual = None if stok is None else array('i', bytes(4 * katalog.jumlah_varian()))
+    ulasan_columns = ("id_order", "id_produk", "nilai", "komentar")
+    if awal_id_ulasan is not None:
+        ulasan_columns = ("id_ulasan",) + ulasan_columns
+    inst_produk_columns = ("id_order", "id_produk", "sku", "kuantitas")
+    if kolom_waktu:
+        inst_produk_columns += ("waktu_pemesanan",)
+        ulasan_columns += ("waktu_pemesanan",)
+    ekor = ()
+    sampler_waktu = None if tahun_histori is None else WaktuOrderSampler(waktu_acuan, tahun_histori)
+    
+    def flush():
+        """Menulis batch orders, lalu instproduk, lalu ulasan (ulasan_validation butuh instproduk)"""
+        writer.write(
+            "Orders",
+            ("id_order", "id_user", "id_alamat", "status_order", "metode_pembayaran",
+             "metode_pengiriman", "waktu_pemesanan", "catatan"),
+            orders
+        )
+        writer.write("InstProduk", inst_produk_columns, inst_produk)
+        writer.write("Ulasan", ulasan_columns, ulasan)
+        orders.clear()
+        inst_produk.clear()
+        ulasan.clear()
+    
+    sampler_produk = buat_sampler(len(katalog), bobot_produk)
+    
+    for order_id in range(awal_id, awal_id + jumlah_order):
+        # Buyer yang memiliki alamat utama
+        k = random.randrange(len(alamat_utama))
+        buyer_id = alamat_utama.id_user[k]
+        id_alamat = alamat_utama.id_alamat[k]
+        
+        status_order = random.choices(
+            STATUS_OPTIONS,
+            weights=[10, 20, 20, 40, 10]  # Lebih banyak pesanan yang sudah sampai
+        )[0]
+        metode_pembayaran = random.choice(PAYMENT_METHODS)
+        metode_pengiriman = random.choice(SHIPPING_METHODS)
+        catatan = fake.sentence(nb_words=5) if random.random() > 0.7 else None
+        
+        if sampler_waktu is None:
+            # Timestamp untuk waktu pemesanan (dalam 3 bulan terakhir); waktu_acuan tengah malam,
+            # jadi jam dalam hari ikut diacak agar tidak semua order pukul 00:00:00
+            waktu_pemesanan = waktu_acuan - timedelta(days=random.randint(0, 90), seconds=random.randint(0, 86399))
+        else:
+            waktu_pemesanan = sampler_waktu.ambil()
+            # Order lama tidak mungkin masih menunggu pembayaran atau dalam pengiriman
+            if waktu_acuan - waktu_pemesanan > UMUR_ORDER_AKTIF and status_order not in ('sampai', 'dibatalkan'):
+                status_order = random.choices(('sampai', 'dibatalkan'), weights=[40, 10])[0]
+        if kolom_waktu:
+            ekor = (waktu_pemesanan,)
+        
+        # Tambahkan 1-3 produk ke order
+        num_products = random.randint(1, 3)
+        baris_order = []
+        for indeks in ambil_berbeda(sampler_produk, num_products):
+            product_id = katalog.id_produk[indeks]
+            varians = katalog.rentang_varian(indeks)
+            if varians:
+                varian = random.choice(varians)
+                kuantitas = max(1, random.randint(1, 5))  # Ensure kuantitas >= 1
+                
+                if stok is not None and status_order != 'dibatalkan':
+                    kuantitas = min(kuantitas, stok[varian])
+                    if kuantitas == 0:
+                        continue  # Stok habis, baris ditolak
+                    stok[varian] -= kuantitas
+                    terjual[varian] += kuantitas
+                
+                baris_order.append((order_id, product_id, katalog.sku(varian), kuantitas) + ekor)
+                
+                # Add reviews for completed orders
+                if status_order == 'sampai' and random.random() > 0.3:  # 70% chance of review for completed orders
+                    nilai = random.randint(1, 5)  # Matches CHECK constraint (nilai BETWEEN 1 AND 5)
+                    komentar = fake.paragraph() if random.random() > 0.5 else None
+                    if awal_id_ulasan is None:
+                        ulasan.append((order_id, product_id, nilai, komentar) + ekor)
+                    else:
+                        ulasan.append((awal_id_ulasan + jumlah_ulasan + len(ulasan), order_id, product_id, nilai, komentar) + ekor)
+        
+        if not baris_order:
+            continue
+        orders.append((order_id, buyer_id, id_alamat, status_order, metode_pembayaran,
+                       metode_pengiriman, waktu_pemesanan, catatan))
+        inst_produk.extend(baris_order)
+        
+        # Flush per batch agar memori tetap datar dan transaksi tidak membesar
+        if len(orders) + len(inst_produk) >= writer.batch_size:
+            jumlah_orders += len(orders)
+            jumlah_inst_produk += len(inst_produk)
+            jumlah_ulasan += len(ulasan)
+            flush()
+    
+    jumlah_orders += len(orders)
+    jumlah_inst_produk += len(inst_produk)
+    jumlah_ulasan += len(ulasan)
+    flush()
+    writer.flush()
+    return jumlah_orders, jumlah_inst_produk, jumlah_ulasan, terjual
+
+
+def terapkan_pengurangan_stok(connection, katalog, terjual, batch_size=BATCH_SIZE):
+    """Mengurangi VarianProduk.stok sebesar terjual dengan satu UPDATE ... JOIN dari tabel delta sementara
+
+    Mengembalikan jumlah varian yang stoknya berubah.
+    """
+    def generate_delta():
+        for i in range(len(katalog)):
+            for j in katalog.rentang_varian(i):
+                if terjual[j]:
+                    yield (katalog.sku(j), katalog.id_produk[i], terjual[j])
+
+    cursor = connection.cursor()
+    try:
+        cursor.execute("DROP TEMPORARY TABLE IF EXISTS delta_stok")
+        cursor.execute(
+            """CREATE TEMPORARY TABLE delta_stok (
+                sku VARCHAR(255) NOT NULL,
+                id_produk INT NOT NULL,
+                jumlah INT NOT NULL,
+                PRIMARY KEY (sku, id_produk)
+            )"""
+        )
+        query = insert_query("delta_stok", ("sku", "id_produk", "jumlah"))
+        for batch in chunked(generate_delta(), batch_size):
+            cursor.executemany(query, batch)
+        cursor.execute(backends.aktif().UPDATE_STOK)
+        jumlah = cursor.rowcount
+        cursor.execute("DROP TEMPORARY TABLE delta_stok")
+        connection.commit()
     finally:
         cursor.close()
 
+    # Katalog di memori ikut mencerminkan stok di database
+    for j, n in enumerate(terjual):
+        katalog.stok[j] -= n
+    return jumlah
 
-def seed_orders(connection, produk_ids, alamat_utama, count=200):
-    """Mengisi data orders"""
-    cursor = connection.cursor()
-    
+
+def layout_berpartisi(connection):
+    """True jika InstProduk memiliki kolom waktu_pemesanan (layout berpartisi dari partitioning.py)"""
+    return backends.aktif().kolom_ada(connection, "InstProduk", "waktu_pemesanan")
+
+
+def seed_orders(connection, writer, katalog, alamat_utama, count=200, waktu_acuan=None, bobot_produk=None,
+                inventori=False, tahun_histori=None):
+    """Mengisi data orders, waktu pemesanan dihitung mundur dari waktu_acuan (default: sekarang)
+
+    Dengan inventori=True order memperhatikan stok varian di katalog dan stok di
+    database dikurangi sekali di akhir (terapkan_pengurangan_stok). tahun_histori
+    seperti pada tulis_orders.
+    """
     try:
-        if not alamat_utama or not produk_ids:
+        if not alamat_utama or not katalog:
             print("⚠ Tidak cukup data untuk seeding orders. Diperlukan buyer dengan alamat dan produk.")
             return
         
-        orders = []
-        inst_produk = []
-        ulasan = []
-        
-        # Updated to match schema ENUM values
-        status_options = [
-            'belum dibayar',
-            'disiapkan', 
-            'dikirim', 
-            'sampai', 
-            'dibatalkan'
-        ]
-        payment_methods = ['Transfer Bank', 'Kartu Kredit', 'OVO', 'Gopay', 'Dana', 'COD']
-        shipping_methods = ['JNE', 'J&T', 'SiCepat', 'Ninja Express', 'AnterAja']
-        
-        # ID dari buyer yang memiliki alamat utama
-        buyer_ids = list(alamat_utama.keys())
-        
-        for _ in range(min(count, len(buyer_ids) * len(produk_ids))):
-            buyer_id = random.choice(buyer_ids)
-            id_alamat = alamat_utama[buyer_id]
-            
-            status_order = random.choices(
-                status_options,
-                weights=[10, 20, 20, 40, 10]  # Lebih banyak pesanan yang sudah sampai
-            )[0]
-            metode_pembayaran = random.choice(payment_methods)
-            metode_pengiriman = random.choice(shipping_methods)
-            catatan = fake.sentence(nb_words=5) if random.random() > 0.7 else None
-            
-            # Timestamp untuk waktu pemesanan (dalam 3 bulan terakhir)
-            waktu_pemesanan = datetime.now() - timedelta(days=random.randint(0, 90))
-            
-            # Insert order
-            cursor.execute("""
-                INSERT INTO Orders 
-                (id_user, id_alamat, status_order, metode_pembayaran, metode_pengiriman, 
-                waktu_pemesanan, catatan) 
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (buyer_id, id_alamat, status_order, metode_pembayaran, metode_pengiriman, 
-                  waktu_pemesanan, catatan))
-            
-            order_id = cursor.lastrowid
-            
-            # Tambahkan 1-3 produk ke order
-            num_products = random.randint(1, 3)
-            product_choices = random.sample(list(produk_ids.keys()), min(num_products, len(produk_ids)))
-            
-            for product_id in product_choices:
-                if "varians" in produk_ids[product_id] and produk_ids[product_id]["varians"]:
-                    varian = random.choice(produk_ids[product_id]["varians"])
-                    kuantitas = max(1, random.randint(1, 5))  # Ensure kuantitas >= 1
-                    
-                    inst_produk.append((order_id, product_id, varian["sku"], kuantitas))
-                    
-                    # Add reviews for completed orders
-                    if status_order == 'sampai' and random.random() > 0.3:  # 70% chance of review for completed orders
-                        nilai = random.randint(1, 5)  # Matches CHECK constraint (nilai BETWEEN 1 AND 5)
-                        komentar = fake.paragraph() if random.random() > 0.5 else None
-                        ulasan.append((order_id, product_id, nilai, komentar))
+        if waktu_acuan is None:
+            waktu_acuan = datetime.now()
         
-        # Insert instproduk
-        if inst_produk:
-            cursor.executemany(
-                """INSERT INTO InstProduk 
-                (id_order, id_produk, sku, kuantitas) 
-                VALUES (%s, %s, %s, %s)""",
-                inst_produk
-            )
-            
-        # Insert ulasan
-        if ulasan:
-            cursor.executemany(
-                """INSERT INTO Ulasan 
-                (id_order, id_produk, nilai, komentar) 
-                VALUES (%s, %s, %s, %s)""",
-                ulasan
-            )
+        jumlah_order = min(count, len(alamat_utama) * len(katalog))
+        # Pesan id order sekaligus agar tidak perlu round trip per order untuk lastrowid
+        awal_id = reserve_ids(connection, "Orders", "id_order", jumlah_order)
         
-        connection.commit()
-        print(f"✅ Berhasil menambahkan {count} orders, {len(inst_produk)} product instances, dan {len(ulasan)} ulasan")
+        jumlah_order, jumlah_inst_produk, jumlah_ulasan, terjual = tulis_orders(
+            writer, katalog, alamat_utama, awal_id, jumlah_order, waktu_acuan, bobot_produk=bobot_produk,
+            stok=array('i', katalog.stok) if inventori else None, tahun_histori=tahun_histori,
+            kolom_waktu=layout_berpartisi(connection)
+        )
+        print(f"✅ Berhasil menambahkan {jumlah_order} orders, {jumlah_inst_produk} product instances, dan {jumlah_ulasan} ulasan")
+        if terjual is not None:
+            jumlah_varian = terapkan_pengurangan_stok(connection, katalog, terjual, writer.batch_size)
+            print(f"✅ Stok {jumlah_varian} varian dikurangi sebanyak {sum(terjual)} unit terjual")
     except Error as e:
         connection.rollback()
         print(f"❌ Error seeding orders: {e}")
+
+def parse_args(argv=None):
+    """Membaca argumen command line seeder"""
+    parser = argparse.ArgumentParser(description="Seeder database bustbuy")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Scale factor; 1 = 100 user, 100 produk, 200 order")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="Jumlah baris per batch yang di-commit")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed; seed yang sama menghasilkan data yang sama")
+    parser.add_argument("--backend", choices=backends.BACKEND, default=None,
+                        help="Backend penyimpanan (default DB_BACKEND di .env, atau mariadb)")
+    parser.add_argument("--sqlite-path", default=None, metavar="FILE",
+                        help="File database untuk --backend sqlite (default SQLITE_PATH di .env, atau bustbuy.db)")
+    parser.add_argument("--database", default=None, metavar="NAME",
+                        help="Nama database MariaDB (default DB_NAME di .env, atau bustbuy15)")
+    parser.add_argument("--bulk-load", nargs="?", const="", default=None, metavar="DIR",
+                        help="Tulis tabel ke file TSV di DIR lalu muat dengan LOAD DATA LOCAL INFILE")
+    parser.add_argument("--dump", default=None, metavar="FILE",
+                        help="Tulis dataset ke FILE .sql (atau .sql.gz) berisi INSERT multi-row, tanpa koneksi database")
+    parser.add_argument("--max-packet", type=int, default=MAX_PACKET, metavar="BYTES",
+                        help="Ukuran maksimal satu statement INSERT di --dump (max_allowed_packet server tujuan)")
+    parser.add_argument("--snapshot", default=None, metavar="DIR",
+                        help="Setelah seeding, simpan snapshot Parquet/Arrow semua tabel ke DIR (snapshot.py, butuh pyarrow)")
+    parser.add_argument("--snapshot-format", choices=("parquet", "arrow"), default="parquet",
+                        help="Format file --snapshot")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Jumlah proses generator paralel (1 = serial)")
+    parser.add_argument("--pipeline", type=int, default=0, metavar="N",
+                        help="Tulis batch di N thread penulis (koneksi masing-masing) sementara data terus dibuat (mode serial)")
+    parser.add_argument("--reject-file", default=None, metavar="FILE",
+                        help="Baris yang gagal (duplicate, FK, CHECK, SIGNAL trigger) dicatat ke FILE dan seeding berlanjut")
+    parser.add_argument("--maintenance-window", action="store_true",
+                        help="Seed dengan semua trigger di-drop dan FK checks mati, lalu validasi invariant dengan query agregat")
+    parser.add_argument("--re-role", action="store_true",
+                        help="Hanya atur ulang tipe user yang sudah ada (jumlah seller mengikuti --scale) lalu keluar")
+    parser.add_argument("--rebuild-summaries", action="store_true",
+                        help="Hanya bangun ulang tabel ringkasan rating dan penjualan dari data yang ada lalu keluar")
+    parser.add_argument("--delta", action="store_true",
+                        help="Tambah data ke database yang sudah terisi, mulai dari id tertinggi yang ada (mode serial)")
+    parser.add_argument("--users", type=int, default=None, metavar="N",
+                        help="Jumlah user baru untuk --delta (default mengikuti --scale); separuhnya seller")
+    parser.add_argument("--products", type=int, default=None, metavar="N",
+                        help="Jumlah produk baru untuk --delta (default mengikuti --scale)")
+    parser.add_argument("--orders", type=int, default=None, metavar="N",
+                        help="Jumlah order baru untuk --delta (default mengikuti --scale)")
+    parser.add_argument("--inventory", action="store_true",
+                        help="Order memperhatikan stok varian; stok dikurangi dengan satu UPDATE ... JOIN di akhir")
+    parser.add_argument("--zipf", type=float, default=None, metavar="S",
+                        help="Popularitas produk gaya Zipf dengan eksponen S untuk keranjang, wishlist dan order (default uniform)")
+    parser.add_argument("--history-years", type=float, default=None, metavar="N",
+                        help="Sebar waktu order dalam N tahun terakhir dengan pola musiman, mingguan dan harian (default 90 hari)")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="Buat kolom User dan Alamat per blok dengan NumPy, bukan per baris dengan Faker")
+    parser.add_argument("--metrics", default=None, metavar="FILE",
+                        help="Simpan laporan JSON waktu per tahap dan latensi execute/executemany/commit ke FILE")
+    parser.add_argument("--server-status", action="store_true",
+                        help="Catat selisih SHOW GLOBAL STATUS (handler writes, lock waits, fsync) per tahap")
+    parser.add_argument("--profile", default=None, metavar="FILE",
+                        help="Simpan cProfile proses utama selama seeding ke FILE (mode serial)")
+    args = parser.parse_args(argv)
+    if (args.backend or os.getenv("DB_BACKEND", "mariadb")) == "sqlite" and (
+            args.workers > 1 or args.bulk_load is not None or args.pipeline or args.maintenance_window
+            or args.re_role or args.server_status):
+        parser.error("--workers, --bulk-load, --pipeline, --maintenance-window, --re-role dan --server-status "
+                     "hanya untuk backend mariadb")
+    if args.profile and args.workers > 1:
+        parser.error("--profile hanya untuk mode serial; di mode paralel data dibuat di proses worker")
+    if args.dump and (args.workers > 1 or args.bulk_load is not None or args.pipeline or args.delta
+                      or args.maintenance_window or args.reject_file):
+        parser.error("--dump tidak memakai database; tidak bisa digabung dengan --workers, --bulk-load, --pipeline, "
+                     "--delta, --maintenance-window atau --reject-file")
+    if args.snapshot and args.dump:
+        parser.error("--snapshot membaca tabel dari database; tidak bisa digabung dengan --dump")
+    if args.delta and args.workers > 1:
+        parser.error("--delta hanya untuk mode serial (tanpa --workers)")
+    if not args.delta and (args.users, args.products, args.orders) != (None, None, None):
+        parser.error("--users, --products dan --orders hanya untuk --delta; gunakan --scale")
+    if args.reject_file and args.bulk_load is not None:
+        parser.error("--reject-file hanya untuk mode INSERT; LOAD DATA LOCAL sudah melewati baris duplikat")
+    if args.pipeline and (args.workers > 1 or args.bulk_load is not None):
+        parser.error("--pipeline hanya untuk mode serial dengan INSERT (tanpa --workers dan --bulk-load)")
+    return args
+
+def jendela_pemeliharaan(connection, args):
+    """JendelaPemeliharaan jika --maintenance-window dipakai, selain itu context kosong"""
+    if not args.maintenance_window:
+        return contextlib.nullcontext()
+    from maintenance import JendelaPemeliharaan
+    return JendelaPemeliharaan(connection)
+
+
+def bangun_ulang_ringkasan(connection):
+    """Membangun ulang tabel ringkasan rating dan penjualan (summary.py) jika tabelnya ada"""
+    import summary
+    if not summary.ringkasan_tersedia(connection):
+        print("⚠ Tabel ringkasan belum ada (migrations/003_summary_tables.sql), dilewati")
+        return
+    hasil = summary.bangun_ulang(connection)
+    print("✅ Tabel ringkasan dibangun ulang: " + ", ".join(f"{t} {n} baris" for t, n in hasil.items()))
+
+
+def pulihkan_ringkasan(connection, args):
+    """Tabel ringkasan tidak dijaga trigger selama jendela pemeliharaan, jadi dibangun ulang"""
+    if args.maintenance_window:
+        bangun_ulang_ringkasan(connection)
+
+
+def validasi_pemeliharaan(connection, args):
+    """Memvalidasi invariant setelah seeding di dalam jendela pemeliharaan"""
+    if not args.maintenance_window:
+        return
+    from maintenance import validasi
+    print("\n🔍 Validasi invariant setelah jendela pemeliharaan...")
+    pelanggaran = validasi(connection)
+    if pelanggaran:
+        print(f"⚠ Ditemukan {pelanggaran} baris yang melanggar invariant")
+
+def simpan_snapshot(args):
+    """Menyimpan snapshot kolumnar (snapshot.py) setelah seeding jika --snapshot dipakai"""
+    if not args.snapshot:
+        return
+    from snapshot import ekspor, pyarrow_tersedia
+    if not pyarrow_tersedia():
+        return
+    connection = create_connection()
+    if connection is None:
+        return
+    try:
+        ekspor(connection, args.snapshot, args.snapshot_format,
+               keterangan={"seed": args.seed, "scale": args.scale, "argumen": vars(args)})
+    except Error as e:
+        print(f"❌ Error menyimpan snapshot: {e}")
     finally:
-        cursor.close()
+        connection.close()
 
-def main():
+def main(argv=None):
     """Fungsi utama untuk menjalankan seeder"""
-    connection = create_connection()
+    args = parse_args(argv)
+    backends.pilih(args.backend, args.sqlite_path, args.database)
+    ukuran = hitung_ukuran(args.scale)
+    if args.users is not None:
+        ukuran["user"] = args.users
+        ukuran["seller"] = args.users * UKURAN_DASAR["seller"] // UKURAN_DASAR["user"]
+    if args.products is not None:
+        ukuran["produk"] = args.products
+    if args.orders is not None:
+        ukuran["order"] = args.orders
+    
+    if args.seed is not None:
+        random.seed(args.seed)
+        fake.seed_instance(args.seed)
+    # Waktu acuan dibulatkan ke hari ini agar data deterministik untuk seed yang sama
+    waktu_acuan = datetime.combine(datetime.now().date(), datetime.min.time())
+    
+    if args.re_role:
+        connection = create_connection()
+        if connection is None:
+            return
+        try:
+            jumlah = atur_ulang_peran(connection, ukuran["seller"], args.seed)
+            print(f"✅ Berhasil mengatur ulang tipe {jumlah} users ({ukuran['seller']} Sellers)")
+        except Error as e:
+            connection.rollback()
+            print(f"❌ Error mengatur ulang tipe user: {e}")
+        finally:
+            connection.close()
+        return
+    
+    if args.rebuild_summaries:
+        connection = create_connection()
+        if connection is None:
+            return
+        try:
+            bangun_ulang_ringkasan(connection)
+        except Error as e:
+            print(f"❌ Error membangun ulang tabel ringkasan: {e}")
+        finally:
+            connection.close()
+        return
+    
+    if args.dump:
+        from dump import seed_dump
+        with profil(args.profile):
+            seed_dump(args, ukuran, waktu_acuan)
+        return
+    
+    if args.workers > 1:
+        from parallel import seed_parallel
+        seed_parallel(args, ukuran, waktu_acuan)
+        simpan_snapshot(args)
+        return
+    
+    # Semua execute/executemany/commit lewat koneksi terukur (--metrics, --server-status)
+    metrik = Metrik(args.server_status)
+    connection = metrik.bungkus(create_connection(allow_local_infile=args.bulk_load is not None))
     if connection is None:
         return
     
+    if args.bulk_load is not None:
+        writer = LoadDataWriter(connection, args.bulk_load or tempfile.mkdtemp(prefix="bustbuy_"), args.batch_size)
+    elif args.pipeline:
+        from pipeline import PipelineWriter
+        try:
+            writer = PipelineWriter(connection, lambda: metrik.bungkus(create_connection()), args.pipeline,
+                                    args.batch_size, args.maintenance_window, args.reject_file)
+        except Error as e:
+            print(f"❌ Error menyiapkan pipeline: {e}")
+            connection.close()
+            return
+    else:
+        writer = InsertWriter(connection, args.batch_size, args.reject_file)
+    
     try:
-        print("🚀 Memulai proses seeding database...")
+        print(f"🚀 Memulai proses seeding database (scale {args.scale})...")
         
-        # Urutan seeding penting karena foreign key constraints
-        seed_users(connection)  # Membuat users dan assign tipe secara random
-        seed_buyers_and_sellers(connection)
-        seed_pertemanan(connection)
-        alamat_utama = seed_alamat(connection)
-        produk_ids = seed_produk_dan_varian(connection)  # Hanya verified sellers yang memiliki produk
-        seed_keranjang_dan_wishlist(connection, produk_ids)
-        seed_orders(connection, produk_ids, alamat_utama)
+        with jendela_pemeliharaan(connection, args), profil(args.profile):
+            if args.delta:
+                # Tambahan di atas data yang ada, id baru mulai dari id tertinggi (delta.py)
+                from delta import seed_delta
+                seed_delta(connection, writer, ukuran, waktu_acuan, args, metrik)
+            else:
+                # Urutan seeding penting karena foreign key constraints
+                with metrik.tahap("users"):
+                    seed_users(connection, writer, ukuran["user"], ukuran["seller"], args.vectorized)  # Membuat users dan assign tipe secara random
+                with metrik.tahap("buyers_sellers"):
+                    seed_buyers_and_sellers(connection, writer)
+                with metrik.tahap("pertemanan"):
+                    seed_pertemanan(connection, writer)
+                with metrik.tahap("alamat"):
+                    alamat_utama = seed_alamat(connection, writer, vectorized=args.vectorized)
+                with metrik.tahap("produk"):
+                    katalog = seed_produk_dan_varian(connection, writer, ukuran["produk"])  # Hanya verified sellers yang memiliki produk
+                bobot_produk = bobot_zipf(len(katalog), args.zipf) if args.zipf else None
+                with metrik.tahap("keranjang_wishlist"):
+                    seed_keranjang_dan_wishlist(connection, writer, katalog, ukuran["keranjang_min"], ukuran["wishlist_min"], bobot_produk)
+                with metrik.tahap("orders"):
+                    seed_orders(connection, writer, katalog, alamat_utama, ukuran["order"], waktu_acuan, bobot_produk, args.inventory,
+                                args.history_years)
         
+        writer.laporan()
+        pulihkan_ringkasan(connection, args)
+        validasi_pemeliharaan(connection, args)
+        if args.metrics:
+            metrik.laporan()
+            metrik.simpan(args.metrics, vars(args))
         print("\n🎉 Database seeding berhasil diselesaikan!")
     except Error as e:
         print(f"\n🔥 Error selama seeding: {e}")
     finally:
+        writer.tutup()
         if connection and connection.is_connected():
             connection.close()
             print("🔌 Koneksi database ditutup")
+    simpan_snapshot(args)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,398 @@
+import argparse
+import json
+import random
+import threading
+import time
+
+from mysql.connector import Error
+
+import backends
+import seeder
+from catalog import AlamatUtama
+from delta import muat_katalog, sampel_rentang, watermark
+from metrics import Metrik, persentil
+
+# Generator beban tulis: N pembeli simulasi (thread, masing-masing dengan koneksi
+# sendiri) menjalankan campuran aksi terhadap data hasil seeder.py selama durasi
+# tertentu:
+#   * lihat: membaca produk, varian dan ringkasan rating
+#   * keranjang: INSERT Keranjang ... ON DUPLICATE KEY UPDATE (UNIQUE(id_user, id_produk, sku))
+#   * checkout: isi keranjang (atau 1-3 produk acak) menjadi Orders + InstProduk,
+#     stok varian dikurangi dengan UPDATE bersyarat, keranjang dikosongkan
+#   * status: memajukan order aktif satu langkah (check_status_order_transition)
+#   * ulasan: ulasan untuk produk dari order yang sudah sampai (ulasan_validation)
+# Setiap aksi satu transaksi. Laporan: transaksi/detik, persentil latensi per aksi,
+# jumlah deadlock, lock wait timeout dan SIGNAL trigger, serta latensi per statement
+# dan tabel (Metrik) untuk menemukan trigger yang menjadi hotspot.
+
+# Campuran aksi default (bobot relatif)
+CAMPURAN_DEFAULT = {"lihat": 40, "keranjang": 25, "checkout": 10, "status": 20, "ulasan": 5}
+
+# Transisi maju yang diterima check_status_order_transition, dengan bobot
+TRANSISI = {
+    "belum dibayar": (("disiapkan", "dibatalkan"), (85, 15)),
+    "disiapkan": (("dikirim", "dibatalkan"), (95, 5)),
+    "dikirim": (("sampai", "dibatalkan"), (98, 2)),
+}
+
+# Error yang dihitung terpisah di laporan; error lain dihitung sebagai 'error'
+JENIS_ERROR = {1213: "deadlock", 1205: "lock wait timeout", 1644: "signal trigger"}
+
+KOMENTAR_ULASAN = [
+    "Barang sesuai deskripsi", "Pengiriman cepat", "Kualitas oke untuk harganya",
+    "Packing rapi", "Kurang sesuai ekspektasi", "Seller responsif", None, None,
+]
+
+# Ukuran sampel data awal yang dipakai pembeli
+SAMPEL_BUYER = 20000
+SAMPEL_PRODUK = 5000
+SAMPEL_ORDER = 5000
+
+
+def parse_campuran(teks):
+    """'lihat=40,checkout=10' -> dict aksi -> bobot; aksi yang tidak disebut berbobot 0"""
+    campuran = dict.fromkeys(CAMPURAN_DEFAULT, 0)
+    for bagian in teks.split(","):
+        nama, _, bobot = bagian.partition("=")
+        nama = nama.strip()
+        if nama not in campuran:
+            raise argparse.ArgumentTypeError(f"Aksi tidak dikenal: {nama} (pilihan: {', '.join(campuran)})")
+        campuran[nama] = float(bobot)
+    if not any(campuran.values()):
+        raise argparse.ArgumentTypeError("Minimal satu aksi harus berbobot lebih dari 0")
+    return campuran
+
+
+class Simulasi:
+    """Data bersama dan hasil pengukuran untuk semua thread pembeli
+
+    Setiap aksi menjalankan satu transaksi dan commit sendiri, lalu mengembalikan
+    hasilnya ('ok', 'stok habis', status baru, atau 'lewat' jika tidak ada data
+    yang bisa dipakai). Error dari database di-rollback oleh _pembeli.
+    """
+
+    def __init__(self, katalog, alamat_utama, order_aktif, order_sampai, campuran, berpartisi=False):
+        self.katalog = katalog
+        self.alamat_utama = alamat_utama
+        self.order_aktif = order_aktif  # [id_order] belum berstatus akhir
+        self.order_sampai = order_sampai  # [id_order] berstatus 'sampai'
+        # Layout berpartisi (partitioning.py): InstProduk dan Ulasan menyimpan waktu_pemesanan order
+        self.berpartisi = berpartisi
+        self.aksi = [nama for nama, bobot in campuran.items() if bobot > 0]
+        self.bobot = [campuran[nama] for nama in self.aksi]
+        self.kunci = threading.Lock()
+        self.latensi = {nama: [] for nama in self.aksi}  # aksi -> [detik] transaksi yang commit
+        self.hasil = {nama: {} for nama in self.aksi}  # aksi -> hasil/jenis error -> jumlah
+
+    def _hitung(self, aksi, hasil, detik=None):
+        with self.kunci:
+            self.hasil[aksi][hasil] = self.hasil[aksi].get(hasil, 0) + 1
+            if detik is not None:
+                self.latensi[aksi].append(detik)
+
+    def _ambil_order_aktif(self, rng):
+        """Mengeluarkan satu order aktif acak agar tidak dimajukan dua thread sekaligus"""
+        with self.kunci:
+            if not self.order_aktif:
+                return None
+            k = rng.randrange(len(self.order_aktif))
+            self.order_aktif[k], self.order_aktif[-1] = self.order_aktif[-1], self.order_aktif[k]
+            return self.order_aktif.pop()
+
+    def _simpan_order(self, id_order, status):
+        with self.kunci:
+            if status == "sampai":
+                self.order_sampai.append(id_order)
+            elif status in TRANSISI:
+                self.order_aktif.append(id_order)
+
+    def _buyer(self, rng):
+        k = rng.randrange(len(self.alamat_utama))
+        return self.alamat_utama.id_user[k], self.alamat_utama.id_alamat[k]
+
+    def _varian(self, rng):
+        """(id_produk, sku) acak dari katalog, atau None jika produknya tanpa varian"""
+        i = rng.randrange(len(self.katalog))
+        varians = self.katalog.rentang_varian(i)
+        if not varians:
+            return None
+        return self.katalog.id_produk[i], self.katalog.sku(rng.choice(varians))
+
+    def lihat(self, connection, cursor, rng):
+        cursor.execute(
+            """SELECT p.nama, v.sku, v.harga, v.stok, r.jumlah_ulasan, r.total_nilai
+            FROM Produk p
+            JOIN VarianProduk v ON v.id_produk = p.id_produk
+            LEFT JOIN RingkasanRatingProduk r ON r.id_produk = p.id_produk
+            WHERE p.id_produk = %s""",
+            (self.katalog.id_produk[rng.randrange(len(self.katalog))],)
+        )
+        cursor.fetchall()
+        connection.commit()
+        return "ok"
+
+    def keranjang(self, connection, cursor, rng):
+        varian = self._varian(rng)
+        if varian is None:
+            return "lewat"
+        id_user, _ = self._buyer(rng)
+        cursor.execute(
+            """INSERT INTO Keranjang (id_user, id_produk, sku, kuantitas) VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE kuantitas = kuantitas + VALUES(kuantitas)""",
+            (id_user, varian[0], varian[1], rng.randint(1, 3))
+        )
+        connection.commit()
+        return "ok"
+
+    def checkout(self, connection, cursor, rng):
+        id_user, id_alamat = self._buyer(rng)
+        cursor.execute("SELECT id_produk, sku, kuantitas FROM Keranjang WHERE id_user = %s FOR UPDATE", (id_user,))
+        baris = cursor.fetchall()
+        if not baris:
+            # Beli langsung tanpa keranjang
+            pilihan = dict.fromkeys(self._varian(rng) for _ in range(rng.randint(1, 3)))
+            baris = [(varian[0], varian[1], rng.randint(1, 5)) for varian in pilihan if varian is not None]
+        # Varian dikunci dalam urutan yang sama di semua checkout
+        dibeli = []
+        for id_produk, sku, kuantitas in sorted(baris):
+            cursor.execute(
+                "UPDATE VarianProduk SET stok = stok - %s WHERE id_produk = %s AND sku = %s AND stok >= %s",
+                (kuantitas, id_produk, sku, kuantitas)
+            )
+            if cursor.rowcount:
+                dibeli.append((id_produk, sku, kuantitas))
+        if not dibeli:
+            connection.rollback()
+            return "stok habis"
+        cursor.execute(
+            """INSERT INTO Orders (id_user, id_alamat, status_order, metode_pembayaran, metode_pengiriman)
+            VALUES (%s, %s, 'belum dibayar', %s, %s)""",
+            (id_user, id_alamat, rng.choice(seeder.PAYMENT_METHODS), rng.choice(seeder.SHIPPING_METHODS))
+        )
+        id_order = cursor.lastrowid
+        if self.berpartisi:
+            cursor.execute("SELECT waktu_pemesanan FROM Orders WHERE id_order = %s", (id_order,))
+            waktu_pemesanan = cursor.fetchone()[0]
+            cursor.executemany(
+                """INSERT INTO InstProduk (id_order, id_produk, sku, kuantitas, waktu_pemesanan)
+                VALUES (%s, %s, %s, %s, %s)""",
+                [(id_order, id_produk, sku, kuantitas, waktu_pemesanan) for id_produk, sku, kuantitas in dibeli]
+            )
+        else:
+            cursor.executemany(
+                "INSERT INTO InstProduk (id_order, id_produk, sku, kuantitas) VALUES (%s, %s, %s, %s)",
+                [(id_order, id_produk, sku, kuantitas) for id_produk, sku, kuantitas in dibeli]
+            )
+        cursor.execute("DELETE FROM Keranjang WHERE id_user = %s", (id_user,))
+        connection.commit()
+        self._simpan_order(id_order, "belum dibayar")
+        return "ok"
+
+    def status(self, connection, cursor, rng):
+        id_order = self._ambil_order_aktif(rng)
+        if id_order is None:
+            return "lewat"
+        row = None
+        try:
+            cursor.execute("SELECT status_order FROM Orders WHERE id_order = %s FOR UPDATE", (id_order,))
+            row = cursor.fetchone()
+            if row is None or row[0] not in TRANSISI:
+                # Sudah berstatus akhir (atau dihapus) di luar simulasi, tidak dikembalikan
+                connection.rollback()
+                return "lewat"
+            pilihan, bobot = TRANSISI[row[0]]
+            baru = rng.choices(pilihan, weights=bobot)[0]
+            cursor.execute("UPDATE Orders SET status_order = %s WHERE id_order = %s", (baru, id_order))
+            connection.commit()
+        except Error:
+            self._simpan_order(id_order, row[0] if row else "belum dibayar")
+            raise
+        self._simpan_order(id_order, baru)
+        return baru
+
+    def ulasan(self, connection, cursor, rng):
+        with self.kunci:
+            if not self.order_sampai:
+                return "lewat"
+            id_order = rng.choice(self.order_sampai)
+        if self.berpartisi:
+            cursor.execute("SELECT id_produk, waktu_pemesanan FROM InstProduk WHERE id_order = %s", (id_order,))
+        else:
+            cursor.execute("SELECT id_produk FROM InstProduk WHERE id_order = %s", (id_order,))
+        produk = cursor.fetchall()
+        if not produk:
+            connection.rollback()
+            return "lewat"
+        pilihan = rng.choice(produk)
+        nilai = (id_order, pilihan[0], rng.randint(1, 5), rng.choice(KOMENTAR_ULASAN))
+        if self.berpartisi:
+            cursor.execute(
+                """INSERT INTO Ulasan (id_order, id_produk, nilai, komentar, waktu_pemesanan)
+                VALUES (%s, %s, %s, %s, %s)""",
+                nilai + (pilihan[1],)
+            )
+        else:
+            cursor.execute("INSERT INTO Ulasan (id_order, id_produk, nilai, komentar) VALUES (%s, %s, %s, %s)", nilai)
+        connection.commit()
+        return "ok"
+
+    def _pembeli(self, connection, rng, berhenti):
+        """Loop satu pembeli sampai waktu berhenti"""
+        cursor = connection.cursor()
+        try:
+            while time.perf_counter() < berhenti:
+                aksi = rng.choices(self.aksi, weights=self.bobot)[0]
+                mulai = time.perf_counter()
+                try:
+                    hasil = getattr(self, aksi)(connection, cursor, rng)
+                except Error as e:
+                    connection.rollback()
+                    self._hitung(aksi, JENIS_ERROR.get(e.errno, "error"))
+                    continue
+                self._hitung(aksi, hasil, None if hasil == "lewat" else time.perf_counter() - mulai)
+        finally:
+            cursor.close()
+
+    def jalankan(self, koneksi, durasi, seed):
+        """Menjalankan satu thread pembeli per koneksi selama durasi detik, mengembalikan waktu sebenarnya"""
+        berhenti = time.perf_counter() + durasi
+        threads = [
+            threading.Thread(target=self._pembeli, args=(connection, random.Random(f"{seed}:{i}"), berhenti),
+                             name=f"pembeli-{i}", daemon=True)
+            for i, connection in enumerate(koneksi)
+        ]
+        mulai = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - mulai
+
+    def ringkasan(self, detik):
+        """Transaksi/detik total dan per aksi beserta persentil latensi (ms) dan hitungan error"""
+        hasil = {"detik": detik, "aksi": {}}
+        total = 0
+        for aksi in self.aksi:
+            urut = sorted(self.latensi[aksi])
+            total += len(urut)
+            hasil["aksi"][aksi] = {
+                "transaksi": len(urut),
+                "tps": len(urut) / detik,
+                "p50_ms": persentil(urut, 50) * 1000 if urut else None,
+                "p95_ms": persentil(urut, 95) * 1000 if urut else None,
+                "p99_ms": persentil(urut, 99) * 1000 if urut else None,
+                "hasil": self.hasil[aksi],
+            }
+        hasil["transaksi"] = total
+        hasil["tps"] = total / detik
+        for jenis in JENIS_ERROR.values():
+            hasil[jenis] = sum(h.get(jenis, 0) for h in self.hasil.values())
+        return hasil
+
+
+def siapkan(connection, batch_size):
+    """Mengambil sampel buyer dengan alamat utama, katalog dan order dari database
+
+    Buyer dan produk diambil sampel_rentang secara acak merata di seluruh rentang id,
+    sehingga pembeli tidak hanya berebut lock pada baris-baris lama.
+    """
+    alamat_utama = AlamatUtama()
+    for id_user, id_alamat in sampel_rentang(
+        connection, watermark(connection, "User", "id_user"), SAMPEL_BUYER,
+        "SELECT id_user, id_alamat FROM Alamat WHERE is_utama = TRUE AND id_user IN ({})", batch_size
+    ):
+        alamat_utama.tambah(id_user, id_alamat)
+    id_produk = [row[0] for row in sampel_rentang(
+        connection, watermark(connection, "Produk", "id_produk"), SAMPEL_PRODUK,
+        "SELECT id_produk FROM Produk WHERE id_produk IN ({})", batch_size
+    )]
+    katalog = muat_katalog(connection, id_produk, batch_size)
+    order_aktif = seeder.ambil_id(
+        connection,
+        """SELECT id_order FROM Orders WHERE status_order IN ('belum dibayar', 'disiapkan', 'dikirim')
+        ORDER BY id_order DESC LIMIT %s""",
+        (SAMPEL_ORDER,)
+    ).tolist()
+    order_sampai = seeder.ambil_id(
+        connection, "SELECT id_order FROM Orders WHERE status_order = 'sampai' ORDER BY id_order DESC LIMIT %s",
+        (SAMPEL_ORDER,)
+    ).tolist()
+    return katalog, alamat_utama, order_aktif, order_sampai
+
+
+def cetak(ringkasan):
+    print(f"\n📊 {ringkasan['transaksi']} transaksi dalam {ringkasan['detik']:.1f}s: {ringkasan['tps']:,.1f} transaksi/detik")
+    for aksi, r in ringkasan["aksi"].items():
+        latensi = (f"p50 {r['p50_ms']:.1f}ms  p95 {r['p95_ms']:.1f}ms  p99 {r['p99_ms']:.1f}ms"
+                   if r["transaksi"] else "tidak ada transaksi")
+        hasil = ", ".join(f"{nama} {jumlah}" for nama, jumlah in sorted(r["hasil"].items()))
+        print(f"   {aksi}: {r['tps']:,.1f}/detik  {latensi}  [{hasil}]")
+    print("   " + ", ".join(f"{jenis}: {ringkasan[jenis]}" for jenis in JENIS_ERROR.values()))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generator beban pembeli konkuren di atas data hasil seeder")
+    parser.add_argument("--shoppers", type=int, default=8,
+                        help="Jumlah pembeli konkuren (thread, masing-masing satu koneksi)")
+    parser.add_argument("--duration", type=float, default=30.0,
+                        help="Lama simulasi dalam detik")
+    parser.add_argument("--mix", type=parse_campuran, default=dict(CAMPURAN_DEFAULT),
+                        help="Bobot aksi, misalnya \"lihat=40,keranjang=25,checkout=10,status=20,ulasan=5\"")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed untuk pilihan aksi dan data pembeli")
+    parser.add_argument("--server-status", action="store_true",
+                        help="Catat selisih SHOW GLOBAL STATUS (row lock waits, handler writes) selama simulasi")
+    parser.add_argument("--output", default=None,
+                        help="Simpan laporan JSON ke file ini")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if backends.aktif().nama != "mariadb":
+        # SELECT ... FOR UPDATE dan ON DUPLICATE KEY UPDATE; kontensi kunci baris hanya ada di MariaDB
+        print("❌ Simulasi pembeli hanya untuk backend mariadb (DB_BACKEND)")
+        return
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    random.seed(seed)
+    metrik = Metrik(args.server_status)
+    connection = metrik.bungkus(seeder.create_connection())
+    if connection is None:
+        return
+    koneksi = []
+    try:
+        simulasi = Simulasi(*siapkan(connection, seeder.BATCH_SIZE), args.mix,
+                            berpartisi=seeder.layout_berpartisi(connection))
+        if not simulasi.katalog or not simulasi.alamat_utama:
+            print("⚠ Tidak ada produk atau buyer dengan alamat, seed database terlebih dahulu")
+            return
+        for _ in range(args.shoppers):
+            pembeli = seeder.create_connection()
+            if pembeli is None:
+                return
+            koneksi.append(metrik.bungkus(pembeli))
+        print(f"🛒 {args.shoppers} pembeli selama {args.duration:.0f}s (seed {seed}), "
+              f"{len(simulasi.alamat_utama)} buyer, {len(simulasi.katalog)} produk, "
+              f"{len(simulasi.order_aktif)} order aktif")
+        with metrik.tahap("simulasi"):
+            detik = simulasi.jalankan(koneksi, args.duration, seed)
+        ringkasan = simulasi.ringkasan(detik)
+        cetak(ringkasan)
+        metrik.laporan()
+        if args.output:
+            ringkasan["argumen"] = vars(args)
+            ringkasan["tahap"] = metrik.tahap_selesai
+            ringkasan["operasi"] = metrik.ringkasan_operasi()
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(ringkasan, f, indent=2, default=str)
+            print(f"📝 Laporan disimpan di {args.output}")
+    except Error as e:
+        print(f"❌ Error menjalankan simulasi: {e}")
+    finally:
+        for pembeli in koneksi:
+            pembeli.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from mysql.connector import Error
+
+import backends
+import seeder
+import summary
+from maintenance import JendelaPemeliharaan
+from writers import InsertWriter, LoadDataWriter
+
+# Snapshot dataset kolumnar: setiap tabel model (seeder.TABLES, ditambah tabel
+# ringkasan jika ada) diekspor ke satu file Parquet atau Arrow IPC terkompresi,
+# dengan manifest.json berisi seed, scale, kolom dan jumlah baris. Restore memuat
+# file-file itu ke database kosong sesuai urutan FK, batch demi batch (row group
+# Parquet / record batch Arrow), sehingga tabel besar tidak pernah dimuat penuh ke
+# memori dan tidak ada Faker yang dijalankan ulang. Di MariaDB restore berjalan di
+# jendela pemeliharaan (trigger di-drop, FK checks mati) dengan LOAD DATA, dan tabel
+# ringkasan dimuat dari snapshot alih-alih dihitung trigger per baris.
+#
+#   python seeder.py --scale 100 --seed 1 --snapshot snap/
+#   python snapshot.py restore snap/
+#
+# pyarrow adalah dependensi opsional dan hanya diimpor saat snapshot dipakai.
+
+MANIFEST = "manifest.json"
+
+# Ekstensi file per format; file Arrow IPC bisa dibaca dengan memory map
+FORMAT = {"parquet": ".parquet", "arrow": ".arrow"}
+
+KOMPRESI = ("zstd", "lz4", "none")
+
+# Baris per row group / record batch; batas memori saat ekspor dan restore
+UKURAN_BATCH = 65536
+
+
+def pyarrow_tersedia():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("❌ Snapshot membutuhkan pyarrow (pip install pyarrow)")
+        return False
+    return True
+
+
+def _buka_penulis(path, format, skema, kompresi):
+    import pyarrow as pa
+    kompresi = None if kompresi == "none" else kompresi
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(path, skema, compression=kompresi or "none")
+    return pa.ipc.new_file(path, skema, options=pa.ipc.IpcWriteOptions(compression=kompresi))
+
+
+def _record_batch(kolom, baris, skema):
+    """RecordBatch dari baris hasil fetchmany; tanpa skema, tipe diambil dari batch ini
+
+    Kolom yang seluruhnya NULL di batch pertama dianggap string; di schema ini
+    hanya kolom teks (foto_profil, deskripsi, catatan, komentar) yang nullable.
+    """
+    import pyarrow as pa
+    nilai = list(zip(*baris))
+    if skema is None:
+        arrays = [pa.array(isi) for isi in nilai]
+        arrays = [a.cast(pa.string()) if a.type == pa.null() else a for a in arrays]
+        return pa.RecordBatch.from_arrays(arrays, names=kolom)
+    return pa.RecordBatch.from_arrays(
+        [pa.array(isi, type=field.type) for isi, field in zip(nilai, skema)], schema=skema
+    )
+
+
+def _baca_batch(path, format, batch_size):
+    """Record batch dari file snapshot satu per satu"""
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        yield from pq.ParquetFile(path).iter_batches(batch_size=batch_size)
+        return
+    import pyarrow as pa
+    with pa.memory_map(path) as sumber:
+        reader = pa.ipc.open_file(sumber)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+
+
+def ekspor_tabel(connection, table, kolom, path, format, kompresi, batch_size):
+    """Menulis isi tabel ke path secara streaming, mengembalikan jumlah baris (file tidak dibuat jika kosong)"""
+    penulis = None
+    skema = None
+    jumlah = 0
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SELECT {', '.join(kolom)} FROM `{table}`")
+        while True:
+            baris = cursor.fetchmany(batch_size)
+            if not baris:
+                break
+            batch = _record_batch(kolom, baris, skema)
+            if penulis is None:
+                skema = batch.schema
+                penulis = _buka_penulis(path, format, skema, kompresi)
+            penulis.write_batch(batch)
+            jumlah += len(baris)
+    finally:
+        cursor.close()
+        if penulis is not None:
+            penulis.close()
+    return jumlah
+
+
+def ekspor(connection, directory, format="parquet", kompresi="zstd", batch_size=UKURAN_BATCH, keterangan=None):
+    """Mengekspor semua tabel model ke directory beserta manifest.json, mengembalikan manifest
+
+    keterangan (seed, scale, argumen seeder) ikut disimpan di manifest.
+    """
+    backend = backends.aktif()
+    os.makedirs(directory, exist_ok=True)
+    tables = seeder.TABLES + (summary.TABEL_RINGKASAN if summary.ringkasan_tersedia(connection) else ())
+    manifest = {
+        "format": format,
+        "kompresi": kompresi,
+        "dibuat": datetime.now().isoformat(timespec="seconds"),
+        "backend": backend.nama,
+        **(keterangan or {}),
+        "tabel": {},
+    }
+    print(f"📦 Menyimpan snapshot {format} ke {directory}...")
+    mulai_total = time.perf_counter()
+    for table in tables:
+        mulai = time.perf_counter()
+        kolom = backend.kolom(connection, table)
+        nama_file = table + FORMAT[format]
+        path = os.path.join(directory, nama_file)
+        if os.path.exists(path):
+            os.remove(path)
+        jumlah = ekspor_tabel(connection, table, kolom, path, format, kompresi, batch_size)
+        manifest["tabel"][table] = {"file": nama_file if jumlah else None, "kolom": kolom, "baris": jumlah}
+        ukuran = os.path.getsize(path) if jumlah else 0
+        print(f"   {table}: {jumlah} baris, {ukuran / 2 ** 20:.1f} MiB ({time.perf_counter() - mulai:.2f}s)")
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, default=str)
+    total = sum(info["baris"] for info in manifest["tabel"].values())
+    print(f"✅ Snapshot {total} baris disimpan dalam {time.perf_counter() - mulai_total:.2f}s")
+    return manifest
+
+
+def baca_manifest(directory):
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def pulihkan(connection, writer, directory, batch_size=UKURAN_BATCH, dengan_ringkasan=True):
+    """Memuat snapshot di directory ke database kosong dalam urutan FK, mengembalikan jumlah baris per tabel
+
+    Tabel ringkasan hanya dimuat jika dengan_ringkasan (trigger ringkasan tidak
+    aktif) dan tabelnya ada di database tujuan. Kolom snapshot yang tidak ada di
+    tabel tujuan (misalnya InstProduk.waktu_pemesanan dari layout berpartisi)
+    dilewati; sebaliknya snapshot layout biasa ditolak oleh tujuan berpartisi.
+    """
+    backend = backends.aktif()
+    manifest = baca_manifest(directory)
+    tables = seeder.TABLES
+    if dengan_ringkasan and summary.ringkasan_tersedia(connection):
+        tables += summary.TABEL_RINGKASAN
+    hasil = {}
+    for table in tables:
+        info = manifest["tabel"].get(table)
+        if not info or not info["file"]:
+            continue
+        tujuan = set(backend.kolom(connection, table))
+        kolom = [k for k in info["kolom"] if k in tujuan]
+        if len(kolom) < len(info["kolom"]):
+            print(f"⚠ {table}: kolom {', '.join(k for k in info['kolom'] if k not in tujuan)} tidak ada di tujuan, dilewati")
+        if "waktu_pemesanan" in tujuan and "waktu_pemesanan" not in kolom:
+            # Layout berpartisi: waktu order tidak boleh jatuh ke DEFAULT kolom
+            raise Error(f"Snapshot {table} tanpa waktu_pemesanan tidak bisa dimuat ke layout berpartisi")
+        baris = (
+            row
+            for batch in _baca_batch(os.path.join(directory, info["file"]), manifest["format"], batch_size)
+            for row in zip(*(batch.column(k).to_pylist() for k in kolom))
+        )
+        hasil[table] = writer.write(table, kolom, baris)
+        writer.flush()
+    return hasil
+
+
+def database_kosong(connection):
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT COUNT(*) FROM User")
+        return cursor.fetchone()[0] == 0
+    finally:
+        cursor.close()
+
+
+def restore(args):
+    """Perintah restore: memuat snapshot ke database kosong di backend aktif"""
+    manifest = baca_manifest(args.directory)
+    mariadb = backends.aktif().nama == "mariadb"
+    bulk = mariadb and not args.insert
+    connection = seeder.create_connection(allow_local_infile=bulk)
+    if connection is None:
+        return
+    if bulk:
+        writer = LoadDataWriter(connection, tempfile.mkdtemp(prefix="bustbuy_snapshot_"), args.batch_size)
+    else:
+        writer = InsertWriter(connection, args.batch_size)
+    try:
+        if not database_kosong(connection):
+            print("❌ Database tujuan tidak kosong; restore hanya ke database yang baru dibuat dari schema")
+            return
+        print(f"🔁 Restore snapshot {args.directory} (seed {manifest.get('seed')}, scale {manifest.get('scale')}, "
+              f"dibuat {manifest['dibuat']})")
+        mulai = time.perf_counter()
+        if mariadb:
+            # Tanpa trigger dan FK checks; tabel ringkasan ikut dimuat dari snapshot
+            with JendelaPemeliharaan(connection):
+                hasil = pulihkan(connection, writer, args.directory, args.batch_size)
+            if summary.ringkasan_tersedia(connection) and not all(
+                    t in manifest["tabel"] for t in summary.TABEL_RINGKASAN):
+                seeder.bangun_ulang_ringkasan(connection)
+        else:
+            # Trigger SQLite tetap aktif dan menjaga tabel ringkasan sendiri
+            hasil = pulihkan(connection, writer, args.directory, args.batch_size, dengan_ringkasan=False)
+        writer.laporan()
+        detik = time.perf_counter() - mulai
+        total = sum(hasil.values())
+        print(f"✅ Restore {total} baris dari {len(hasil)} tabel dalam {detik:.2f}s "
+              f"({total / detik if detik else 0:,.0f} baris/detik)")
+    except Error as e:
+        connection.rollback()
+        print(f"❌ Error restore snapshot: {e}")
+    finally:
+        writer.tutup()
+        connection.close()
+
+
+def export(args):
+    """Perintah export: snapshot database yang sudah ada di backend aktif"""
+    connection = seeder.create_connection()
+    if connection is None:
+        return
+    try:
+        ekspor(connection, args.directory, args.format, args.compression, args.batch_size,
+               {"seed": args.seed, "scale": args.scale})
+    except Error as e:
+        print(f"❌ Error menyimpan snapshot: {e}")
+    finally:
+        connection.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot kolumnar dataset bustbuy (butuh pyarrow)")
+    parser.add_argument("--backend", choices=backends.BACKEND, default=None,
+                        help="Backend penyimpanan (default DB_BACKEND di .env, atau mariadb)")
+    parser.add_argument("--sqlite-path", default=None, metavar="FILE",
+                        help="File database untuk --backend sqlite (default SQLITE_PATH di .env, atau bustbuy.db)")
+    parser.add_argument("--database", default=None, metavar="NAME",
+                        help="Nama database MariaDB (default DB_NAME di .env, atau bustbuy15)")
+    parser.add_argument("--batch-size", type=int, default=UKURAN_BATCH,
+                        help="Baris per row group / record batch yang dibaca dan ditulis sekaligus")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+    simpan = sub.add_parser("export", help="Ekspor semua tabel ke DIR")
+    simpan.add_argument("directory", metavar="DIR")
+    simpan.add_argument("--format", choices=tuple(FORMAT), default="parquet",
+                        help="parquet, atau arrow (Arrow IPC yang bisa di-memory-map)")
+    simpan.add_argument("--compression", choices=KOMPRESI, default="zstd")
+    simpan.add_argument("--seed", type=int, default=None, help="Seed generator yang dicatat di manifest")
+    simpan.add_argument("--scale", type=float, default=None, help="Scale factor yang dicatat di manifest")
+    muat = sub.add_parser("restore", help="Muat snapshot dari DIR ke database kosong")
+    muat.add_argument("directory", metavar="DIR")
+    muat.add_argument("--insert", action="store_true",
+                      help="Di MariaDB pakai INSERT multi-row, bukan LOAD DATA LOCAL INFILE")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    backends.pilih(args.backend, args.sqlite_path, args.database)
+    if not pyarrow_tersedia():
+        return
+    if args.perintah == "export":
+        export(args)
+    else:
+        restore(args)
+
+
+if __name__ == "__main__":
+    main()
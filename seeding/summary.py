@@ -0,0 +1,200 @@
+import argparse
+import time
+
+from mysql.connector import Error
+
+import backends
+import seeder
+from maintenance import ambil_trigger
+from writers import chunked, insert_query
+
+# Tabel ringkasan rating per produk dan penjualan per seller per hari
+# (migrations/003_summary_tables.sql). Trigger menjaganya secara inkremental;
+# bangun_ulang menghitung ulang penuh dari Ulasan/InstProduk untuk data yang
+# dimuat tanpa trigger (bulk load di jendela pemeliharaan) atau setelah CASCADE.
+#
+# `python summary.py bench` mengukur biaya tulis trigger: order, instproduk dan
+# ulasan yang disalin dari data yang ada ditulis lalu dibatalkan, dengan dan
+# tanpa trigger ringkasan. Setiap batch di-rollback sehingga data tidak berubah.
+
+TABEL_RINGKASAN = ("RingkasanRatingProduk", "RingkasanPenjualanSeller")
+
+TRIGGER_RINGKASAN = (
+    "ulasan_ringkasan_insert", "ulasan_ringkasan_update", "ulasan_ringkasan_delete",
+    "inst_produk_ringkasan_insert", "inst_produk_ringkasan_update", "inst_produk_ringkasan_delete",
+    "orders_ringkasan_dibatalkan",
+)
+
+BANGUN_ULANG = [
+    "DELETE FROM RingkasanRatingProduk",
+    """INSERT INTO RingkasanRatingProduk (id_produk, jumlah_ulasan, total_nilai)
+    SELECT id_produk, COUNT(*), SUM(nilai) FROM Ulasan GROUP BY id_produk""",
+    "DELETE FROM RingkasanPenjualanSeller",
+    """INSERT INTO RingkasanPenjualanSeller (id_seller, tanggal, unit_terjual, omzet)
+    SELECT p.id_seller, DATE(o.waktu_pemesanan), SUM(ip.kuantitas), SUM(ip.kuantitas * v.harga)
+    FROM InstProduk ip
+    JOIN Orders o ON o.id_order = ip.id_order
+    JOIN Produk p ON p.id_produk = ip.id_produk
+    JOIN VarianProduk v ON v.sku = ip.sku AND v.id_produk = ip.id_produk
+    WHERE o.status_order <> 'dibatalkan'
+    GROUP BY p.id_seller, DATE(o.waktu_pemesanan)""",
+]
+
+ORDER_COLUMNS = ("id_order", "id_user", "id_alamat", "status_order", "metode_pembayaran",
+                 "metode_pengiriman", "waktu_pemesanan", "catatan")
+
+
+def ringkasan_tersedia(connection):
+    """True jika tabel ringkasan (migrations/003) ada di database aktif"""
+    return backends.aktif().jumlah_tabel(connection, TABEL_RINGKASAN) == len(TABEL_RINGKASAN)
+
+
+def bangun_ulang(connection):
+    """Menghitung ulang kedua tabel ringkasan dalam satu transaksi, mengembalikan jumlah baris per tabel"""
+    cursor = connection.cursor()
+    try:
+        for statement in BANGUN_ULANG:
+            cursor.execute(statement)
+        connection.commit()
+        hasil = {}
+        for table in TABEL_RINGKASAN:
+            cursor.execute(f"SELECT COUNT(*) FROM `{table}`")
+            hasil[table] = cursor.fetchone()[0]
+        return hasil
+    except Error:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def ambil_sampel_order(connection, jumlah):
+    """Mengambil sampai jumlah order yang ada beserta instproduk dan ulasannya sebagai templat"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SELECT {', '.join(ORDER_COLUMNS)} FROM Orders ORDER BY id_order LIMIT %s", (jumlah,))
+        orders = cursor.fetchall()
+        if not orders:
+            return [], [], []
+        batas = orders[-1][0]
+        cursor.execute(
+            "SELECT id_order, id_produk, sku, kuantitas FROM InstProduk WHERE id_order <= %s", (batas,)
+        )
+        inst_produk = cursor.fetchall()
+        cursor.execute(
+            "SELECT id_order, id_produk, nilai, komentar FROM Ulasan WHERE id_order <= %s", (batas,)
+        )
+        ulasan = cursor.fetchall()
+        return orders, inst_produk, ulasan
+    finally:
+        cursor.close()
+
+
+def ukur(connection, sampel, awal_id, batch_size, berpartisi=False):
+    """Menulis salinan sampel dengan id order baru lalu membatalkannya, per batch dengan rollback
+
+    berpartisi=True (layout partitioning.py) menyalin waktu_pemesanan order induk ke
+    InstProduk dan Ulasan. Mengembalikan (detik insert, detik pembatalan).
+    """
+    orders, inst_produk, ulasan = sampel
+    geser = awal_id - orders[0][0]
+    waktu = {o[0] + geser: o[ORDER_COLUMNS.index("waktu_pemesanan")] for o in orders}
+    # Order salinan berstatus 'disiapkan' agar bisa dibatalkan (check_status_order_transition)
+    orders = [(o[0] + geser, o[1], o[2], "disiapkan") + tuple(o[4:]) for o in orders]
+    anak = {}
+    for i, rows in enumerate((inst_produk, ulasan)):
+        for row in rows:
+            id_order = row[0] + geser
+            baru = (id_order,) + tuple(row[1:]) + ((waktu[id_order],) if berpartisi else ())
+            anak.setdefault(id_order, ([], []))[i].append(baru)
+
+    tambahan = ("waktu_pemesanan",) if berpartisi else ()
+    query_order = insert_query("Orders", ORDER_COLUMNS)
+    query_inst = insert_query("InstProduk", ("id_order", "id_produk", "sku", "kuantitas") + tambahan)
+    query_ulasan = insert_query("Ulasan", ("id_order", "id_produk", "nilai", "komentar") + tambahan)
+    waktu_insert = waktu_batal = 0.0
+    cursor = connection.cursor()
+    try:
+        for batch in chunked(orders, batch_size):
+            baris_inst = [r for o in batch for r in anak.get(o[0], ([], []))[0]]
+            baris_ulasan = [r for o in batch for r in anak.get(o[0], ([], []))[1]]
+            mulai = time.perf_counter()
+            cursor.executemany(query_order, batch)
+            if baris_inst:
+                cursor.executemany(query_inst, baris_inst)
+            if baris_ulasan:
+                cursor.executemany(query_ulasan, baris_ulasan)
+            waktu_insert += time.perf_counter() - mulai
+            mulai = time.perf_counter()
+            cursor.execute(
+                "UPDATE Orders SET status_order = 'dibatalkan' WHERE id_order BETWEEN %s AND %s",
+                (batch[0][0], batch[-1][0])
+            )
+            waktu_batal += time.perf_counter() - mulai
+            connection.rollback()
+    finally:
+        cursor.close()
+    return waktu_insert, waktu_batal
+
+
+def bench(connection, jumlah, batch_size):
+    """Membandingkan biaya tulis dengan dan tanpa trigger ringkasan"""
+    sampel = ambil_sampel_order(connection, jumlah)
+    if not sampel[0]:
+        print("⚠ Tidak ada order untuk dijadikan sampel, seed database terlebih dahulu")
+        return
+    baris = sum(len(s) for s in sampel)
+    awal_id = seeder.reserve_ids(connection, "Orders", "id_order", len(sampel[0]))
+    trigger = [(nama, statement) for nama, statement in ambil_trigger(connection) if nama in TRIGGER_RINGKASAN]
+    berpartisi = seeder.layout_berpartisi(connection)
+
+    hasil = {"dengan_trigger": ukur(connection, sampel, awal_id, batch_size, berpartisi)}
+    cursor = connection.cursor()
+    try:
+        for nama, _ in trigger:
+            cursor.execute(f"DROP TRIGGER IF EXISTS `{nama}`")
+        hasil["tanpa_trigger"] = ukur(connection, sampel, awal_id, batch_size, berpartisi)
+    finally:
+        for _, statement in trigger:
+            cursor.execute(statement)
+        cursor.close()
+
+    print(f"\n📊 {len(sampel[0])} order ({baris} baris), {len(trigger)} trigger ringkasan:")
+    for label, (insert, batal) in hasil.items():
+        print(f"   {label.replace('_', ' ')}: insert {insert:.2f}s ({baris / insert:,.0f} baris/detik), "
+              f"pembatalan {batal:.2f}s")
+    insert_dengan, batal_dengan = hasil["dengan_trigger"]
+    insert_tanpa, batal_tanpa = hasil["tanpa_trigger"]
+    print(f"   overhead trigger: insert {(insert_dengan / insert_tanpa - 1) * 100:+.0f}%, "
+          f"pembatalan {(batal_dengan / batal_tanpa - 1) * 100:+.0f}%")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tabel ringkasan rating dan penjualan")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+    sub.add_parser("rebuild", help="Bangun ulang penuh tabel ringkasan")
+    benchmark = sub.add_parser("bench", help="Ukur overhead tulis trigger ringkasan")
+    benchmark.add_argument("--orders", type=int, default=2000, help="Jumlah order sampel yang disalin")
+    benchmark.add_argument("--batch-size", type=int, default=seeder.BATCH_SIZE, help="Jumlah order per batch")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    connection = seeder.create_connection()
+    if connection is None:
+        return
+    try:
+        if args.perintah == "rebuild":
+            hasil = bangun_ulang(connection)
+            print("✅ Tabel ringkasan dibangun ulang: " + ", ".join(f"{t} {n} baris" for t, n in hasil.items()))
+        else:
+            bench(connection, args.orders, args.batch_size)
+    except Error as e:
+        print(f"❌ Error: {e}")
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import random
+from datetime import timedelta
+
+from samplers import AliasSampler
+
+# Waktu pemesanan untuk histori order beberapa tahun. Bobot setiap hari adalah
+# tren pertumbuhan x musim bulanan x pola hari dalam minggu x hari belanja khusus,
+# lalu jam dipilih dari kurva volume harian. Keduanya memakai sampler alias
+# sehingga satu waktu diambil dalam O(1).
+
+# Januari..Desember: sepi setelah akhir tahun, ramai menjelang akhir tahun (Harbolnas)
+MUSIM_BULAN = [0.85, 0.8, 0.9, 0.95, 1.0, 0.95, 1.0, 1.0, 1.05, 1.1, 1.35, 1.5]
+
+# Senin..Minggu
+POLA_HARI = [0.95, 0.95, 0.95, 1.0, 1.1, 1.2, 1.15]
+
+# Volume per jam 00..23: sepi dini hari, naik siang, puncak malam hari
+KURVA_JAM = [
+    0.3, 0.2, 0.15, 0.1, 0.1, 0.2, 0.4, 0.7, 0.9, 1.0, 1.1, 1.2,
+    1.4, 1.2, 1.1, 1.1, 1.2, 1.3, 1.5, 1.8, 2.0, 2.0, 1.6, 0.9,
+]
+
+# Tanggal kembar (1.1, 2.2, ..., 12.12) adalah hari promo besar
+PENGALI_TANGGAL_KEMBAR = 3.0
+
+# Volume order naik sekian persen per tahun
+PERTUMBUHAN_TAHUNAN = 0.3
+
+
+def bobot_hari(tanggal, tahun_lalu):
+    """Bobot volume order untuk satu tanggal, tahun_lalu = umur tanggal dalam tahun"""
+    bobot = (1 + PERTUMBUHAN_TAHUNAN) ** -tahun_lalu
+    bobot *= MUSIM_BULAN[tanggal.month - 1] * POLA_HARI[tanggal.weekday()]
+    if tanggal.day == tanggal.month:
+        bobot *= PENGALI_TANGGAL_KEMBAR
+    return bobot
+
+
+class WaktuOrderSampler:
+    """Sampler waktu_pemesanan dalam tahun terakhir sebelum waktu_acuan (eksklusif)"""
+
+    __slots__ = ("awal", "hari", "jam")
+
+    def __init__(self, waktu_acuan, tahun):
+        jumlah_hari = max(1, int(tahun * 365.25))
+        self.awal = waktu_acuan - timedelta(days=jumlah_hari)
+        self.hari = AliasSampler([
+            bobot_hari((self.awal + timedelta(days=k)).date(), (jumlah_hari - k) / 365.25)
+            for k in range(jumlah_hari)
+        ])
+        self.jam = AliasSampler(KURVA_JAM)
+
+    def ambil(self):
+        return self.awal + timedelta(days=self.hari.ambil(), hours=self.jam.ambil(),
+                                     seconds=int(random.random() * 3600))
@@ -0,0 +1,263 @@
+import argparse
+import json
+import os
+import random
+import re
+import shlex
+import time
+
+from mysql.connector import Error
+
+import seeder
+import summary
+from metrics import persentil
+
+# Runner workload baca: untuk setiap scale factor, database dikosongkan dan diisi
+# ulang dengan seeder.py, lalu setiap query di workload.sql dijalankan tanpa dan
+# dengan index pack (migrations/002_index_pack.sql). Latensi p50/p95/p99 dan
+# EXPLAIN setiap query dicetak dan disimpan sebagai laporan JSON. Query yang gagal
+# (misalnya query tabel ringkasan di database tanpa migrations/003) dicatat error-nya
+# di laporan tanpa menghentikan query lain, dan index pack dikembalikan ke keadaan
+# semula setelah setiap scale.
+
+DIREKTORI = os.path.dirname(os.path.abspath(__file__))
+WORKLOAD = os.path.join(DIREKTORI, "workload.sql")
+INDEX_PACK = os.path.join(DIREKTORI, os.pardir, "migrations", "002_index_pack.sql")
+
+
+def baca_workload(path=WORKLOAD):
+    """Membaca workload.sql, mengembalikan (dict param -> query sampel, dict nama -> query)"""
+    params = {}
+    queries = {}
+    nama = None
+    baris_query = []
+    with open(path, encoding="utf-8") as f:
+        for baris in f:
+            baris = baris.rstrip()
+            param = re.match(r"--\s*@param\s+(\w+):\s*(.+)", baris)
+            query = re.match(r"--\s*@query\s+(\w+)", baris)
+            if param:
+                params[param.group(1)] = param.group(2)
+            elif query:
+                nama = query.group(1)
+                baris_query = []
+            elif nama and baris and not baris.startswith("--"):
+                baris_query.append(baris)
+                if baris.endswith(";"):
+                    queries[nama] = "\n".join(baris_query).rstrip(";")
+                    nama = None
+    return params, queries
+
+
+def baca_index_pack(path=INDEX_PACK):
+    """Mengembalikan [(nama index, tabel, statement CREATE INDEX)] dari index pack"""
+    with open(path, encoding="utf-8") as f:
+        teks = "\n".join(b for b in f.read().splitlines() if not b.lstrip().startswith("--"))
+    hasil = []
+    for statement in teks.split(";"):
+        cocok = re.search(r"CREATE\s+INDEX\s+(\w+)\s+ON\s+(\w+)", statement, re.IGNORECASE)
+        if cocok:
+            hasil.append((cocok.group(1), cocok.group(2), statement.strip()))
+    return hasil
+
+
+def atur_index_pack(connection, aktif):
+    """Membuat (aktif=True) atau men-drop semua index di index pack"""
+    cursor = connection.cursor()
+    try:
+        for nama, table, statement in baca_index_pack():
+            cursor.execute(f"DROP INDEX IF EXISTS `{nama}` ON `{table}`")
+            if aktif:
+                cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+def index_pack_terpasang(connection):
+    """Nama index dari index pack yang saat ini ada di database"""
+    nama = [nama for nama, _, _ in baca_index_pack()]
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            f"""SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND INDEX_NAME IN ({", ".join(["%s"] * len(nama))})""",
+            nama
+        )
+        return {row[0] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def pulihkan_index_pack(connection, terpasang):
+    """Mengembalikan index pack ke keadaan semula: hanya index di terpasang yang ada"""
+    cursor = connection.cursor()
+    try:
+        for nama, table, statement in baca_index_pack():
+            cursor.execute(f"DROP INDEX IF EXISTS `{nama}` ON `{table}`")
+            if nama in terpasang:
+                cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+def kosongkan_database(connection):
+    """Mengosongkan semua tabel seeder dan tabel ringkasan (anak sebelum induk), me-reset AUTO_INCREMENT"""
+    cursor = connection.cursor()
+    try:
+        tables = seeder.TABLES + (summary.TABEL_RINGKASAN if summary.ringkasan_tersedia(connection) else ())
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for table in reversed(tables):
+            cursor.execute(f"TRUNCATE TABLE `{table}`")
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+    finally:
+        cursor.close()
+
+
+def sampel_param(connection, params):
+    """Mengambil kandidat nilai untuk setiap parameter workload
+
+    Parameter yang query sampelnya gagal mendapat kandidat kosong, sehingga query
+    yang memakainya dilewati.
+    """
+    cursor = connection.cursor()
+    try:
+        hasil = {}
+        for nama, query in params.items():
+            try:
+                cursor.execute(query)
+                hasil[nama] = [row[0] for row in cursor.fetchall()]
+            except Error as e:
+                connection.rollback()
+                hasil[nama] = []
+                print(f"⚠ Parameter {nama} tidak bisa diambil: {e}")
+        return hasil
+    finally:
+        cursor.close()
+
+
+def explain(connection, query, args):
+    """EXPLAIN query sebagai list dict per baris plan"""
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(f"EXPLAIN {query}", args)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def jalankan_query(connection, query, kandidat, ulang):
+    """Menjalankan query ulang kali dengan parameter acak, mengembalikan ringkasan latensi (ms) dan plan"""
+    dipakai = re.findall(r"%\((\w+)\)s", query)
+
+    def buat_args():
+        return {nama: random.choice(kandidat[nama]) for nama in dipakai}
+
+    if any(not kandidat[nama] for nama in dipakai):
+        return None
+
+    cursor = connection.cursor()
+    try:
+        # Pemanasan agar buffer pool dan plan cache tidak masuk pengukuran
+        cursor.execute(query, buat_args())
+        cursor.fetchall()
+        latensi = []
+        for _ in range(ulang):
+            args = buat_args()
+            mulai = time.perf_counter()
+            cursor.execute(query, args)
+            cursor.fetchall()
+            latensi.append((time.perf_counter() - mulai) * 1000)
+    finally:
+        cursor.close()
+
+    latensi.sort()
+    return {
+        "p50_ms": persentil(latensi, 50),
+        "p95_ms": persentil(latensi, 95),
+        "p99_ms": persentil(latensi, 99),
+        "explain": explain(connection, query, buat_args()),
+    }
+
+
+def jalankan_workload(connection, queries, kandidat, ulang):
+    """Menjalankan semua query workload, mengembalikan dict nama -> ringkasan
+
+    Query yang gagal dicatat sebagai {"error": pesan} dan query berikutnya tetap dijalankan.
+    """
+    hasil = {}
+    for nama, query in queries.items():
+        try:
+            ringkasan = jalankan_query(connection, query, kandidat, ulang)
+        except Error as e:
+            connection.rollback()
+            hasil[nama] = {"error": str(e)}
+            print(f"   ❌ {nama}: {e}")
+            continue
+        hasil[nama] = ringkasan
+        if ringkasan is None:
+            print(f"   ⚠ {nama}: tidak ada data untuk parameter, dilewati")
+            continue
+        plan = ", ".join(f"{r['table']}:{r['type']}/{r['key']}" for r in ringkasan["explain"])
+        print(f"   {nama}: p50 {ringkasan['p50_ms']:.2f}ms  p95 {ringkasan['p95_ms']:.2f}ms  "
+              f"p99 {ringkasan['p99_ms']:.2f}ms  [{plan}]")
+    return hasil
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark workload baca dengan dan tanpa index pack")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0, 10.0, 100.0],
+                        help="Scale factor yang diuji; database diisi ulang untuk setiap scale")
+    parser.add_argument("--no-reseed", action="store_true",
+                        help="Pakai data yang sudah ada (hanya satu putaran, --scales diabaikan)")
+    parser.add_argument("--seeder-args", default="--seed 1",
+                        help="Argumen tambahan untuk seeder.py, misalnya \"--seed 1 --bulk-load --workers 4\"")
+    parser.add_argument("--repeat", type=int, default=200,
+                        help="Jumlah eksekusi per query per konfigurasi")
+    parser.add_argument("--output", default="workload_report.json",
+                        help="File laporan JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    params, queries = baca_workload()
+    laporan = {}
+
+    for scale in ([None] if args.no_reseed else args.scales):
+        connection = seeder.create_connection()
+        if connection is None:
+            return
+        # Hasil disimpan ke laporan sejak awal agar hasil parsial ikut tercatat jika scale ini gagal
+        hasil_scale = laporan[str(scale if scale is not None else "data_saat_ini")] = {}
+        terpasang = None
+        try:
+            terpasang = index_pack_terpasang(connection)
+            if scale is not None:
+                print(f"\n🧹 Mengosongkan database dan seeding ulang dengan scale {scale}...")
+                kosongkan_database(connection)
+                seeder.main(["--scale", str(scale)] + shlex.split(args.seeder_args))
+            kandidat = sampel_param(connection, params)
+            for aktif in (False, True):
+                label = "dengan_index_pack" if aktif else "tanpa_index_pack"
+                atur_index_pack(connection, aktif)
+                print(f"\n📈 Scale {scale if scale is not None else 'data saat ini'}, {label.replace('_', ' ')}:")
+                hasil_scale[label] = jalankan_workload(connection, queries, kandidat, args.repeat)
+        except Error as e:
+            connection.rollback()
+            hasil_scale["error"] = str(e)
+            print(f"❌ Error menjalankan workload: {e}")
+        finally:
+            try:
+                if terpasang is not None:
+                    pulihkan_index_pack(connection, terpasang)
+            except Error as e:
+                print(f"⚠ Gagal mengembalikan index pack: {e}")
+            connection.close()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(laporan, f, indent=2, default=str)
+    print(f"\n📝 Laporan disimpan di {args.output}")
+
+
+if __name__ == "__main__":
+    main()
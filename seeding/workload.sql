@@ -0,0 +1,70 @@
+-- workload.sql
+-- Query representatif untuk jalur baca utama, dijalankan oleh workload.py.
+--
+-- Format:
+--   -- @param nama: query yang mengembalikan kandidat nilai (kolom pertama)
+--   -- @query nama
+--   <SQL dengan placeholder %(nama)s, diakhiri ;>
+
+-- @param id_user: SELECT id_user FROM Orders ORDER BY RAND() LIMIT 200
+-- @param status_order: SELECT DISTINCT status_order FROM Orders
+-- @param id_produk: SELECT id_produk FROM Ulasan ORDER BY RAND() LIMIT 200
+-- @param tag: SELECT DISTINCT tag FROM InstTag
+-- @param id_seller: SELECT id_seller FROM Produk ORDER BY RAND() LIMIT 200
+
+-- @query riwayat_order_buyer
+SELECT id_order, status_order, metode_pembayaran, waktu_pemesanan
+FROM Orders
+WHERE id_user = %(id_user)s
+ORDER BY waktu_pemesanan DESC
+LIMIT 20;
+
+-- @query order_terbaru_per_status
+SELECT id_order, id_user, waktu_pemesanan
+FROM Orders
+WHERE status_order = %(status_order)s
+ORDER BY waktu_pemesanan DESC
+LIMIT 50;
+
+-- @query jumlah_order_per_status
+SELECT status_order, COUNT(*)
+FROM Orders
+GROUP BY status_order;
+
+-- @query rating_produk
+SELECT AVG(nilai), COUNT(*)
+FROM Ulasan
+WHERE id_produk = %(id_produk)s;
+
+-- @query ulasan_terbaru_produk
+SELECT id_ulasan, nilai, komentar
+FROM Ulasan
+WHERE id_produk = %(id_produk)s
+ORDER BY id_ulasan DESC
+LIMIT 20;
+
+-- @query produk_per_tag
+SELECT p.id_produk, p.nama, MIN(v.harga) AS harga_termurah
+FROM InstTag t
+JOIN Produk p ON p.id_produk = t.id_produk
+JOIN VarianProduk v ON v.id_produk = p.id_produk
+WHERE t.tag = %(tag)s
+GROUP BY p.id_produk, p.nama
+LIMIT 50;
+
+-- @query produk_per_tag_seller
+SELECT p.id_produk, p.nama
+FROM InstTag t
+JOIN Produk p ON p.id_produk = t.id_produk
+WHERE t.tag = %(tag)s AND p.id_seller = %(id_seller)s;
+
+-- @query rating_produk_ringkasan
+SELECT total_nilai / jumlah_ulasan, jumlah_ulasan
+FROM RingkasanRatingProduk
+WHERE id_produk = %(id_produk)s;
+
+-- @query penjualan_seller_30_hari
+SELECT tanggal, unit_terjual, omzet
+FROM RingkasanPenjualanSeller
+WHERE id_seller = %(id_seller)s AND tanggal >= CURDATE() - INTERVAL 30 DAY
+ORDER BY tanggal;
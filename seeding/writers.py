@@ -0,0 +1,328 @@
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+from itertools import islice
+
+from mysql.connector import Error
+
+
+def chunked(rows, size):
+    """Memecah iterator baris menjadi list berukuran maksimal size"""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def insert_query(table, columns):
+    """Membuat query INSERT untuk tabel dan kolom yang diberikan"""
+    placeholders = ", ".join(["%s"] * len(columns))
+    return f"INSERT INTO `{table}` ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+# Error yang disebabkan isi baris (duplicate key, foreign key, CHECK, SIGNAL dari
+# trigger, nilai tidak valid). Hanya error ini yang dipecah per baris; error lain
+# (koneksi putus, deadlock, lock wait) tetap dilempar.
+ERRNO_BARIS = (
+    1048,  # ER_BAD_NULL_ERROR
+    1062,  # ER_DUP_ENTRY
+    1264,  # ER_WARN_DATA_OUT_OF_RANGE
+    1292,  # ER_TRUNCATED_WRONG_VALUE
+    1366,  # ER_TRUNCATED_WRONG_VALUE_FOR_FIELD
+    1406,  # ER_DATA_TOO_LONG
+    1451, 1452,  # ER_ROW_IS_REFERENCED_2, ER_NO_REFERENCED_ROW_2
+    1644,  # ER_SIGNAL_EXCEPTION (SIGNAL SQLSTATE '45000' dari trigger)
+    3819,  # ER_CHECK_CONSTRAINT_VIOLATED (MySQL)
+    4025,  # ER_CONSTRAINT_FAILED (MariaDB)
+)
+
+
+class InsertWriter:
+    """Menulis baris dengan executemany INSERT, commit setiap batch
+
+    executemany milik mysql.connector menggabungkan satu batch menjadi satu
+    INSERT multi-row, jadi satu batch = satu round trip.
+
+    Dengan tolak=path, batch yang gagal karena isi baris (ERRNO_BARIS) di-rollback
+    lalu dibelah dua berulang kali sampai baris penyebabnya terisolasi; baris itu
+    ditulis ke file tolak (JSON per baris, beserta error server) dan sisanya tetap
+    di-commit. Batch yang bersih tetap satu executemany.
+    """
+
+    def __init__(self, connection, batch_size=1000, tolak=None):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.statistik = {}  # tabel -> [jumlah baris, detik]
+        self.tolak = tolak
+        self.ditolak = {}  # tabel -> jumlah baris yang ditolak
+        self.kunci_tolak = threading.Lock()
+
+    def _catat(self, table, rows, detik):
+        stat = self.statistik.setdefault(table, [0, 0.0])
+        stat[0] += rows
+        stat[1] += detik
+
+    def _tulis_batch(self, connection, cursor, table, query, batch):
+        """executemany + commit satu batch, mengembalikan jumlah baris yang masuk
+
+        Jika gagal karena isi baris dan tolak aktif, batch dibelah dua dan setiap
+        belahan dicoba lagi; satu baris yang tetap gagal dicatat ke file tolak.
+        """
+        try:
+            cursor.executemany(query, batch)
+            connection.commit()
+            return len(batch)
+        except Error as e:
+            connection.rollback()
+            if self.tolak is None or e.errno not in ERRNO_BARIS:
+                raise
+            if len(batch) == 1:
+                self._tolak_baris(table, batch[0], e)
+                return 0
+            tengah = len(batch) // 2
+            return (self._tulis_batch(connection, cursor, table, query, batch[:tengah])
+                    + self._tulis_batch(connection, cursor, table, query, batch[tengah:]))
+
+    def _tolak_baris(self, table, row, error):
+        baris = json.dumps({"tabel": table, "errno": error.errno, "error": error.msg, "baris": list(row)},
+                           default=str, ensure_ascii=False)
+        # Satu write() per baris dengan mode append, aman untuk beberapa thread/proses
+        with self.kunci_tolak:
+            with open(self.tolak, "a", encoding="utf-8") as f:
+                f.write(baris + "\n")
+            self.ditolak[table] = self.ditolak.get(table, 0) + 1
+
+    def write(self, table, columns, rows):
+        """Insert semua baris dari iterator, mengembalikan jumlah baris yang masuk"""
+        query = insert_query(table, columns)
+        cursor = self.connection.cursor()
+        total = 0
+        try:
+            for batch in chunked(rows, self.batch_size):
+                mulai = time.perf_counter()
+                jumlah = self._tulis_batch(self.connection, cursor, table, query, batch)
+                self._catat(table, jumlah, time.perf_counter() - mulai)
+                total += jumlah
+        finally:
+            cursor.close()
+        return total
+
+    def write_columns(self, table, kolom):
+        """Menulis satu blok kolom (dict nama kolom -> numpy array), mengembalikan jumlah baris"""
+        return self.write(table, tuple(kolom), zip(*(array.tolist() for array in kolom.values())))
+
+    def flush(self):
+        """Commit baris yang masih tertunda"""
+        self.connection.commit()
+
+    def tutup(self):
+        """Melepas sumber daya milik writer (koneksi tetap milik pemanggil)"""
+
+    def laporan(self):
+        """Mencetak jumlah baris dan baris/detik per tabel"""
+        for table, (rows, detik) in self.statistik.items():
+            kecepatan = rows / detik if detik else float("inf")
+            print(f"📊 {table}: {rows} baris dalam {detik:.2f}s ({kecepatan:,.0f} baris/detik)")
+        if self.ditolak:
+            print(f"⚠ {sum(self.ditolak.values())} baris ditolak dan dicatat di {self.tolak}: "
+                  + ", ".join(f"{table} {jumlah}" for table, jumlah in self.ditolak.items()))
+
+
+def format_tsv(value):
+    """Format satu nilai untuk LOAD DATA (FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\')"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        return (value.replace("\\", "\\\\")
+                     .replace("\t", "\\t")
+                     .replace("\n", "\\n")
+                     .replace("\r", "\\r"))
+    return str(value)
+
+
+class LoadDataWriter(InsertWriter):
+    """Menulis baris ke file TSV per tabel lalu memuatnya dengan LOAD DATA LOCAL INFILE
+
+    Baris ditampung di file sampai flush(); flush() memuat file sesuai urutan
+    tabel pertama kali ditulis, sehingga tabel induk selalu dimuat sebelum anaknya.
+    Koneksi harus dibuat dengan allow_local_infile=True.
+    """
+
+    def __init__(self, connection, directory, batch_size=1000):
+        super().__init__(connection, batch_size)
+        self.directory = directory
+        self.files = {}  # tabel -> (file, kolom, jumlah baris), urut sesuai FK
+        os.makedirs(directory, exist_ok=True)
+
+    def _file(self, table, columns):
+        if table not in self.files:
+            path = os.path.join(self.directory, f"{table}.tsv")
+            self.files[table] = [open(path, "w", encoding="utf-8", newline="\n"), tuple(columns), 0]
+        entry = self.files[table]
+        if entry[1] != tuple(columns):
+            raise ValueError(f"Kolom {table} berbeda dengan penulisan sebelumnya")
+        return entry
+
+    def write(self, table, columns, rows):
+        entry = self._file(table, columns)
+        handle = entry[0]
+        total = 0
+        for row in rows:
+            handle.write("\t".join(format_tsv(value) for value in row))
+            handle.write("\n")
+            total += 1
+        entry[2] += total
+        return total
+
+    def write_columns(self, table, kolom):
+        # Blok diformat per kolom dengan NumPy, bukan per nilai
+        from columnar import baris_tsv
+        entry = self._file(table, tuple(kolom))
+        baris = baris_tsv(kolom)
+        if baris:
+            entry[0].write("\n".join(baris))
+            entry[0].write("\n")
+        entry[2] += len(baris)
+        return len(baris)
+
+    def flush(self):
+        cursor = self.connection.cursor()
+        try:
+            for table, (handle, columns, rows) in self.files.items():
+                handle.close()
+                mulai = time.perf_counter()
+                cursor.execute(
+                    f"""LOAD DATA LOCAL INFILE %s INTO TABLE `{table}`
+                    CHARACTER SET utf8mb4
+                    FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+                    LINES TERMINATED BY '\\n'
+                    ({', '.join(columns)})""",
+                    (handle.name,)
+                )
+                self.connection.commit()
+                detik = time.perf_counter() - mulai
+                self._catat(table, rows, detik)
+                kecepatan = rows / detik if detik else float("inf")
+                print(f"📦 LOAD DATA {table}: {rows} baris ({kecepatan:,.0f} baris/detik)")
+        finally:
+            cursor.close()
+            self.files = {}
+
+
+# Karakter yang di-escape di literal string (mode SQL tanpa NO_BACKSLASH_ESCAPES)
+ESCAPE_SQL = str.maketrans({
+    "\\": "\\\\", "'": "\\'", "\n": "\\n", "\r": "\\r", "\0": "\\0", "\x1a": "\\Z",
+})
+
+
+def format_sql(value):
+    """Literal SQL MariaDB untuk satu nilai (string di-escape dengan backslash)"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime):
+        return f"'{value.isoformat(sep=' ')}'"
+    if isinstance(value, date):
+        return f"'{value.isoformat()}'"
+    return "'" + str(value).translate(ESCAPE_SQL) + "'"
+
+
+# Batas default satu statement; max_allowed_packet bawaan MariaDB 16 MiB
+MAX_PACKET = 16 * 1024 * 1024
+
+
+class DumpWriter(InsertWriter):
+    """Menulis baris sebagai INSERT multi-row ke file .sql (atau .sql.gz), tanpa koneksi database
+
+    Satu statement INSERT tidak pernah lebih besar dari max_packet byte sehingga
+    file bisa diputar ulang dengan klien mysql pada server dengan max_allowed_packet
+    tersebut. FOREIGN_KEY_CHECKS dan UNIQUE_CHECKS dimatikan di awal file dan
+    dikembalikan di akhir; tabel ditulis sesuai urutan tahap seeding (induk dulu).
+    """
+
+    def __init__(self, path, batch_size=1000, max_packet=MAX_PACKET, keterangan=None):
+        super().__init__(None, batch_size)
+        self.path = path
+        self.max_packet = max_packet
+        if path.endswith(".gz"):
+            # Level 6: hampir sekecil level 9 dengan waktu kompresi jauh lebih pendek
+            self.file = gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+        else:
+            self.file = open(path, "w", encoding="utf-8")
+        self.tangkapan = {}  # tabel -> (nama kolom, list baris) yang ikut disimpan di memori
+        if keterangan:
+            self.file.write(f"-- {keterangan}\n")
+        self.file.write(
+            "SET NAMES utf8mb4;\n"
+            "SET @OLD_FOREIGN_KEY_CHECKS = @@FOREIGN_KEY_CHECKS, FOREIGN_KEY_CHECKS = 0;\n"
+            "SET @OLD_UNIQUE_CHECKS = @@UNIQUE_CHECKS, UNIQUE_CHECKS = 0;\n\n"
+        )
+
+    def tangkap(self, table, columns):
+        """Menyimpan kolom tertentu dari baris table yang ditulis setelah ini, mengembalikan list-nya
+
+        Dipakai untuk data yang pada mode database dibaca ulang dengan SELECT.
+        """
+        hasil = []
+        self.tangkapan[table] = (tuple(columns), hasil)
+        return hasil
+
+    def statement(self, sql):
+        """Menulis satu statement SQL apa adanya"""
+        self.file.write(sql.rstrip().rstrip(";") + ";\n")
+
+    def write(self, table, columns, rows):
+        mulai = time.perf_counter()
+        kepala = f"INSERT INTO `{table}` ({', '.join(columns)}) VALUES\n"
+        # Sisa ruang untuk ",\n" pemisah dan ";\n" penutup
+        batas = self.max_packet - len(kepala.encode("utf-8")) - 3
+        tangkap = None
+        if table in self.tangkapan:
+            kolom, hasil = self.tangkapan[table]
+            indeks = [columns.index(nama) for nama in kolom]
+            tangkap = hasil
+        bagian = []
+        ukuran = 0
+        total = 0
+        for row in rows:
+            literal = "(" + ",".join(format_sql(value) for value in row) + ")"
+            panjang = len(literal.encode("utf-8")) + 2
+            if bagian and ukuran + panjang > batas:
+                self.file.write(kepala + ",\n".join(bagian) + ";\n")
+                bagian = []
+                ukuran = 0
+            bagian.append(literal)
+            ukuran += panjang
+            total += 1
+            if tangkap is not None:
+                tangkap.append(tuple(row[i] for i in indeks))
+        if bagian:
+            self.file.write(kepala + ",\n".join(bagian) + ";\n")
+        self._catat(table, total, time.perf_counter() - mulai)
+        return total
+
+    def flush(self):
+        """Tidak ada transaksi; baris sudah ada di file"""
+
+    def tutup(self):
+        if self.file.closed:
+            return
+        self.file.write(
+            "\nSET FOREIGN_KEY_CHECKS = @OLD_FOREIGN_KEY_CHECKS;\n"
+            "SET UNIQUE_CHECKS = @OLD_UNIQUE_CHECKS;\n"
+        )
+        self.file.close()